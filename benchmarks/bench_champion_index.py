@@ -0,0 +1,70 @@
+"""
+Benchmark - champion lookups through the prebuilt index vs the old linear scan.
+
+Uses a synthetic champion.json with the same shape and size as the real one
+(about 170 champions) and times the lookups one /livegame does: ten
+champion-id -> name conversions, plus a name search like /build.
+
+Usage:
+    python benchmarks/bench_champion_index.py [iterations]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.champion_catalog import ChampionCatalog  # noqa: E402
+
+
+def _fake_champion_data(count: int = 170) -> dict:
+    """Build a champion.json-shaped dictionary."""
+    data = {}
+    for i in range(1, count + 1):
+        key = f"Champion{i}"
+        data[key] = {"id": key, "key": str(i), "name": f"Champion {i}", "tags": ["Fighter"]}
+    return {"data": data}
+
+
+def _scan_name_by_id(champion_id: int, champion_data: dict) -> str:
+    """The previous riot_api.get_champion_name_by_id implementation."""
+    for champ_name, champ_info in champion_data.get("data", {}).items():
+        if int(champ_info.get("key", -1)) == champion_id:
+            return champ_info.get("name", "Unknown Champion")
+    return "Unknown Champion"
+
+
+def _scan_by_name(name: str, champion_data: dict):
+    """The previous /build lookup."""
+    for champ_key, champ_info in champion_data.get("data", {}).items():
+        if champ_info.get("name", "").lower() == name.lower():
+            return champ_info
+    return None
+
+
+def main(iterations: int):
+    """Time both approaches and print the per-game cost."""
+    champion_data = _fake_champion_data()
+    catalog = ChampionCatalog("")
+    catalog.set("bench", champion_data)
+
+    game_ids = random.Random(1).sample(range(1, 171), 10)
+
+    scan_ids = timeit.timeit(lambda: [_scan_name_by_id(i, champion_data) for i in game_ids], number=iterations)
+    index_ids = timeit.timeit(lambda: [catalog.get_name(i) for i in game_ids], number=iterations)
+    scan_name = timeit.timeit(lambda: _scan_by_name("champion 150", champion_data), number=iterations)
+    index_name = timeit.timeit(lambda: catalog.find("champion 150"), number=iterations)
+    build = timeit.timeit(lambda: catalog.set("bench", champion_data), number=100) / 100
+
+    print(f"{iterations} iterations, {len(champion_data['data'])} champions")
+    print(f"10 id lookups (one live game): scan {scan_ids / iterations * 1e6:8.2f} us | "
+          f"index {index_ids / iterations * 1e6:6.2f} us | {scan_ids / index_ids:6.1f}x")
+    print(f"1 name lookup (/build):        scan {scan_name / iterations * 1e6:8.2f} us | "
+          f"index {index_name / iterations * 1e6:6.2f} us | {scan_name / index_name:6.1f}x")
+    print(f"Index build (once per catalog version): {build * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,90 @@
+"""
+Benchmark - per-request latency with a fresh ClientSession vs the shared session.
+
+Starts a local fake HTTP server and times sequential GETs made the old way
+(a new aiohttp.ClientSession per call) and through riot_api._make_request,
+which reuses the process-wide pooled session.
+
+Usage:
+    python benchmarks/bench_http_session.py [requests]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import riot_api  # noqa: E402
+from utils.key_pool import KeyPool  # noqa: E402
+
+
+async def _handle(request: web.Request) -> web.Response:
+    """Return a small JSON body, like a league-v4 entry."""
+    return web.json_response([{"queueType": "RANKED_SOLO_5x5", "tier": "GOLD", "rank": "II"}])
+
+
+async def _start_server():
+    """Start the fake server on a free local port and return (runner, base_url)."""
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", _handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def _fresh_session_get(url: str):
+    """The pre-pooling behaviour: one ClientSession per request."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            return await response.json()
+
+
+async def _time_calls(func, url: str, count: int) -> list:
+    """Time `count` sequential calls and return the latencies in milliseconds."""
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter()
+        await func(f"{url}/lol/league/v4/entries/by-puuid/{i}")
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(label: str, latencies: list):
+    """Print mean / median / p95 for a latency sample."""
+    p95 = sorted(latencies)[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<22} mean {statistics.mean(latencies):7.3f} ms | "
+          f"median {statistics.median(latencies):7.3f} ms | p95 {p95:7.3f} ms")
+
+
+async def main(count: int):
+    """Run both variants against the same local server."""
+    runner, base_url = await _start_server()
+    try:
+        fresh = await _time_calls(_fresh_session_get, base_url, count)
+
+        # Measure the transport only, not the Riot rate limits
+        riot_api.key_pool = KeyPool(["bench"])
+        await riot_api.start_session()
+        shared = await _time_calls(lambda url: riot_api._make_request(url), base_url, count)
+        await riot_api.close_session()
+    finally:
+        await runner.cleanup()
+
+    print(f"{count} sequential GETs against {base_url}")
+    _report("new session per call", fresh)
+    _report("shared pooled session", shared)
+    speedup = statistics.mean(fresh) / statistics.mean(shared)
+    print(f"Per-request latency reduced {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 500))
@@ -0,0 +1,77 @@
+"""
+Benchmark - stdlib json vs the active codec (orjson when installed).
+
+Parses and serializes a synthetic match-v5 payload (10 participants with the
+same field count as the real response), or any JSON files passed on the
+command line, e.g. recorded match and tracked_users.json documents.
+
+Usage:
+    python benchmarks/bench_json_codec.py [iterations] [file.json ...]
+"""
+
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import json_codec  # noqa: E402
+
+
+def _fake_match(seed: int = 1) -> dict:
+    """Build a match-v5-shaped dictionary (about 60 KB of JSON)."""
+    rng = random.Random(seed)
+    participants = []
+    for i in range(10):
+        participant = {
+            "puuid": "".join(rng.choice("abcdef0123456789") for _ in range(78)),
+            "riotIdGameName": f"Player{i}",
+            "riotIdTagline": "EUNE",
+            "championId": rng.randint(1, 900),
+            "teamId": 100 if i < 5 else 200,
+            "win": i < 5,
+            "kills": rng.randint(0, 20),
+            "deaths": rng.randint(0, 15),
+            "assists": rng.randint(0, 30),
+            "challenges": {f"challenge{j}": rng.random() * 100 for j in range(120)},
+            "perks": {"styles": [{"selections": [{"perk": rng.randint(8000, 9000)} for _ in range(4)]}]},
+        }
+        participant.update({f"stat{j}": rng.randint(0, 100000) for j in range(100)})
+        participants.append(participant)
+    return {
+        "metadata": {"matchId": "EUN1_1234567890", "participants": [p["puuid"] for p in participants]},
+        "info": {"gameDuration": 1800, "queueId": 420, "participants": participants},
+    }
+
+
+def _bench(name: str, document: bytes, iterations: int):
+    """Time parse and serialize of one document with both codecs."""
+    value = json.loads(document)
+
+    std_load = timeit.timeit(lambda: json.loads(document), number=iterations)
+    codec_load = timeit.timeit(lambda: json_codec.loads(document), number=iterations)
+    std_dump = timeit.timeit(lambda: json.dumps(value).encode("utf-8"), number=iterations)
+    codec_dump = timeit.timeit(lambda: json_codec.dumps(value), number=iterations)
+
+    print(f"{name} ({len(document) / 1024:.1f} KB)")
+    print(f"  parse:     json {std_load / iterations * 1e6:8.1f} us | "
+          f"{json_codec.NAME} {codec_load / iterations * 1e6:8.1f} us | {std_load / codec_load:5.1f}x")
+    print(f"  serialize: json {std_dump / iterations * 1e6:8.1f} us | "
+          f"{json_codec.NAME} {codec_dump / iterations * 1e6:8.1f} us | {std_dump / codec_dump:5.1f}x")
+
+
+def main(iterations: int, paths: list):
+    """Benchmark the synthetic match and any given files."""
+    print(f"Codec in use: {json_codec.NAME}, {iterations} iterations")
+    _bench("synthetic match-v5", json.dumps(_fake_match()).encode("utf-8"), iterations)
+    for path in paths:
+        with open(path, "rb") as f:
+            _bench(os.path.basename(path), f.read(), iterations)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    count = int(args.pop(0)) if args and args[0].isdigit() else 1000
+    main(count, args)
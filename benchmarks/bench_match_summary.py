@@ -0,0 +1,67 @@
+"""
+Benchmark - memory and lookup cost of raw match-v5 dicts vs MatchSummary.
+
+Builds the synthetic match-v5 payload from bench_json_codec, keeps N copies
+in memory both ways (as the caches would), and times the per-match work the
+tracker does: finding the tracked player and listing their teammates.
+
+Usage:
+    python benchmarks/bench_match_summary.py [matches]
+"""
+
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_json_codec import _fake_match  # noqa: E402
+from utils.match_summary import MatchSummary  # noqa: E402
+
+
+def _measure(build) -> int:
+    """Bytes allocated (and still alive) by build()."""
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def _scan(match_data: dict, puuid: str):
+    """The previous lookups: two linear scans of info.participants."""
+    player = None
+    for p in match_data["info"]["participants"]:
+        if p["puuid"] == puuid:
+            player = p
+            break
+    return [p for p in match_data["info"]["participants"]
+            if p["teamId"] == player["teamId"] and p["puuid"] != puuid]
+
+
+def main(count: int):
+    """Compare memory per cached match and lookup time."""
+    document = json.dumps(_fake_match())
+    raw_bytes = _measure(lambda: [json.loads(document) for _ in range(count)])
+    summary_bytes = _measure(lambda: [MatchSummary.from_json(json.loads(document)) for _ in range(count)])
+
+    match_data = json.loads(document)
+    summary = MatchSummary.from_json(match_data)
+    puuid = match_data["info"]["participants"][7]["puuid"]
+    iterations = 100000
+    scan = timeit.timeit(lambda: _scan(match_data, puuid), number=iterations)
+    indexed = timeit.timeit(lambda: (summary.participant(puuid), summary.teammates(puuid)), number=iterations)
+
+    print(f"{count} matches in memory")
+    print(f"  raw dict:     {raw_bytes / count / 1024:8.1f} KB per match")
+    print(f"  MatchSummary: {summary_bytes / count / 1024:8.1f} KB per match | "
+          f"{raw_bytes / summary_bytes:5.1f}x smaller")
+    print(f"Player + teammates lookup: scan {scan / iterations * 1e6:.2f} us | "
+          f"indexed {indexed / iterations * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
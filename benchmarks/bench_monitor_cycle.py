@@ -0,0 +1,315 @@
+"""
+Benchmark - one monitor_players cycle at 10 / 100 / 1,000 / 10,000 tracked players.
+
+Runs commands.track.monitor_players against a fake Discord client and an
+in-process stub of the riot_api functions the tracker uses, backed by the
+synthetic players of fake_riot_server (no HTTP, no key). Tracking data is
+written as the old tracked_users.json and migrated into a SQLite database
+in a temporary directory (not timed); the tracking store's write-behind
+changes are flushed once at the end of every timed cycle. Players start "caught up" (last match
+and live game state already known), then the simulated clock advances one
+monitor interval per cycle, so each cycle sees the usual trickle of games
+starting and finishing.
+
+For every player/guild combination it reports cycle wall time, Riot API
+calls per player, Discord messages sent, bytes of row data written and peak traced
+memory. Results can be written as JSON and compared against a previous run:
+
+    python benchmarks/bench_monitor_cycle.py --output baseline.json
+    python benchmarks/bench_monitor_cycle.py --baseline baseline.json
+
+The comparison exits with status 1 if any metric regressed by more than
+--tolerance. --riot-latency-ms / --discord-latency-ms add a fixed delay to
+every stubbed call, to see when a cycle overruns its 2 minute interval.
+
+Usage:
+    python benchmarks/bench_monitor_cycle.py [--players 10,100,1000,10000] [--guilds 1,10]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import riot_api  # noqa: E402
+from commands import track  # noqa: E402
+from fake_riot_server import SyntheticWorld  # noqa: E402
+from utils import json_codec, tracking_store  # noqa: E402
+from utils.champion_catalog import ChampionCatalog  # noqa: E402
+from utils.match_summary import MatchSummary  # noqa: E402
+from utils.tracking_store import TrackingStore  # noqa: E402
+
+MONITOR_INTERVAL = 120
+
+# Metrics compared against a baseline (all "lower is better")
+COMPARED_METRICS = ("cycle_seconds", "api_calls_per_player", "discord_sends", "bytes_persisted", "peak_memory_bytes")
+
+# Cycle time differences below this are timer noise, not regressions (seconds)
+MIN_TIME_REGRESSION = 0.005
+
+
+class FakeThread:
+    """Discord thread that counts the messages sent to it."""
+
+    def __init__(self, thread_id: int, counters: Dict[str, int], latency: float):
+        self.id = thread_id
+        self._counters = counters
+        self._latency = latency
+
+    async def send(self, content=None, embed=None):
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        self._counters["discord_sends"] += 1
+
+
+class FakeGuild:
+    """Discord guild holding the tracking threads."""
+
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.name = f"Guild {guild_id}"
+        self.threads: Dict[int, FakeThread] = {}
+
+    def get_thread(self, thread_id: int):
+        return self.threads.get(thread_id)
+
+    async def fetch_channel(self, thread_id: int):
+        raise LookupError(thread_id)
+
+
+class FakeBot:
+    """Just enough of commands.Bot for monitor_players."""
+
+    def __init__(self):
+        self.guilds: Dict[int, FakeGuild] = {}
+
+    def get_guild(self, guild_id: int):
+        return self.guilds.get(guild_id)
+
+
+class StubRiot:
+    """
+    Replaces the riot_api calls made by the tracker with answers from a
+    SyntheticWorld at a simulated time, counting calls per endpoint.
+    """
+
+    def __init__(self, world: SyntheticWorld, latency: float):
+        self.world = world
+        self.latency = latency
+        self.now = time.time()
+        self.calls: Dict[str, int] = {}
+        self.catalog = ChampionCatalog("")
+        self.catalog.set("bench", world.champion_json("bench"))
+
+    async def _call(self, endpoint: str):
+        self.calls[endpoint] = self.calls.get(endpoint, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def get_active_game(self, puuid: str, region: str, use_cache: bool = True, deadline=None):
+        await self._call("spectator-v5.active-game")
+        return self.world.active_game(self.world.player_index(puuid), self.now)
+
+    async def get_match_history(self, puuid: str, region: str, count: int = 5, use_cache: bool = True,
+                                deadline=None):
+        await self._call("match-v5.ids-by-puuid")
+        index = self.world.player_index(puuid)
+        newest = self.world.finished_games(index, self.now) - 1
+        return [self.world.match_id(index, game) for game in range(newest, max(newest - count, -1), -1)]
+
+    async def get_match_summary(self, match_id: str, region: str, deadline=None):
+        await self._call("match-v5.match")
+        return MatchSummary.from_json(self.world.match(match_id, self.now))
+
+    async def get_summoner_rank(self, puuid: str, region: str, use_cache: bool = True, deadline=None):
+        await self._call("league-v4.entries-by-puuid")
+        return self.world.league_entries(self.world.player_index(puuid), self.now)
+
+    def get_champion_catalog(self):
+        return self.catalog
+
+    def install(self):
+        """Patch riot_api so commands.track calls this stub."""
+        for name in ("get_active_game", "get_match_history", "get_match_summary",
+                     "get_summoner_rank", "get_champion_catalog"):
+            setattr(riot_api, name, getattr(self, name))
+
+
+def _build_tracking_data(world: SyntheticWorld, stub: StubRiot, bot: FakeBot, players: int, guilds: int,
+                         counters: Dict[str, int], discord_latency: float) -> Dict[str, Any]:
+    """Spread the players over the guilds, caught up with their current state."""
+    data = {"guilds": {}}
+    for guild_number in range(guilds):
+        guild_id = 1000 + guild_number
+        bot.guilds[guild_id] = FakeGuild(guild_id)
+        data["guilds"][str(guild_id)] = {"tracking_channel_id": 1, "tracked_players": []}
+
+    for index in range(players):
+        guild_id = 1000 + index % guilds
+        thread_id = 10_000_000 + index
+        bot.guilds[guild_id].threads[thread_id] = FakeThread(thread_id, counters, discord_latency)
+
+        finished = world.finished_games(index, stub.now)
+        data["guilds"][str(guild_id)]["tracked_players"].append({
+            "game_name": world.game_name(index),
+            "tag_line": "FAKE",
+            "puuid": world.puuid(index),
+            "region": world.platform(index),
+            "thread_id": thread_id,
+            "tracked_by": 1,
+            "guild_id": guild_id,
+            "last_match_id": world.match_id(index, finished - 1) if finished else None,
+            "is_in_game": world.current_game(index, stub.now) is not None,
+            "duo_partners": {},
+        })
+    return data
+
+
+async def _run_cycles(players: int, guilds: int, args: argparse.Namespace, data_dir: str) -> Dict[str, Any]:
+    """Benchmark one player/guild combination."""
+    world = SyntheticWorld(players, args.platforms.split(","), seed=args.seed,
+                           game_length=args.game_length, idle_length=args.idle_length)
+    stub = StubRiot(world, args.riot_latency_ms / 1000)
+    stub.install()
+
+    counters = {"discord_sends": 0}
+    bot = FakeBot()
+    data = _build_tracking_data(world, stub, bot, players, guilds, counters, args.discord_latency_ms / 1000)
+
+    # Only the explicit per-cycle flush writes (the debounce delay never runs out)
+    name = f"tracked_{players}_{guilds}"
+    store = TrackingStore(os.path.join(data_dir, f"{name}.sqlite3"), os.path.join(data_dir, f"{name}.json"),
+                          MONITOR_INTERVAL * 100)
+    with open(store.legacy_json_path, "wb") as f:
+        f.write(json_codec.dumps(data))
+    with contextlib.redirect_stdout(io.StringIO()):
+        store.load()
+    original_store = tracking_store.store
+    tracking_store.store = store
+
+    cycle_times: List[float] = []
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for cycle in range(args.cycles + 1):
+                stub.now += MONITOR_INTERVAL
+                traced = cycle == args.cycles
+                if traced:
+                    # Extra cycle under tracemalloc for peak memory (not timed: tracing is slow)
+                    tracemalloc.start()
+                start = time.perf_counter()
+                await track.monitor_players(bot)
+                await store.flush()
+                elapsed = time.perf_counter() - start
+                if traced:
+                    _, peak = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+                else:
+                    cycle_times.append(elapsed)
+    finally:
+        await store.close()
+        tracking_store.store = original_store
+
+    measured_cycles = args.cycles + 1
+    api_calls = sum(stub.calls.values())
+    cycle_seconds = sum(cycle_times) / len(cycle_times)
+    return {
+        "players": players,
+        "guilds": guilds,
+        "cycles": measured_cycles,
+        "cycle_seconds": round(cycle_seconds, 6),
+        "cycle_seconds_max": round(max(cycle_times), 6),
+        "overruns_interval": max(cycle_times) > MONITOR_INTERVAL,
+        "api_calls_per_player": round(api_calls / players / measured_cycles, 4),
+        "api_calls_by_endpoint": {k: round(v / measured_cycles, 2) for k, v in sorted(stub.calls.items())},
+        "discord_sends": round(counters["discord_sends"] / measured_cycles, 2),
+        "bytes_persisted": store.bytes_written // measured_cycles,
+        "writes": store.flushes // measured_cycles,
+        "peak_memory_bytes": peak,
+    }
+
+
+def _compare(results: List[Dict[str, Any]], baseline_path: str, tolerance: float) -> List[str]:
+    """List the metrics that got worse than the baseline by more than `tolerance`."""
+    with open(baseline_path, "rb") as f:
+        baseline = {(r["players"], r["guilds"]): r for r in json_codec.loads(f.read())["results"]}
+
+    regressions = []
+    for result in results:
+        old = baseline.get((result["players"], result["guilds"]))
+        if old is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric == "cycle_seconds" and result[metric] - old[metric] < MIN_TIME_REGRESSION:
+                continue
+            if old[metric] and result[metric] > old[metric] * (1 + tolerance):
+                regressions.append(f"{result['players']} players / {result['guilds']} guilds: "
+                                   f"{metric} {old[metric]} -> {result[metric]}")
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run every combination, print a table and optionally save/compare JSON."""
+    results = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        print(f"{'players':>8} {'guilds':>6} | {'cycle':>10} {'max':>10} | {'calls/pl':>8} | "
+              f"{'sends':>7} | {'KB written':>10} | {'peak MB':>8}")
+        for players in [int(p) for p in args.players.split(",")]:
+            for guilds in [int(g) for g in args.guilds.split(",")]:
+                if guilds > players:
+                    continue
+                result = await _run_cycles(players, guilds, args, data_dir)
+                results.append(result)
+                print(f"{players:>8} {guilds:>6} | {result['cycle_seconds'] * 1000:8.1f}ms "
+                      f"{result['cycle_seconds_max'] * 1000:8.1f}ms | {result['api_calls_per_player']:8.2f} | "
+                      f"{result['discord_sends']:7.1f} | {result['bytes_persisted'] / 1024:10.1f} | "
+                      f"{result['peak_memory_bytes'] / 1024 / 1024:8.1f}"
+                      f"{'  OVERRUNS INTERVAL' if result['overruns_interval'] else ''}")
+
+    report = {
+        "benchmark": "monitor_cycle",
+        "riot_latency_ms": args.riot_latency_ms,
+        "discord_latency_ms": args.discord_latency_ms,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(json_codec.dumps(report))
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = _compare(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the tracker's monitor cycle")
+    parser.add_argument("--players", default="10,100,1000,10000", help="comma-separated player counts")
+    parser.add_argument("--guilds", default="1,10", help="comma-separated guild counts")
+    parser.add_argument("--cycles", type=int, default=3, help="timed cycles per combination")
+    parser.add_argument("--platforms", default="eun1,euw1,na1,kr")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--game-length", type=float, default=1800, help="average game length in seconds")
+    parser.add_argument("--idle-length", type=float, default=1200, help="average time between games in seconds")
+    parser.add_argument("--riot-latency-ms", type=float, default=0, help="delay added to every Riot call")
+    parser.add_argument("--discord-latency-ms", type=float, default=0, help="delay added to every Discord send")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against a previous --output file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed regression (0.25 = 25%%)")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(_parse_args())))
@@ -0,0 +1,746 @@
+"""
+Local fake Riot API for benchmarks and load tests.
+
+Serves every endpoint riot_api uses (account, summoner, league, match,
+mastery, spectator, rotation, clash and Data Dragon champion.json) from
+generated data, one port per routing host (see config.RIOT_ROUTING_HOSTS),
+so the bot can run without a key or live Riot servers:
+
+    python benchmarks/fake_riot_server.py --players 1000
+    FAKE_RIOT_API_PORT=8400 RIOT_API_KEY=fake python bot.py
+
+Synthetic players are named FakePlayer<N>#FAKE. Each one loops between idle
+time and games, so live games start, matches finish and LP moves over time.
+Responses carry Riot-style rate limit headers, go over the limit with a 429,
+and can be slowed down (latency distributions, per host) or broken (random
+429/5xx, full host outages). Settings can be changed while running:
+
+    POST /_fake/config  {"outage_hosts": ["sea"], "error_5xx_rate": 0.05}
+    GET  /_fake/stats   requests served per host and status
+"""
+
+import argparse
+import asyncio
+import bisect
+import math
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config  # noqa: E402
+from utils.rate_limiter import parse_rate_limit_header  # noqa: E402
+
+DEFAULT_PORT = 8400
+CHAMPION_COUNT = 170
+RANKED_SOLO_QUEUE = 420
+TIERS = ["IRON", "BRONZE", "SILVER", "GOLD", "PLATINUM", "EMERALD", "DIAMOND"]
+DIVISIONS = ["IV", "III", "II", "I"]
+
+# Per-method limits in the same format as Riot's X-Method-Rate-Limit header
+DEFAULT_METHOD_LIMITS = {
+    "account-v1.by-riot-id": "1000:60",
+    "summoner-v4.by-puuid": "1600:60",
+    "league-v4.entries-by-puuid": "100:60",
+    "match-v5.ids-by-puuid": "2000:10",
+    "match-v5.match": "2000:10",
+    "champion-mastery-v4.top": "2000:60",
+    "champion-v3.rotations": "30:10",
+    "spectator-v5.active-game": "2000:60",
+    "clash-v1.tournaments": "10:60",
+}
+
+
+class LatencyModel:
+    """Random response delay."""
+
+    DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+    def __init__(self, distribution: str = "lognormal", mean_ms: float = 40.0, spread_ms: float = 20.0):
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.distribution = distribution
+        self.mean_ms = mean_ms
+        self.spread_ms = spread_ms
+
+    def sample(self, rng: random.Random) -> float:
+        """
+        Draw one delay.
+
+        Args:
+            rng: Random source
+
+        Returns:
+            Delay in seconds (never negative)
+        """
+        mean, spread = self.mean_ms, self.spread_ms
+        if mean <= 0:
+            return 0.0
+        if self.distribution == "fixed":
+            value = mean
+        elif self.distribution == "uniform":
+            value = rng.uniform(mean - spread, mean + spread)
+        elif self.distribution == "normal":
+            value = rng.gauss(mean, spread)
+        elif self.distribution == "exponential":
+            value = rng.expovariate(1 / mean)
+        else:
+            # Log-normal with the requested mean and standard deviation (long tail, like real APIs)
+            sigma2 = math.log(1 + (spread / mean) ** 2)
+            value = rng.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        return max(value, 0.0) / 1000
+
+
+class RateLimitEmulator:
+    """Riot-style application and method limits, counted per API key and routing host."""
+
+    def __init__(self, app_limits: str, method_limits: Dict[str, str]):
+        self.app_limits = app_limits
+        self.method_limits = method_limits
+        self._app = parse_rate_limit_header(app_limits)
+        self._methods = {method: parse_rate_limit_header(limit) for method, limit in method_limits.items()}
+        self._requests: Dict[Tuple[str, str, str], List[float]] = {}
+
+    def _wait(self, key: Tuple[str, str, str], limits: List[Tuple[int, int]], now: float) -> float:
+        """Drop expired requests and return how long to wait if a limit is full (0 if not)."""
+        timestamps = self._requests.setdefault(key, [])
+        if limits:
+            longest = max(window for _, window in limits)
+            del timestamps[:bisect.bisect_right(timestamps, now - longest)]
+
+        wait = 0.0
+        for limit, window in limits:
+            start = bisect.bisect_right(timestamps, now - window)
+            count = len(timestamps) - start
+            if count >= limit:
+                wait = max(wait, timestamps[start + count - limit] + window - now)
+        return wait
+
+    def _counts(self, key: Tuple[str, str, str], limits: List[Tuple[int, int]], now: float) -> str:
+        """Return the X-...-Count header value (requests counted in each window)."""
+        timestamps = self._requests[key]
+        return ",".join(
+            f"{len(timestamps) - bisect.bisect_right(timestamps, now - window)}:{window}"
+            for _, window in limits
+        )
+
+    def check(self, token: str, host: str, method: str) -> Tuple[Dict[str, str], Optional[Tuple[str, float]]]:
+        """
+        Count a request against the key's limits on the host.
+
+        Args:
+            token: API key (X-Riot-Token)
+            host: Routing host name
+            method: Endpoint name
+
+        Returns:
+            (rate limit headers, None) if the request is allowed, or
+            (headers, (limit type, retry after seconds)) if it must get a 429
+        """
+        now = time.monotonic()
+        method_limits = self._methods.get(method, [])
+        app_key, method_key = (token, host, ""), (token, host, method)
+        app_wait = self._wait(app_key, self._app, now)
+        method_wait = self._wait(method_key, method_limits, now)
+
+        # Like Riot, the counts include this request when it is allowed (rejected ones aren't counted)
+        if app_wait <= 0 and method_wait <= 0:
+            self._requests[app_key].append(now)
+            self._requests[method_key].append(now)
+
+        headers = {"X-App-Rate-Limit": self.app_limits,
+                   "X-App-Rate-Limit-Count": self._counts(app_key, self._app, now)}
+        if method_limits:
+            headers["X-Method-Rate-Limit"] = self.method_limits[method]
+            headers["X-Method-Rate-Limit-Count"] = self._counts(method_key, method_limits, now)
+
+        if app_wait > 0:
+            return headers, ("application", app_wait)
+        if method_wait > 0:
+            return headers, ("method", method_wait)
+        return headers, None
+
+
+class SyntheticWorld:
+    """
+    Generated players, games and matches.
+
+    Player i repeats a cycle of idle time followed by one game. Match k of
+    player i has the ID "<PLATFORM>_<k * 10^7 + i>" and its contents are
+    derived from that ID, so every response is consistent without storing
+    anything. The world starts `history` games in the past so every player
+    already has a match history.
+    """
+
+    def __init__(self, players: int, platforms: List[str], seed: int = 1,
+                 game_length: float = 300.0, idle_length: float = 120.0, history: int = 20):
+        self.players = players
+        self.platforms = platforms
+        self.seed = seed
+        self.game_length = game_length
+        self.idle_length = idle_length
+        self.epoch = time.time() - history * (game_length + idle_length)
+
+    # Players
+
+    def puuid(self, index: int) -> str:
+        """The PUUID of player `index` (78 characters, like Riot's)."""
+        return f"fake-puuid-{index:08d}".ljust(78, "0")
+
+    def player_index(self, puuid: str) -> Optional[int]:
+        """Map a PUUID back to its player index, or None if it isn't a synthetic player."""
+        if not puuid.startswith("fake-puuid-"):
+            return None
+        try:
+            index = int(puuid[11:19])
+        except ValueError:
+            return None
+        return index if 0 <= index < self.players else None
+
+    def find_player(self, game_name: str, tag_line: str) -> Optional[int]:
+        """Look up a player by Riot ID (case-insensitive)."""
+        name = game_name.casefold()
+        if tag_line.casefold() != "fake" or not name.startswith("fakeplayer"):
+            return None
+        try:
+            index = int(name[10:])
+        except ValueError:
+            return None
+        return index if 0 <= index < self.players else None
+
+    def game_name(self, index: int) -> str:
+        """The in-game name of player `index`."""
+        return f"FakePlayer{index}"
+
+    def platform(self, index: int) -> str:
+        """The platform region of player `index`."""
+        return self.platforms[index % len(self.platforms)]
+
+    # Schedule
+
+    def _cycle(self, index: int) -> Tuple[float, float, float]:
+        """(offset, idle seconds, game seconds) for player `index`."""
+        rng = random.Random(self.seed * 1_000_003 + index)
+        idle = self.idle_length * rng.uniform(0.5, 1.5)
+        game = self.game_length * rng.uniform(0.7, 1.3)
+        return rng.uniform(0, idle + game), idle, game
+
+    def _game_times(self, index: int, game: int) -> Tuple[float, float]:
+        """Start and end unix time of game number `game` of player `index`."""
+        offset, idle, length = self._cycle(index)
+        start = self.epoch + offset + game * (idle + length) + idle
+        return start, start + length
+
+    def finished_games(self, index: int, now: float) -> int:
+        """How many games player `index` has finished by `now`."""
+        offset, idle, length = self._cycle(index)
+        elapsed = now - self.epoch - offset
+        if elapsed <= idle + length:
+            return 0
+        return int((elapsed - idle - length) // (idle + length)) + 1
+
+    def current_game(self, index: int, now: float) -> Optional[int]:
+        """The number of the game player `index` is playing at `now`, or None if idle."""
+        game = self.finished_games(index, now)
+        start, end = self._game_times(index, game)
+        return game if start <= now < end else None
+
+    def match_id(self, index: int, game: int) -> str:
+        """The match ID of game number `game` of player `index`."""
+        return f"{self.platform(index).upper()}_{game * 10_000_000 + index}"
+
+    def parse_match_id(self, match_id: str) -> Optional[Tuple[int, int]]:
+        """Map a match ID back to (player index, game number)."""
+        try:
+            number = int(match_id.split("_", 1)[1])
+        except (IndexError, ValueError):
+            return None
+        index, game = number % 10_000_000, number // 10_000_000
+        return (index, game) if index < self.players else None
+
+    # Generated content
+
+    def _roster(self, index: int, game: int) -> List[Tuple[int, int, int]]:
+        """
+        The 10 players of a game as (player index, champion ID, team ID).
+
+        Odd players queue with the player before them, so the tracker sees
+        a recurring duo partner.
+        """
+        rng = random.Random(f"{self.seed}:{index}:{game}")
+        others = [i for i in range(self.players) if i != index] if self.players <= 64 else []
+        chosen = {index}
+        if index % 2 == 1:
+            chosen.add(index - 1)
+        while len(chosen) < min(10, self.players):
+            chosen.add(rng.choice(others) if others else rng.randrange(self.players))
+        players = [index] + [i for i in chosen if i != index]
+        players += [-1] * (10 - len(players))  # Bots fill small worlds
+
+        champions = rng.sample(range(1, CHAMPION_COUNT + 1), 10)
+        return [(player, champions[slot], 100 if slot < 5 else 200) for slot, player in enumerate(players)]
+
+    def _participant_name(self, player: int) -> Tuple[str, str, str]:
+        """(puuid, game name, tag line) of a roster slot (-1 is a bot)."""
+        if player < 0:
+            return "BOT", "Bot", "BOT"
+        return self.puuid(player), self.game_name(player), "FAKE"
+
+    def _winning_team(self, match_id: str) -> int:
+        """The team that won a match (the tracked player is always on team 100)."""
+        return random.Random(match_id).choice([100, 200])
+
+    def match(self, match_id: str, now: float) -> Optional[Dict[str, Any]]:
+        """match-v5 details of a finished match, or None if it doesn't exist (yet)."""
+        parsed = self.parse_match_id(match_id)
+        if parsed is None:
+            return None
+        index, game = parsed
+        if game >= self.finished_games(index, now):
+            return None
+
+        start, end = self._game_times(index, game)
+        rng = random.Random(match_id)
+        winning_team = rng.choice([100, 200])  # Same first draw as _winning_team()
+        participants = []
+        for player, champion_id, team_id in self._roster(index, game):
+            puuid, game_name, tag_line = self._participant_name(player)
+            win = team_id == winning_team
+            kills = rng.randint(0, 15) + (3 if win else 0)
+            deaths = rng.randint(0, 12) + (0 if win else 2)
+            participants.append({
+                "puuid": puuid,
+                "riotIdGameName": game_name,
+                "riotIdTagline": tag_line,
+                "championId": champion_id,
+                "championName": f"Champion{champion_id}",
+                "teamId": team_id,
+                "win": win,
+                "kills": kills,
+                "deaths": deaths,
+                "assists": rng.randint(0, 25),
+                "champLevel": rng.randint(10, 18),
+                "goldEarned": rng.randint(6000, 18000),
+                "totalMinionsKilled": rng.randint(20, 300),
+                "visionScore": rng.randint(5, 80),
+                "totalDamageDealtToChampions": rng.randint(5000, 50000),
+                "item0": rng.randint(1000, 7000),
+                "item1": rng.randint(1000, 7000),
+                "item2": rng.randint(1000, 7000),
+                "challenges": {f"stat{n}": rng.random() * 100 for n in range(40)},
+            })
+
+        return {
+            "metadata": {
+                "dataVersion": "2",
+                "matchId": match_id,
+                "participants": [p["puuid"] for p in participants],
+            },
+            "info": {
+                "gameCreation": int(start * 1000) - 60000,
+                "gameStartTimestamp": int(start * 1000),
+                "gameEndTimestamp": int(end * 1000),
+                "gameDuration": int(end - start),
+                "gameMode": "CLASSIC",
+                "gameType": "MATCHED_GAME",
+                "queueId": RANKED_SOLO_QUEUE if game % 3 else 440,
+                "mapId": 11,
+                "platformId": match_id.split("_", 1)[0],
+                "participants": participants,
+                "teams": [{"teamId": 100, "win": winning_team == 100}, {"teamId": 200, "win": winning_team == 200}],
+            },
+        }
+
+    def active_game(self, index: int, now: float) -> Optional[Dict[str, Any]]:
+        """spectator-v5 active game of player `index`, or None if they aren't in a game."""
+        game = self.current_game(index, now)
+        if game is None:
+            return None
+
+        start, _ = self._game_times(index, game)
+        participants = []
+        for player, champion_id, team_id in self._roster(index, game):
+            puuid, game_name, tag_line = self._participant_name(player)
+            participants.append({
+                "puuid": puuid,
+                "riotId": f"{game_name}#{tag_line}",
+                "championId": champion_id,
+                "teamId": team_id,
+                "spell1Id": 4,
+                "spell2Id": 14,
+                "bot": player < 0,
+            })
+        return {
+            "gameId": game * 10_000_000 + index,
+            "gameMode": "CLASSIC",
+            "gameType": "MATCHED",
+            "gameQueueConfigId": RANKED_SOLO_QUEUE if game % 3 else 440,
+            "gameStartTime": int(start * 1000),
+            "gameLength": int(now - start),
+            "platformId": self.platform(index).upper(),
+            "mapId": 11,
+            "participants": participants,
+        }
+
+    def league_entries(self, index: int, now: float) -> List[Dict[str, Any]]:
+        """league-v4 entries of player `index`; LP moves with every finished ranked game."""
+        wins = losses = 0
+        puuid = self.puuid(index)
+        finished = self.finished_games(index, now)
+        # Only the most recent games matter for LP; older ones are a fixed baseline
+        for game in range(max(0, finished - 50), finished):
+            if game % 3 == 0:
+                continue
+            if self._winning_team(self.match_id(index, game)) == 100:
+                wins += 1
+            else:
+                losses += 1
+
+        rng = random.Random(self.seed * 7919 + index)
+        points = rng.randint(0, len(TIERS) * 400 - 1) + (wins - losses) * 20
+        points = min(max(points, 0), len(TIERS) * 400 - 1)
+        return [{
+            "leagueId": f"fake-league-{index % 100}",
+            "puuid": puuid,
+            "queueType": "RANKED_SOLO_5x5",
+            "tier": TIERS[points // 400],
+            "rank": DIVISIONS[(points % 400) // 100],
+            "leaguePoints": points % 100,
+            "wins": 50 + wins,
+            "losses": 50 + losses,
+            "veteran": False,
+            "inactive": False,
+            "freshBlood": False,
+            "hotStreak": False,
+        }]
+
+    def mastery(self, index: int, count: int) -> List[Dict[str, Any]]:
+        """Top champion masteries of player `index`."""
+        rng = random.Random(self.seed * 104729 + index)
+        champions = rng.sample(range(1, CHAMPION_COUNT + 1), min(count, CHAMPION_COUNT))
+        points = sorted((rng.randint(1000, 500000) for _ in champions), reverse=True)
+        return [{
+            "puuid": self.puuid(index),
+            "championId": champion_id,
+            "championLevel": min(7, 1 + champion_points // 25000),
+            "championPoints": champion_points,
+            "lastPlayTime": int(time.time() * 1000),
+        } for champion_id, champion_points in zip(champions, points)]
+
+    def rotation(self) -> Dict[str, Any]:
+        """champion-v3 free rotation."""
+        rng = random.Random(f"{self.seed}:rotation:{int(time.time() // (7 * 86400))}")
+        return {
+            "freeChampionIds": sorted(rng.sample(range(1, CHAMPION_COUNT + 1), 20)),
+            "freeChampionIdsForNewPlayers": list(range(1, 21)),
+            "maxNewPlayerLevel": 10,
+        }
+
+    def clash_tournaments(self) -> List[Dict[str, Any]]:
+        """Two upcoming Clash tournaments."""
+        now_ms = int(time.time() * 1000)
+        day = 86400 * 1000
+        return [{
+            "id": 9000 + n,
+            "themeId": 1,
+            "nameKey": f"CLASH_FAKE_CUP_{n + 1}",
+            "nameKeySecondary": "day_1",
+            "schedule": [{
+                "id": 9100 + n,
+                "registrationTime": now_ms + (n * 7 + 1) * day,
+                "startTime": now_ms + (n * 7 + 3) * day,
+                "cancelled": False,
+            }],
+        } for n in range(2)]
+
+    def champion_json(self, version: str) -> Dict[str, Any]:
+        """Data Dragon champion.json with CHAMPION_COUNT generated champions."""
+        tags = ["Fighter", "Tank", "Mage", "Assassin", "Marksman", "Support"]
+        data = {}
+        for key in range(1, CHAMPION_COUNT + 1):
+            champion_id = f"Champion{key}"
+            data[champion_id] = {
+                "version": version,
+                "id": champion_id,
+                "key": str(key),
+                "name": f"Champion {key}",
+                "title": "the Synthetic",
+                "blurb": "Generated by the fake Riot API.",
+                "tags": [tags[key % len(tags)], tags[(key * 7) % len(tags)]],
+                "partype": "Mana",
+                "image": {"full": f"{champion_id}.png"},
+            }
+        return {"type": "champion", "format": "standAloneComplex", "version": version, "data": data}
+
+
+class FakeRiotServer:
+    """aiohttp server answering as every Riot routing host and Data Dragon."""
+
+    def __init__(self, world: SyntheticWorld, port: int = DEFAULT_PORT,
+                 latency: Optional[LatencyModel] = None, host_latency: Optional[Dict[str, LatencyModel]] = None,
+                 app_limits: str = "20:1,100:120", method_limits: Optional[Dict[str, str]] = None,
+                 error_429_rate: float = 0.0, error_5xx_rate: float = 0.0,
+                 outage_hosts: Optional[List[str]] = None, seed: int = 1):
+        self.world = world
+        self.port = port
+        self.latency = latency or LatencyModel("fixed", 0)
+        self.host_latency = host_latency or {}
+        self.limits = RateLimitEmulator(app_limits, DEFAULT_METHOD_LIMITS if method_limits is None else method_limits)
+        self.error_429_rate = error_429_rate
+        self.error_5xx_rate = error_5xx_rate
+        self.outage_hosts = set(outage_hosts or [])
+        self.rng = random.Random(seed)
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._hosts_by_port = {port + i: host for i, host in enumerate(config.RIOT_ROUTING_HOSTS)}
+        self._runner: Optional[web.AppRunner] = None
+
+    @staticmethod
+    def short_name(host: str) -> str:
+        """Short host name used by the options ("eun1", "europe", "ddragon")."""
+        return host.split(".")[0]
+
+    def _route(self, request: web.Request) -> Tuple[str, str]:
+        """The routing host a request was sent to, and its endpoint name."""
+        sockname = request.transport.get_extra_info("sockname") if request.transport else None
+        host = self._hosts_by_port.get(sockname[1] if sockname else 0, "unknown")
+        return host, request.match_info.route.name or "unknown"
+
+    def _count(self, host: str, status: int):
+        """Record a response status for /_fake/stats."""
+        host_stats = self.stats.setdefault(self.short_name(host), {})
+        host_stats[str(status)] = host_stats.get(str(status), 0) + 1
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        """Apply latency, outages, injected errors and rate limits before the real handler."""
+        if request.path.startswith("/_fake/"):
+            return await handler(request)
+
+        host, endpoint = self._route(request)
+        short = self.short_name(host)
+        await asyncio.sleep(self.host_latency.get(short, self.latency).sample(self.rng))
+
+        if short in self.outage_hosts:
+            self._count(host, 503)
+            return web.json_response({"status": {"message": "Service unavailable", "status_code": 503}}, status=503)
+
+        if short == "ddragon":
+            response = await handler(request)
+            self._count(host, response.status)
+            return response
+
+        if self.rng.random() < self.error_5xx_rate:
+            status = self.rng.choice([500, 502, 503, 504])
+            self._count(host, status)
+            return web.json_response({"status": {"message": "Injected error", "status_code": status}}, status=status)
+
+        if self.rng.random() < self.error_429_rate:
+            # Riot's underlying services can 429 without any of our limits being full
+            self._count(host, 429)
+            return web.json_response({"status": {"message": "Rate limit exceeded", "status_code": 429}},
+                                     status=429, headers={"X-Rate-Limit-Type": "service"})
+
+        headers, exceeded = self.limits.check(request.headers.get("X-Riot-Token", ""), host, endpoint)
+        if exceeded:
+            limit_type, retry_after = exceeded
+            headers["X-Rate-Limit-Type"] = limit_type
+            headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+            self._count(host, 429)
+            return web.json_response({"status": {"message": "Rate limit exceeded", "status_code": 429}},
+                                     status=429, headers=headers)
+
+        response = await handler(request)
+        response.headers.update(headers)
+        self._count(host, response.status)
+        return response
+
+    @staticmethod
+    def _not_found(message: str = "Data not found") -> web.Response:
+        return web.json_response({"status": {"message": message, "status_code": 404}}, status=404)
+
+    def _player(self, request: web.Request) -> Optional[int]:
+        return self.world.player_index(request.match_info["puuid"])
+
+    async def _account(self, request: web.Request) -> web.Response:
+        index = self.world.find_player(request.match_info["game_name"], request.match_info["tag_line"])
+        if index is None:
+            return self._not_found()
+        return web.json_response({"puuid": self.world.puuid(index), "gameName": self.world.game_name(index),
+                                  "tagLine": "FAKE"})
+
+    async def _summoner(self, request: web.Request) -> web.Response:
+        index = self._player(request)
+        if index is None:
+            return self._not_found()
+        return web.json_response({"puuid": self.world.puuid(index), "profileIconId": index % 30,
+                                  "summonerLevel": 30 + index % 500, "revisionDate": int(time.time() * 1000)})
+
+    async def _league(self, request: web.Request) -> web.Response:
+        index = self._player(request)
+        if index is None:
+            return web.json_response([])
+        return web.json_response(self.world.league_entries(index, time.time()))
+
+    async def _match_ids(self, request: web.Request) -> web.Response:
+        index = self._player(request)
+        if index is None:
+            return web.json_response([])
+        start = int(request.query.get("start", 0))
+        count = min(int(request.query.get("count", 20)), 100)
+        newest = self.world.finished_games(index, time.time()) - 1 - start
+        games = range(newest, max(newest - count, -1), -1)
+        return web.json_response([self.world.match_id(index, game) for game in games])
+
+    async def _match(self, request: web.Request) -> web.Response:
+        match = self.world.match(request.match_info["match_id"], time.time())
+        if match is None:
+            return self._not_found()
+        return web.json_response(match)
+
+    async def _mastery(self, request: web.Request) -> web.Response:
+        index = self._player(request)
+        if index is None:
+            return self._not_found()
+        return web.json_response(self.world.mastery(index, int(request.query.get("count", 3))))
+
+    async def _rotation(self, request: web.Request) -> web.Response:
+        return web.json_response(self.world.rotation())
+
+    async def _active_game(self, request: web.Request) -> web.Response:
+        index = self._player(request)
+        game = self.world.active_game(index, time.time()) if index is not None else None
+        if game is None:
+            return self._not_found()
+        return web.json_response(game)
+
+    async def _clash(self, request: web.Request) -> web.Response:
+        return web.json_response(self.world.clash_tournaments())
+
+    async def _champions(self, request: web.Request) -> web.Response:
+        return web.json_response(self.world.champion_json(request.match_info["version"]))
+
+    async def _control(self, request: web.Request) -> web.Response:
+        """Change injection settings at runtime."""
+        body = await request.json()
+        if "outage_hosts" in body:
+            self.outage_hosts = set(body["outage_hosts"])
+        if "error_429_rate" in body:
+            self.error_429_rate = float(body["error_429_rate"])
+        if "error_5xx_rate" in body:
+            self.error_5xx_rate = float(body["error_5xx_rate"])
+        if "latency_ms" in body:
+            self.latency.mean_ms = float(body["latency_ms"])
+        return web.json_response(self._settings())
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"settings": self._settings(), "responses": self.stats})
+
+    def _settings(self) -> Dict[str, Any]:
+        return {
+            "outage_hosts": sorted(self.outage_hosts),
+            "error_429_rate": self.error_429_rate,
+            "error_5xx_rate": self.error_5xx_rate,
+            "latency_ms": self.latency.mean_ms,
+            "latency_distribution": self.latency.distribution,
+        }
+
+    def _build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        routes = [
+            ("account-v1.by-riot-id", "/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}", self._account),
+            ("summoner-v4.by-puuid", "/lol/summoner/v4/summoners/by-puuid/{puuid}", self._summoner),
+            ("league-v4.entries-by-puuid", "/lol/league/v4/entries/by-puuid/{puuid}", self._league),
+            ("match-v5.ids-by-puuid", "/lol/match/v5/matches/by-puuid/{puuid}/ids", self._match_ids),
+            ("match-v5.match", "/lol/match/v5/matches/{match_id}", self._match),
+            ("champion-mastery-v4.top", "/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/top",
+             self._mastery),
+            ("champion-v3.rotations", "/lol/platform/v3/champion-rotations", self._rotation),
+            ("spectator-v5.active-game", "/lol/spectator/v5/active-games/by-summoner/{puuid}", self._active_game),
+            ("clash-v1.tournaments", "/lol/clash/v1/tournaments", self._clash),
+            ("ddragon.champions", "/cdn/{version}/data/en_US/champion.json", self._champions),
+        ]
+        for name, path, handler in routes:
+            app.router.add_get(path, handler, name=name)
+        app.router.add_post("/_fake/config", self._control)
+        app.router.add_get("/_fake/stats", self._stats)
+        return app
+
+    async def start(self):
+        """Listen on one port per routing host (port, port + 1, ...)."""
+        self._runner = web.AppRunner(self._build_app(), access_log=None)
+        await self._runner.setup()
+        for port in self._hosts_by_port:
+            await web.TCPSite(self._runner, "127.0.0.1", port).start()
+
+    async def stop(self):
+        """Stop listening."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def _parse_host_latency(values: List[str], distribution: str, spread_ms: float) -> Dict[str, LatencyModel]:
+    """Parse repeated --host-latency HOST=MS options."""
+    result = {}
+    for value in values:
+        host, _, mean = value.partition("=")
+        result[host] = LatencyModel(distribution, float(mean), spread_ms)
+    return result
+
+
+async def _serve(args: argparse.Namespace):
+    """Run the server until interrupted."""
+    world = SyntheticWorld(args.players, args.platforms.split(","), args.seed, args.game_length, args.idle_length)
+    server = FakeRiotServer(
+        world,
+        port=args.port,
+        latency=LatencyModel(args.latency_dist, args.latency_ms, args.latency_spread_ms),
+        host_latency=_parse_host_latency(args.host_latency, args.latency_dist, args.latency_spread_ms),
+        app_limits=args.app_limits,
+        error_429_rate=args.error_429,
+        error_5xx_rate=args.error_5xx,
+        outage_hosts=args.outage,
+        seed=args.seed,
+    )
+    await server.start()
+    last_port = args.port + len(config.RIOT_ROUTING_HOSTS) - 1
+    print(f"[FakeRiot] {args.players} players on ports {args.port}-{last_port}")
+    print(f"[FakeRiot] Run the bot with FAKE_RIOT_API_PORT={args.port}; try /summoner FakePlayer0 FAKE")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local fake Riot API")
+    parser.add_argument("--port", type=int, default=config.FAKE_RIOT_API_PORT or DEFAULT_PORT,
+                        help="first port (one port per routing host)")
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--platforms", default=config.DEFAULT_REGION, help="comma-separated, e.g. eun1,na1,kr")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--game-length", type=float, default=300, help="average game length in seconds")
+    parser.add_argument("--idle-length", type=float, default=120, help="average time between games in seconds")
+    parser.add_argument("--latency-dist", choices=LatencyModel.DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=40)
+    parser.add_argument("--latency-spread-ms", type=float, default=20)
+    parser.add_argument("--host-latency", action="append", default=[], metavar="HOST=MS",
+                        help="mean latency for one host, e.g. sea=800")
+    parser.add_argument("--app-limits", default="20:1,100:120", help="application rate limits")
+    parser.add_argument("--error-429", type=float, default=0.0, help="fraction of requests answered with a 429")
+    parser.add_argument("--error-5xx", type=float, default=0.0, help="fraction of requests answered with a 5xx")
+    parser.add_argument("--outage", action="append", default=[], metavar="HOST",
+                        help="host that answers every request with a 503, e.g. europe")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,46 @@ Initializes the bot and auto-loads all commands from the commands folder.
 import discord
 from discord.ext import commands, tasks
 from discord import app_commands
+import asyncio
 import os
 import sys
 import importlib.util
+import time
 import config
+import riot_api
+from utils import metrics, tracking_store
+
+
+# Slash command timings, from the moment the command starts running until it returns
+# (i.e. defer -> followup for the commands that defer)
+command_latency = metrics.registry.histogram(
+    "discord_command_duration_seconds", "Slash command run time by command and outcome", ("command", "outcome")
+)
+monitor_cycle_latency = metrics.registry.histogram(
+    "monitor_cycle_duration_seconds", "Duration of one player monitoring cycle"
+)
+
+
+class TimedCommandTree(app_commands.CommandTree):
+    """Command tree that records how long every slash command takes."""
+    
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Stamp the start time before the command runs (never blocks a command)."""
+        interaction.extras["started_at"] = time.perf_counter()
+        return True
+    
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        """Record failed commands, then fall back to the default error handling."""
+        record_command_timing(interaction, "error")
+        await super().on_error(interaction, error)
+
+
+def record_command_timing(interaction: discord.Interaction, outcome: str):
+    """Observe a finished command's run time (no-op if it never started)."""
+    started_at = interaction.extras.get("started_at")
+    if started_at is None or interaction.command is None:
+        return
+    command_latency.observe(time.perf_counter() - started_at, interaction.command.qualified_name, outcome)
 
 
 class RiotBot(commands.Bot):
@@ -20,14 +56,33 @@ class RiotBot(commands.Bot):
         intents = discord.Intents.default()
         intents.message_content = True
         
-        super().__init__(command_prefix="!", intents=intents)
+        super().__init__(command_prefix="!", intents=intents, tree_cls=TimedCommandTree)
         # Note: self.tree is already created by commands.Bot, no need to create it again
+        self.metrics_runner = None
     
     async def setup_hook(self):
         """
         Setup hook called when bot is starting up.
-        This is where we load all commands.
+        This is where we open the shared HTTP session and load all commands.
         """
+        await riot_api.start_session()
+        
+        if config.METRICS_PORT:
+            try:
+                self.metrics_runner = await metrics.start_server(config.METRICS_HOST, config.METRICS_PORT)
+                print(f"✓ Metrics available at http://{config.METRICS_HOST}:{config.METRICS_PORT}/metrics")
+            except OSError as e:
+                print(f"⚠ Warning: Could not start metrics endpoint: {e}")
+        
+        # Read the stalking configuration once; changes are written back in the background
+        await asyncio.to_thread(tracking_store.store.load)
+        
+        # Load champion data once so commands can read it from memory (commands retry if this fails)
+        try:
+            await riot_api.load_champion_catalog()
+        except riot_api.RiotAPIError as e:
+            print(f"⚠ Warning: Could not load champion data yet: {e}")
+        
         print("Loading commands...")
         await self.load_commands()
         
@@ -36,6 +91,14 @@ class RiotBot(commands.Bot):
         await self.tree.sync()
         print("Commands synced successfully!")
     
+    async def close(self):
+        """Shut the bot down, save pending stalking changes and close the shared HTTP session."""
+        await super().close()
+        await tracking_store.store.close()
+        await riot_api.close_session()
+        if self.metrics_runner is not None:
+            await self.metrics_runner.cleanup()
+    
     async def load_commands(self):
         """
         Dynamically load all command files from the commands folder.
@@ -89,7 +152,9 @@ class RiotBot(commands.Bot):
         try:
             # Import here to avoid circular imports
             from commands.track import monitor_players
+            started_at = time.perf_counter()
             await monitor_players(self)
+            monitor_cycle_latency.observe(time.perf_counter() - started_at)
         except Exception as e:
             print(f"Error in monitoring task: {e}")
     
@@ -98,6 +163,10 @@ class RiotBot(commands.Bot):
         """Wait until the bot is ready before starting monitoring."""
         await self.wait_until_ready()
     
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        """Record the run time of a slash command that finished normally."""
+        record_command_timing(interaction, "ok")
+    
     async def on_command_error(self, ctx, error):
         """Handle command errors."""
         if isinstance(error, commands.CommandNotFound):
@@ -114,7 +183,7 @@ async def main():
         print("Please set your Discord token in the .env file")
         sys.exit(1)
     
-    if config.RIOT_API_KEY == "your_riot_api_key_here":
+    if "your_riot_api_key_here" in config.RIOT_API_KEYS:
         print("❌ Error: RIOT_API_KEY not configured!")
         print("Please set your Riot API key in the .env file")
         sys.exit(1)
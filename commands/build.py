@@ -6,7 +6,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import riot_api
-from utils.helpers import create_basic_embed, create_error_embed
+from utils.helpers import create_basic_embed, create_error_embed, champion_autocomplete
 
 
 async def setup(bot: commands.Bot):
@@ -16,6 +16,7 @@ async def setup(bot: commands.Bot):
     @app_commands.describe(
         champion_name="Champion name (e.g., 'Ahri', 'Lee Sin')"
     )
+    @app_commands.autocomplete(champion_name=champion_autocomplete)
     async def build(
         interaction: discord.Interaction,
         champion_name: str
@@ -30,26 +31,27 @@ async def setup(bot: commands.Bot):
         await interaction.response.defer()
         
         try:
-            # Fetch champion data to verify the champion exists
-            champion_data = await riot_api.get_champion_data()
+            # Champion data to verify the champion exists (in memory)
+            champions = riot_api.get_champion_catalog()
             
-            # Find the champion (case-insensitive search)
-            found_champion = None
-            champion_key = None
+            if not champions.loaded:
+                embed = create_error_embed("Champion data is still loading, please try again in a moment.")
+                await interaction.followup.send(embed=embed)
+                return
             
-            for champ_key, champ_info in champion_data.get("data", {}).items():
-                if champ_info.get("name", "").lower() == champion_name.lower():
-                    found_champion = champ_info.get("name")
-                    champion_key = champ_key
-                    break
+            # Find the champion (ignores case, spaces and punctuation)
+            champ_info = champions.find(champion_name)
             
-            if not found_champion:
+            if not champ_info:
                 embed = create_error_embed(
                     f"Champion '{champion_name}' not found. Please check the spelling and try again."
                 )
                 await interaction.followup.send(embed=embed)
                 return
             
+            found_champion = champ_info.get("name")
+            champion_key = champ_info.get("id")
+            
             # Format champion name for URLs (replace spaces with hyphens, lowercase)
             url_name = found_champion.replace(" ", "-").replace("'", "").lower()
             champion_id = champion_key.lower()
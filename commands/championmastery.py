@@ -49,8 +49,8 @@ async def setup(bot: commands.Bot):
                 await interaction.followup.send(embed=embed)
                 return
             
-            # Fetch champion data for name lookup
-            champion_data = await riot_api.get_champion_data()
+            # Champion data for name lookup (in memory; loaded first if startup couldn't)
+            champions = await riot_api.get_loaded_champion_catalog()
             
             embed = create_basic_embed(
                 title=f"Top Champions - {game_name}#{tag_line}",
@@ -60,7 +60,7 @@ async def setup(bot: commands.Bot):
             # Add each champion
             for i, mastery in enumerate(mastery_data, 1):
                 champion_id = mastery["championId"]
-                champion_name = riot_api.get_champion_name_by_id(champion_id, champion_data)
+                champion_name = champions.get_name(champion_id)
                 
                 mastery_level = mastery.get("championLevel", 0)
                 mastery_points = mastery.get("championPoints", 0)
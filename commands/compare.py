@@ -53,7 +53,7 @@ async def setup(bot: commands.Bot):
             mastery2 = await riot_api.get_champion_mastery(summoner2["puuid"], config.DEFAULT_REGION, count=1)
             
             # Get champion data
-            champion_data = await riot_api.get_champion_data()
+            champions = await riot_api.get_loaded_champion_catalog()
             
             # Extract Solo/Duo rank
             solo1 = None
@@ -80,7 +80,7 @@ async def setup(bot: commands.Bot):
             top_champ1 = "None"
             if mastery1:
                 champ_id1 = mastery1[0]["championId"]
-                top_champ1 = riot_api.get_champion_name_by_id(champ_id1, champion_data)
+                top_champ1 = champions.get_name(champ_id1)
                 top_champ1 += f" (M{mastery1[0].get('championLevel', 0)})"
             
             # Format data for summoner 2
@@ -94,7 +94,7 @@ async def setup(bot: commands.Bot):
             top_champ2 = "None"
             if mastery2:
                 champ_id2 = mastery2[0]["championId"]
-                top_champ2 = riot_api.get_champion_name_by_id(champ_id2, champion_data)
+                top_champ2 = champions.get_name(champ_id2)
                 top_champ2 += f" (M{mastery2[0].get('championLevel', 0)})"
             
             # Create comparison embed
@@ -0,0 +1,138 @@
+"""
+Debug command - Owner-only summary of the bot's runtime metrics.
+Shows the same data as the Prometheus endpoint: Riot endpoint latencies and
+statuses, rate limit headroom, open circuits, cache hit ratios and slash
+command timings.
+"""
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+import riot_api
+from utils import metrics
+from utils.helpers import create_basic_embed, create_error_embed
+
+
+# How many rows each section of the summary shows
+DEBUG_MAX_ROWS = 8
+
+
+def format_ms(seconds) -> str:
+    """Format a duration in seconds as milliseconds (or "-" if unknown)."""
+    return "-" if seconds is None else f"{seconds * 1000:.0f}ms"
+
+
+def summarize_riot_endpoints() -> str:
+    """One line per Riot endpoint: requests, errors, average and p95 latency."""
+    latency = riot_api.request_latency
+    errors = {}
+    for (endpoint, status), count in riot_api.request_count.values.items():
+        if not status.startswith("2") and status != "404":
+            errors[endpoint] = errors.get(endpoint, 0) + count
+
+    rows = sorted(latency.label_sets(), key=lambda labels: latency.count(*labels), reverse=True)
+    lines = [
+        f"`{endpoint}` {latency.count(endpoint)} req, {errors.get(endpoint, 0)} err, "
+        f"avg {format_ms(latency.mean(endpoint))}, p95 {format_ms(latency.quantile(0.95, endpoint))}"
+        for (endpoint,) in rows[:DEBUG_MAX_ROWS]
+    ]
+    return "\n".join(lines) or "No requests yet"
+
+
+def summarize_statuses() -> str:
+    """Response counts per status across all endpoints."""
+    totals = {}
+    for (endpoint, status), count in riot_api.request_count.values.items():
+        totals[status] = totals.get(status, 0) + count
+    return " | ".join(f"{status}: {int(count)}" for status, count in sorted(totals.items())) or "No requests yet"
+
+
+def summarize_rate_limits() -> str:
+    """The fullest rate limit windows (lowest headroom first), then per-key health."""
+    key_pool = riot_api.key_pool
+    usage = sorted(key_pool.usage(), key=lambda row: row[4] / row[5] if row[5] else 0, reverse=True)
+    lines = [
+        f"{key_name} `{host.replace('.api.riotgames.com', '')}` {scope} {used}/{limit} per {window}s"
+        for key_name, host, scope, window, used, limit in usage[:DEBUG_MAX_ROWS]
+    ]
+    lines.append(f"Throttled requests: {key_pool.throttled_requests} (waited {key_pool.total_wait:.1f}s)")
+    for name, stats in key_pool.stats().items():
+        state = "✅" if stats["enabled"] else f"⛔ {stats['disabled_reason']}"
+        lines.append(f"{name}: {state}, {stats['requests']} requests, {stats['forbidden']} 403s")
+    return "\n".join(lines)
+
+
+def summarize_circuits() -> str:
+    """Circuit breakers that are not closed, plus how many calls they failed fast."""
+    lines = [
+        f"`{host.replace('.api.riotgames.com', '')}` {family}: {stats['state']}, "
+        f"{stats['failures']} failures, {stats['rejected']} rejected"
+        for (host, family), stats in riot_api.circuit_breakers.stats().items()
+        if stats["state"] != "closed"
+    ][:DEBUG_MAX_ROWS]
+    lines.append(f"Stale responses served: {sum(riot_api.stale_served.values())}")
+    return "\n".join(lines)
+
+
+def summarize_caches() -> str:
+    """Hit ratio of every cache layer."""
+    lines = []
+    for name, stats in riot_api.get_all_cache_stats().items():
+        lookups = stats["hits"] + stats["misses"]
+        ratio = f"{stats['hits'] / lookups:.0%}" if lookups else "-"
+        lines.append(f"`{name}` {ratio} ({stats['hits']}/{lookups})")
+    retries = riot_api.get_retry_stats()
+    singleflight = riot_api.get_singleflight_stats()
+    lines.append(f"Retries: {retries['retries']} (gave up {retries['gave_up']}), "
+                 f"coalesced calls: {singleflight['coalesced']}")
+    return "\n".join(lines)
+
+
+def summarize_commands() -> str:
+    """One line per slash command: runs, average and p95 run time."""
+    latency = metrics.registry.get("discord_command_duration_seconds")
+    if latency is None:
+        return "Not recorded"
+
+    rows = sorted(latency.label_sets(), key=lambda labels: latency.count(*labels), reverse=True)
+    lines = [
+        f"`/{command}` {outcome}: {latency.count(command, outcome)} runs, "
+        f"avg {format_ms(latency.mean(command, outcome))}, p95 {format_ms(latency.quantile(0.95, command, outcome))}"
+        for command, outcome in rows[:DEBUG_MAX_ROWS]
+    ]
+    monitor = metrics.registry.get("monitor_cycle_duration_seconds")
+    if monitor is not None and monitor.count():
+        lines.append(f"Monitor cycle: {monitor.count()} runs, avg {format_ms(monitor.mean())}, "
+                     f"p95 {format_ms(monitor.quantile(0.95))}")
+    return "\n".join(lines) or "No commands yet"
+
+
+async def setup(bot: commands.Bot):
+    """Setup function to register the command with the bot."""
+
+    debug_group = app_commands.Group(name="debug", description="Bot diagnostics (owner only)")
+
+    @debug_group.command(name="stats", description="Show API latency, rate limit, cache and command metrics")
+    async def debug_stats(interaction: discord.Interaction):
+        """
+        Summarize the runtime metrics (only the bot owner can use this).
+
+        Args:
+            interaction: Discord interaction
+        """
+        if not await bot.is_owner(interaction.user):
+            embed = create_error_embed("Only the bot owner can use this command.")
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        embed = create_basic_embed(title="🛠️ Debug Stats")
+        embed.add_field(name="Riot Endpoints", value=summarize_riot_endpoints()[:1024], inline=False)
+        embed.add_field(name="Riot Statuses", value=summarize_statuses()[:1024], inline=False)
+        embed.add_field(name="Rate Limits", value=summarize_rate_limits()[:1024], inline=False)
+        embed.add_field(name="Circuits", value=summarize_circuits()[:1024], inline=False)
+        embed.add_field(name="Caches", value=summarize_caches()[:1024], inline=False)
+        embed.add_field(name="Commands", value=summarize_commands()[:1024], inline=False)
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    bot.tree.add_command(debug_group)
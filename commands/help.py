@@ -29,6 +29,7 @@ async def setup(bot: commands.Bot):
         embed.add_field(
             name="📊 Data Display Commands",
             value=(
+                "`/profile` - Summoner, rank, top champions and recent matches\n"
                 "`/summoner` - Display summoner information\n"
                 "`/rank` - Show ranked stats and winrate\n"
                 "`/recentmatches` - Display last 5 matches\n"
@@ -49,8 +49,8 @@ async def setup(bot: commands.Bot):
                 await interaction.followup.send(embed=embed)
                 return
             
-            # Fetch champion data for name lookup
-            champion_data = await riot_api.get_champion_data()
+            # Champion data for name lookup (in memory; loaded first if startup couldn't)
+            champions = await riot_api.get_loaded_champion_catalog()
             
             # Extract game mode
             game_mode = active_game.get("gameMode", "Unknown")
@@ -71,7 +71,7 @@ async def setup(bot: commands.Bot):
             
             if player_participant:
                 champion_id = player_participant.get("championId")
-                champion_name = riot_api.get_champion_name_by_id(champion_id, champion_data)
+                champion_name = champions.get_name(champion_id)
                 
                 embed.add_field(
                     name="Playing As",
@@ -85,7 +85,7 @@ async def setup(bot: commands.Bot):
             
             for participant in active_game.get("participants", []):
                 champ_id = participant.get("championId")
-                champ_name = riot_api.get_champion_name_by_id(champ_id, champion_data)
+                champ_name = champions.get_name(champ_id)
                 
                 if participant.get("teamId") == 100:
                     team_100.append(champ_name)
@@ -0,0 +1,152 @@
+"""
+Profile command - Display a player's full profile in one response.
+Resolves the Riot ID once, then fetches rank, mastery and recent matches concurrently.
+"""
+
+import asyncio
+import discord
+from discord import app_commands
+from discord.ext import commands
+import riot_api
+from utils.helpers import (
+    create_basic_embed, create_error_embed, create_summoner_embed, create_rank_embed,
+    format_kda, calculate_kda_ratio, format_duration
+)
+import config
+
+
+# How many top champions and recent matches the profile shows
+PROFILE_MASTERY_COUNT = 3
+PROFILE_MATCH_COUNT = 3
+
+
+async def fetch_recent_matches(puuid: str, region: str) -> list:
+    """Fetch the latest match IDs, then their details concurrently."""
+    match_ids = await riot_api.get_match_history(puuid, region, count=PROFILE_MATCH_COUNT)
+    if not match_ids:
+        return []
+    return await riot_api.get_match_summaries_batch(match_ids, region)
+
+
+def create_mastery_embed(title: str, mastery_data, champions) -> discord.Embed:
+    """Create the top champions embed (or an error note if mastery failed to load)."""
+    embed = create_basic_embed(title=f"⭐ Top Champions - {title}")
+
+    if isinstance(mastery_data, Exception):
+        embed.description = "Could not load champion mastery"
+        return embed
+
+    if not mastery_data:
+        embed.description = "No champion mastery data found"
+        return embed
+
+    for i, mastery in enumerate(mastery_data, 1):
+        champion_name = champions.get_name(mastery["championId"])
+        embed.add_field(
+            name=f"{i}. {champion_name}",
+            value=f"Level {mastery.get('championLevel', 0)}\n{mastery.get('championPoints', 0):,} points",
+            inline=True
+        )
+    return embed
+
+
+def create_matches_embed(title: str, puuid: str, matches, champions) -> discord.Embed:
+    """Create the recent matches embed (or an error note if matches failed to load)."""
+    embed = create_basic_embed(title=f"🕹️ Recent Matches - {title}")
+
+    if isinstance(matches, Exception):
+        embed.description = "Could not load recent matches"
+        return embed
+
+    if not matches:
+        embed.description = "No recent matches found"
+        return embed
+
+    for i, match in enumerate(matches, 1):
+        if isinstance(match, riot_api.RiotAPIError):
+            embed.add_field(name=f"Match {i}", value="Error loading match data", inline=False)
+            continue
+
+        participant = match.participant(puuid)
+        if not participant:
+            continue
+
+        kills = participant.kills
+        deaths = participant.deaths
+        assists = participant.assists
+        result = "✅ Victory" if participant.win else "❌ Defeat"
+
+        embed.add_field(
+            name=f"Match {i} - {result}",
+            value=(
+                f"**{champions.get_name(participant.champion_id)}** | "
+                f"{format_kda(kills, deaths, assists)} (KDA: {calculate_kda_ratio(kills, deaths, assists)})\n"
+                f"Duration: {format_duration(match.duration)}"
+            ),
+            inline=False
+        )
+    return embed
+
+
+async def setup(bot: commands.Bot):
+    """Setup function to register the command with the bot."""
+
+    @bot.tree.command(name="profile", description="Show summoner, rank, top champions and recent matches")
+    @app_commands.describe(
+        game_name="Summoner's game name (without tag)",
+        tag_line="Summoner's tag (without #)"
+    )
+    async def profile(
+        interaction: discord.Interaction,
+        game_name: str,
+        tag_line: str
+    ):
+        """
+        Display a player's full profile in a single multi-embed response.
+
+        Args:
+            interaction: Discord interaction
+            game_name: Summoner's game name
+            tag_line: Summoner's tag
+        """
+        await interaction.response.defer()
+
+        try:
+            region = config.DEFAULT_REGION
+
+            # Resolve the Riot ID once (uses default region from config)
+            summoner_data = await riot_api.get_summoner_by_riot_id(game_name, tag_line, region)
+            puuid = summoner_data["puuid"]
+            title = f"{summoner_data['gameName']}#{summoner_data['tagLine']}"
+
+            # Fetch everything else at the same time; a failed section doesn't fail the profile
+            rank_data, mastery_data, matches = await asyncio.gather(
+                riot_api.get_summoner_rank(puuid, region),
+                riot_api.get_champion_mastery(puuid, region, count=PROFILE_MASTERY_COUNT),
+                fetch_recent_matches(puuid, region),
+                return_exceptions=True
+            )
+
+            champions = await riot_api.get_loaded_champion_catalog()
+
+            if isinstance(rank_data, Exception):
+                rank_embed = create_basic_embed(title=f"Ranked Stats - {title}", description="Could not load ranked data")
+            else:
+                rank_embed = create_rank_embed(summoner_data, rank_data)
+
+            embeds = [
+                create_summoner_embed(summoner_data),
+                rank_embed,
+                create_mastery_embed(title, mastery_data, champions),
+                create_matches_embed(title, puuid, matches, champions),
+            ]
+
+            await interaction.followup.send(embeds=embeds)
+
+        except riot_api.RiotAPIError as e:
+            embed = create_error_embed(str(e))
+            await interaction.followup.send(embed=embed)
+
+        except Exception as e:
+            embed = create_error_embed(f"An unexpected error occurred: {str(e)}")
+            await interaction.followup.send(embed=embed)
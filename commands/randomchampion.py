@@ -31,8 +31,8 @@ async def setup(bot: commands.Bot):
         await interaction.response.defer()
         
         try:
-            # Fetch champion data
-            champion_data = await riot_api.get_champion_data()
+            # Champion data (in memory; loaded first if startup couldn't)
+            champions = await riot_api.get_loaded_champion_catalog()
             
             if from_rotation:
                 # Get free rotation
@@ -46,11 +46,11 @@ async def setup(bot: commands.Bot):
                 
                 # Pick random from rotation
                 random_id = random.choice(free_champion_ids)
-                champion_name = riot_api.get_champion_name_by_id(random_id, champion_data)
+                random_champion = champions.get(random_id) or {"name": "Unknown Champion"}
                 source = "Free Rotation"
             else:
                 # Pick random from all champions
-                all_champions = list(champion_data.get("data", {}).values())
+                all_champions = champions.all()
                 
                 if not all_champions:
                     embed = create_error_embed("Could not load champion data")
@@ -58,16 +58,11 @@ async def setup(bot: commands.Bot):
                     return
                 
                 random_champion = random.choice(all_champions)
-                champion_name = random_champion.get("name", "Unknown")
                 source = "All Champions"
             
-            # Get champion icon URL
-            # We need to find the champion key (internal name) for the icon
-            champion_key = None
-            for champ_key, champ_info in champion_data.get("data", {}).items():
-                if champ_info.get("name") == champion_name:
-                    champion_key = champ_key
-                    break
+            # The champion key (internal name) is needed for the icon
+            champion_name = random_champion.get("name", "Unknown")
+            champion_key = random_champion.get("id")
             
             embed = create_basic_embed(
                 title="🎲 Random Champion",
@@ -52,41 +52,38 @@ async def setup(bot: commands.Bot):
                 await interaction.followup.send(embed=embed)
                 return
             
-            # Fetch champion data for name lookup
-            champion_data = await riot_api.get_champion_data()
+            # Champion data for name lookup (in memory; loaded first if startup couldn't)
+            champions = await riot_api.get_loaded_champion_catalog()
             
             embed = create_basic_embed(
                 title=f"Recent Matches - {game_name}#{tag_line}",
                 description=f"Last {len(match_ids)} matches"
             )
             
+            # Fetch all matches concurrently (results keep the match order)
+            matches = await riot_api.get_match_summaries_batch(match_ids, config.DEFAULT_REGION)
+            
             # Process each match
-            for i, match_id in enumerate(match_ids, 1):
+            for i, match in enumerate(matches, 1):
                 try:
-                    match_details = await riot_api.get_match_details(match_id, config.DEFAULT_REGION)
+                    if isinstance(match, riot_api.RiotAPIError):
+                        raise match
                     
                     # Find player's data in the match
-                    participant = None
-                    for p in match_details["info"]["participants"]:
-                        if p["puuid"] == puuid:
-                            participant = p
-                            break
+                    participant = match.participant(puuid)
                     
                     if participant:
                         # Extract match data
-                        champion_name = riot_api.get_champion_name_by_id(
-                            participant["championId"], champion_data
-                        )
-                        kills = participant["kills"]
-                        deaths = participant["deaths"]
-                        assists = participant["assists"]
-                        win = participant["win"]
+                        champion_name = champions.get_name(participant.champion_id)
+                        kills = participant.kills
+                        deaths = participant.deaths
+                        assists = participant.assists
                         
                         kda_str = format_kda(kills, deaths, assists)
                         kda_ratio = calculate_kda_ratio(kills, deaths, assists)
-                        duration = format_duration(match_details["info"]["gameDuration"])
+                        duration = format_duration(match.duration)
                         
-                        result = "✅ Victory" if win else "❌ Defeat"
+                        result = "✅ Victory" if participant.win else "❌ Defeat"
                         
                         embed.add_field(
                             name=f"Match {i} - {result}",
@@ -37,13 +37,13 @@ async def setup(bot: commands.Bot):
                 await interaction.followup.send(embed=embed)
                 return
             
-            # Fetch champion data for name lookup
-            champion_data = await riot_api.get_champion_data()
+            # Champion data for name lookup (in memory; loaded first if startup couldn't)
+            champions = await riot_api.get_loaded_champion_catalog()
             
             # Get champion names
             champion_names = []
             for champ_id in free_champion_ids:
-                name = riot_api.get_champion_name_by_id(champ_id, champion_data)
+                name = champions.get_name(champ_id)
                 champion_names.append(name)
             
             # Sort alphabetically
@@ -3,61 +3,16 @@ Track command - Player tracking system using Discord threads.
 Creates threads for tracked players in a designated channel.
 """
 
+import asyncio
 import discord
 from discord import app_commands
 from discord.ext import commands
 import riot_api
 from utils.helpers import create_basic_embed, create_error_embed, create_summoner_embed, create_rank_embed
 import config
-import json
-import os
+from utils import tracking_store
 from datetime import datetime
-
-
-# File to store tracking configuration
-DATA_FILE = "data/tracked_users.json"
-
-
-def load_tracking_data():
-    """Load tracking configuration from JSON file (all guilds)."""
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r") as f:
-            data = json.load(f)
-            # Migrate old format to new format if needed
-            if "guilds" not in data:
-                # Old format detected, migrate it
-                return {"guilds": {}}
-            return data
-    return {"guilds": {}}
-
-
-def save_tracking_data(data):
-    """Save tracking configuration to JSON file."""
-    os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=2)
-
-
-def get_guild_data(guild_id: int):
-    """Get tracking data for a specific guild."""
-    data = load_tracking_data()
-    guild_id_str = str(guild_id)
-    
-    if guild_id_str not in data["guilds"]:
-        data["guilds"][guild_id_str] = {
-            "tracking_channel_id": None,
-            "tracked_players": []
-        }
-        save_tracking_data(data)
-    
-    return data["guilds"][guild_id_str]
-
-
-def save_guild_data(guild_id: int, guild_data: dict):
-    """Save tracking data for a specific guild."""
-    data = load_tracking_data()
-    data["guilds"][str(guild_id)] = guild_data
-    save_tracking_data(data)
+from typing import Dict
 
 
 async def setup(bot: commands.Bot):
@@ -111,9 +66,7 @@ async def setup(bot: commands.Bot):
                     return
             
             # Save the stalking channel for this guild
-            guild_data = get_guild_data(interaction.guild.id)
-            guild_data["tracking_channel_id"] = channel.id
-            save_guild_data(interaction.guild.id, guild_data)
+            await tracking_store.store.set_channel(interaction.guild.id, channel.id)
             
             channel_type = "forum" if isinstance(channel, discord.ForumChannel) else "text channel"
             
@@ -144,10 +97,10 @@ async def setup(bot: commands.Bot):
             return
         
         try:
-            guild_data = get_guild_data(interaction.guild.id)
+            channel_id = await tracking_store.store.get_channel(interaction.guild.id)
             
             # Check if a channel is even set
-            if not guild_data.get("tracking_channel_id"):
+            if not channel_id:
                 embed = create_error_embed(
                     "No stalking channel is currently set.\n\n"
                     "Use `/stalk set` to set one first."
@@ -156,7 +109,7 @@ async def setup(bot: commands.Bot):
                 return
             
             # Check if there are tracked players
-            tracked_count = len(guild_data.get("tracked_players", []))
+            tracked_count = await tracking_store.store.count_players(interaction.guild.id)
             
             if tracked_count > 0:
                 embed = create_error_embed(
@@ -169,13 +122,11 @@ async def setup(bot: commands.Bot):
                 return
             
             # Get channel mention before removing
-            channel_id = guild_data["tracking_channel_id"]
             channel = interaction.guild.get_channel(channel_id)
             channel_mention = channel.mention if channel else f"Channel ID: {channel_id}"
             
             # Remove the stalking channel
-            guild_data["tracking_channel_id"] = None
-            save_guild_data(interaction.guild.id, guild_data)
+            await tracking_store.store.set_channel(interaction.guild.id, None)
             
             embed = create_basic_embed(
                 title="✅ Stalking Channel Removed",
@@ -211,9 +162,9 @@ async def setup(bot: commands.Bot):
         
         try:
             # Check if tracking channel is set
-            guild_data = get_guild_data(interaction.guild.id)
+            tracking_channel_id = await tracking_store.store.get_channel(interaction.guild.id)
             
-            if not guild_data.get("tracking_channel_id"):
+            if not tracking_channel_id:
                 embed = create_error_embed(
                     "No stalking channel set!\n\n"
                     "Use `/stalk set` to set a channel first."
@@ -222,7 +173,7 @@ async def setup(bot: commands.Bot):
                 return
             
             # Get the tracking channel
-            channel = interaction.guild.get_channel(guild_data["tracking_channel_id"])
+            channel = interaction.guild.get_channel(tracking_channel_id)
             
             if not channel:
                 embed = create_error_embed(
@@ -241,14 +192,14 @@ async def setup(bot: commands.Bot):
             full_name = f"{verified_name}#{verified_tag}"
             
             # Check if player is already tracked
-            for player in guild_data.get("tracked_players", []):
-                if player["puuid"] == puuid:
-                    embed = create_error_embed(
-                        f"**{full_name}** is already being stalked!\n\n"
-                        f"Thread: <#{player['thread_id']}>"
-                    )
-                    await interaction.followup.send(embed=embed)
-                    return
+            player = await tracking_store.store.find_player(interaction.guild.id, puuid)
+            if player:
+                embed = create_error_embed(
+                    f"**{full_name}** is already being stalked!\n\n"
+                    f"Thread: <#{player['thread_id']}>"
+                )
+                await interaction.followup.send(embed=embed)
+                return
             
             # Fetch rank data for the initial post
             rank_data = await riot_api.get_summoner_rank(puuid, config.DEFAULT_REGION)
@@ -293,10 +244,7 @@ async def setup(bot: commands.Bot):
                 await info_message.pin()
             
             # Add to tracked players
-            if "tracked_players" not in guild_data:
-                guild_data["tracked_players"] = []
-            
-            guild_data["tracked_players"].append({
+            await tracking_store.store.add_player({
                 "puuid": puuid,
                 "game_name": verified_name,
                 "tag_line": verified_tag,
@@ -307,8 +255,6 @@ async def setup(bot: commands.Bot):
                 "guild_id": interaction.guild.id
             })
             
-            save_guild_data(interaction.guild.id, guild_data)
-            
             # Send confirmation
             embed = create_basic_embed(
                 title="✅ Player Stalked",
@@ -338,9 +284,9 @@ async def setup(bot: commands.Bot):
         await interaction.response.defer()
         
         try:
-            guild_data = get_guild_data(interaction.guild.id)
+            tracked_players = await tracking_store.store.list_players(interaction.guild.id)
             
-            if not guild_data.get("tracked_players"):
+            if not tracked_players:
                 embed = create_basic_embed(
                     title="📋 Stalked Players",
                     description="No players are currently being stalked.\n\nUse `/stalk add` to start stalking!"
@@ -348,16 +294,16 @@ async def setup(bot: commands.Bot):
                 await interaction.followup.send(embed=embed)
                 return
             
-            tracking_channel_id = guild_data.get("tracking_channel_id")
+            tracking_channel_id = await tracking_store.store.get_channel(interaction.guild.id)
             channel_mention = f"<#{tracking_channel_id}>" if tracking_channel_id else "None set"
             
             embed = create_basic_embed(
                 title="📋 Stalked Players",
                 description=f"**Stalking Channel:** {channel_mention}\n\n"
-                           f"**{len(guild_data['tracked_players'])} player(s) stalked:**"
+                           f"**{len(tracked_players)} player(s) stalked:**"
             )
             
-            for i, player in enumerate(guild_data["tracked_players"], 1):
+            for i, player in enumerate(tracked_players, 1):
                 full_name = f"{player['game_name']}#{player['tag_line']}"
                 region = player['region'].upper()
                 thread_id = player['thread_id']
@@ -396,15 +342,10 @@ async def setup(bot: commands.Bot):
         await interaction.response.defer()
         
         try:
-            guild_data = get_guild_data(interaction.guild.id)
-            
             # Find the player
-            player_to_remove = None
-            for player in guild_data.get("tracked_players", []):
-                if (player["game_name"].lower() == game_name.lower() and 
-                    player["tag_line"].lower() == tag_line.lower()):
-                    player_to_remove = player
-                    break
+            player_to_remove = await tracking_store.store.find_player_by_riot_id(
+                interaction.guild.id, game_name, tag_line
+            )
             
             if not player_to_remove:
                 embed = create_error_embed(
@@ -422,8 +363,7 @@ async def setup(bot: commands.Bot):
                 pass  # Thread might already be deleted
             
             # Remove from tracked list
-            guild_data["tracked_players"].remove(player_to_remove)
-            save_guild_data(interaction.guild.id, guild_data)
+            await tracking_store.store.remove_player(interaction.guild.id, player_to_remove["id"])
             
             full_name = f"{player_to_remove['game_name']}#{player_to_remove['tag_line']}"
             
@@ -449,15 +389,39 @@ async def monitor_players(bot: commands.Bot):
     Background monitoring function that checks stalked players across all guilds.
     Detects: Live games, new matches, duo partners.
     """
-    all_data = load_tracking_data()
+    guilds = tracking_store.store.guilds
     
-    if "guilds" not in all_data or not all_data["guilds"]:
+    if not guilds:
         return  # No guilds configured
     
     total_players = 0
     
+    # Players are checked concurrently with a separate budget per region, so
+    # players on a slow region (e.g. sea) don't hold up everyone else
+    region_slots: Dict[str, asyncio.Semaphore] = {}
+    
+    async def check_player(player: dict, guild_data: dict, guild_id: int, guild):
+        slots = region_slots.get(player["region"])
+        if slots is None:
+            slots = region_slots[player["region"]] = asyncio.Semaphore(config.MONITOR_CONCURRENCY_PER_REGION)
+        async with slots:
+            state = tracking_store.player_state(player)
+            try:
+                await check_player_activity(bot, player, guild_data, guild_id)
+            except Exception as e:
+                print(f"[Monitor] Error checking {player['game_name']}#{player['tag_line']} in guild {guild.name}: {e}")
+            
+            # Only players whose state changed are written (batched with the rest of the cycle)
+            if tracking_store.player_state(player) != state:
+                tracking_store.store.mark_player_dirty(player)
+    
+    async def check_guild(guild_id: int, guild_data: dict, guild):
+        await asyncio.gather(*(check_player(player, guild_data, guild_id, guild)
+                               for player in guild_data["tracked_players"]))
+    
     # Monitor each guild separately
-    for guild_id_str, guild_data in all_data["guilds"].items():
+    guild_checks = []
+    for guild_id_str, guild_data in guilds.items():
         if not guild_data.get("tracking_channel_id") or not guild_data.get("tracked_players"):
             continue  # Skip guilds with no setup or no players
         
@@ -469,18 +433,12 @@ async def monitor_players(bot: commands.Bot):
             continue
         
         total_players += len(guild_data["tracked_players"])
-        
-        for player in guild_data["tracked_players"]:
-            try:
-                await check_player_activity(bot, player, guild_data, guild_id)
-            except Exception as e:
-                print(f"[Monitor] Error checking {player['game_name']}#{player['tag_line']} in guild {guild.name}: {e}")
-        
-        # Save updates for this guild
-        save_guild_data(guild_id, guild_data)
+        guild_checks.append(check_guild(guild_id, guild_data, guild))
+    
+    await asyncio.gather(*guild_checks)
     
     if total_players > 0:
-        print(f"[Monitor] Checked {total_players} stalked player(s) across {len(all_data['guilds'])} guild(s)")
+        print(f"[Monitor] Checked {total_players} stalked player(s) across {len(guilds)} guild(s)")
 
 
 async def check_player_activity(bot: commands.Bot, player: dict, guild_data: dict, guild_id: int):
@@ -511,8 +469,6 @@ async def check_player_activity(bot: commands.Bot, player: dict, guild_data: dic
         player["last_match_id"] = None
     if "is_in_game" not in player:
         player["is_in_game"] = False
-    if "duo_partners" not in player:
-        player["duo_partners"] = {}  # {puuid: {name, count}}
     
     # Check if player is in a live game
     await check_live_game(thread, player, puuid, region, full_name)
@@ -524,21 +480,23 @@ async def check_player_activity(bot: commands.Bot, player: dict, guild_data: dic
 async def check_live_game(thread, player: dict, puuid: str, region: str, full_name: str):
     """Check if player is currently in a game."""
     try:
-        active_game = await riot_api.get_active_game(puuid, region)
+        active_game = await riot_api.get_active_game(
+            puuid, region, use_cache=False, deadline=config.RIOT_BACKGROUND_DEADLINE
+        )
         
         if active_game and not player["is_in_game"]:
+            # Champion lookups (loaded first if startup couldn't; on failure the game is announced next cycle)
+            champions = await riot_api.get_loaded_champion_catalog()
+            
             # Player just started a game!
             player["is_in_game"] = True
             
-            # Get champion data
-            champion_data = await riot_api.get_champion_data()
-            
             # Find player's champion
             player_champ = "Unknown"
             for participant in active_game.get("participants", []):
                 if participant.get("puuid") == puuid:
                     champ_id = participant.get("championId")
-                    player_champ = riot_api.get_champion_name_by_id(champ_id, champion_data)
+                    player_champ = champions.get_name(champ_id)
                     break
             
             # Get game mode using queue ID (same as match results for consistency)
@@ -571,7 +529,9 @@ async def check_new_matches(thread, player: dict, puuid: str, region: str, full_
     """Check for new matches and post results."""
     try:
         # Get recent match history
-        match_ids = await riot_api.get_match_history(puuid, region, count=1)
+        match_ids = await riot_api.get_match_history(
+            puuid, region, count=1, use_cache=False, deadline=config.RIOT_BACKGROUND_DEADLINE
+        )
         
         if not match_ids:
             return
@@ -582,45 +542,38 @@ async def check_new_matches(thread, player: dict, puuid: str, region: str, full_
         if player["last_match_id"] == latest_match_id:
             return  # No new matches
         
-        # New match detected!
+        # New match detected! Get match details first, so a failed fetch is retried next cycle
+        match = await riot_api.get_match_summary(latest_match_id, region, deadline=config.RIOT_BACKGROUND_DEADLINE)
+        champions = await riot_api.get_loaded_champion_catalog()
         player["last_match_id"] = latest_match_id
         
-        # Get match details
-        match_details = await riot_api.get_match_details(latest_match_id, region)
-        champion_data = await riot_api.get_champion_data()
-        
         # Find player's data in the match
-        participant = None
-        for p in match_details["info"]["participants"]:
-            if p["puuid"] == puuid:
-                participant = p
-                break
+        participant = match.participant(puuid)
         
         if not participant:
             return
         
         # Extract match data
-        champion_name = riot_api.get_champion_name_by_id(participant["championId"], champion_data)
-        kills = participant["kills"]
-        deaths = participant["deaths"]
-        assists = participant["assists"]
-        win = participant["win"]
+        champion_name = champions.get_name(participant.champion_id)
+        kills = participant.kills
+        deaths = participant.deaths
+        assists = participant.assists
+        win = participant.win
         
         kda = f"{kills}/{deaths}/{assists}"
         kda_ratio = round((kills + assists) / deaths, 2) if deaths > 0 else float(kills + assists)
         
-        duration_seconds = match_details["info"]["gameDuration"]
-        duration_minutes = duration_seconds // 60
+        duration_minutes = match.duration // 60
         
         # Get game mode
-        queue_id = match_details["info"].get("queueId", 0)
+        queue_id = match.queue_id
         game_mode = get_game_mode_name(queue_id)
         
         # Check if this is a ranked solo/duo game
         is_ranked_solo = (queue_id == 420)
         
         # Check for duo partners
-        duo_info = await detect_duo_partners(match_details, player, puuid, champion_data)
+        duo_info = await detect_duo_partners(match, player, puuid, champions)
         
         # Fetch current rank data for LP tracking (ONLY for ranked solo/duo)
         rank_change_info = None
@@ -663,50 +616,28 @@ async def check_new_matches(thread, player: dict, puuid: str, region: str, full_
         print(f"[Monitor] Error checking matches for {full_name}: {e}")
 
 
-async def detect_duo_partners(match_details: dict, player: dict, player_puuid: str, champion_data: dict):
+async def detect_duo_partners(match, player: dict, player_puuid: str, champions):
     """
     Detect if player is playing with the same teammates repeatedly.
     Returns a string with duo partner info, or None.
     """
     try:
-        # Get player's team
-        player_team = None
-        for p in match_details["info"]["participants"]:
-            if p["puuid"] == player_puuid:
-                player_team = p["teamId"]
-                break
-        
-        if not player_team:
+        teammates = match.teammates(player_puuid)
+        if not teammates:
             return None
         
-        duo_partners = player.get("duo_partners", {})
+        # Count this game for every teammate (stored in the duo_partners table)
+        counts = await tracking_store.store.add_duo_games(player, [(p.puuid, p.riot_id) for p in teammates])
         duo_messages = []
         
         # Check all teammates
-        for p in match_details["info"]["participants"]:
-            if p["puuid"] == player_puuid or p["teamId"] != player_team:
-                continue  # Skip self and enemies
-            
-            teammate_puuid = p["puuid"]
-            teammate_name = p.get("riotIdGameName", "Unknown") + "#" + p.get("riotIdTagLine", "????")
-            teammate_champ = riot_api.get_champion_name_by_id(p["championId"], champion_data)
-            
-            # Track this duo partner
-            if teammate_puuid not in duo_partners:
-                duo_partners[teammate_puuid] = {
-                    "name": teammate_name,
-                    "count": 1
-                }
-            else:
-                duo_partners[teammate_puuid]["count"] += 1
-                count = duo_partners[teammate_puuid]["count"]
-                
-                # If they've played together 3+ times, mention it
-                if count >= 3:
-                    duo_messages.append(f"**{teammate_name}** ({teammate_champ}) - {count} games together")
-        
-        # Update duo_partners in player data
-        player["duo_partners"] = duo_partners
+        for p in teammates:
+            count = counts.get(p.puuid, 0)
+            
+            # If they've played together 3+ times, mention it
+            if count >= 3:
+                teammate_champ = champions.get_name(p.champion_id)
+                duo_messages.append(f"**{p.riot_id}** ({teammate_champ}) - {count} games together")
         
         if duo_messages:
             return "\n".join(duo_messages)
@@ -725,7 +656,9 @@ async def check_rank_change(player: dict, puuid: str, region: str) -> str:
     """
     try:
         # Fetch current rank data
-        rank_data = await riot_api.get_summoner_rank(puuid, region)
+        rank_data = await riot_api.get_summoner_rank(
+            puuid, region, use_cache=False, deadline=config.RIOT_BACKGROUND_DEADLINE
+        )
         
         # Find Solo/Duo queue
         current_solo = None
@@ -749,6 +682,7 @@ async def check_rank_change(player: dict, puuid: str, region: str) -> str:
                 "rank": current_rank,
                 "lp": current_lp
             }
+            tracking_store.store.record_rank(player, current_tier, current_rank, current_lp)
             return None  # First time tracking, no change to show
         
         # Get previous rank
@@ -759,12 +693,14 @@ async def check_rank_change(player: dict, puuid: str, region: str) -> str:
         # Calculate LP change
         lp_change = current_lp - prev_lp
         
-        # Update stored rank
+        # Update stored rank (and keep a snapshot in the rank history when it changed)
         player["last_rank"] = {
             "tier": current_tier,
             "rank": current_rank,
             "lp": current_lp
         }
+        if (current_tier, current_rank, current_lp) != (prev_tier, prev_rank, prev_lp):
+            tracking_store.store.record_rank(player, current_tier, current_rank, current_lp)
         
         # Format rank display
         rank_display = f"{current_tier.capitalize()} {current_rank} {current_lp} LP"
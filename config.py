@@ -15,6 +15,79 @@ DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", "your_discord_token_here")
 # Riot Games API Key
 RIOT_API_KEY = os.getenv("RIOT_API_KEY", "your_riot_api_key_here")
 
+# Optional pool of keys (comma-separated) used instead of RIOT_API_KEY. Each key has its
+# own rate limits and requests go to the key with the most room. PUUIDs are encrypted
+# per Riot application, so every key in the pool must belong to the same application.
+RIOT_API_KEYS = [key.strip() for key in os.getenv("RIOT_API_KEYS", "").split(",") if key.strip()] or [RIOT_API_KEY]
+
+# Seconds a key is left out of the pool after a 403 before it is tried again
+RIOT_KEY_DISABLE_SECONDS = 600
+
+# Application rate limits used until Riot's X-App-Rate-Limit header is seen
+# (format "requests:seconds,..."; the default matches a personal/development key)
+RIOT_APP_RATE_LIMITS = os.getenv("RIOT_APP_RATE_LIMITS", "20:1,100:120")
+
+# Retry policy for 429 / 5xx / network errors (delays and deadline in seconds)
+RIOT_MAX_RETRIES = 3
+RIOT_RETRY_BASE_DELAY = 0.5
+RIOT_RETRY_MAX_DELAY = 8
+RIOT_RETRY_STATUSES = (500, 502, 503, 504)
+RIOT_REQUEST_DEADLINE = 30  # Whole call: rate limit wait, host queue, request and retries
+# Deadline for background calls (stalk monitor, Riot ID revalidation). Longer than the
+# longest app rate limit window (120s for a development key, 600s for production),
+# so they wait for a slot instead of failing; the short one is for slash commands.
+RIOT_BACKGROUND_DEADLINE = 15 * 60
+
+# Response cache: max entries and time-to-live per endpoint (seconds)
+# Endpoints not listed here are not cached. The free rotation and Clash are
+# kept in the stale-while-revalidate cache instead (see SWR_TTLS below).
+RIOT_CACHE_MAX_ENTRIES = 5000
+RIOT_CACHE_TTLS = {
+    "account-v1.by-riot-id": 6 * 3600,
+    "summoner-v4.by-puuid": 3600,
+    "league-v4.entries-by-puuid": 60,
+    "match-v5.ids-by-puuid": 30,
+    "champion-mastery-v4.top": 600,
+    "spectator-v5.active-game": 5,
+}
+
+# Finished match details are kept on disk instead (compressed, evicted by size)
+MATCH_STORE_FILE = "data/matches.sqlite3"
+MATCH_STORE_MAX_BYTES = 256 * 1024 * 1024
+
+# Resolved Riot IDs are kept on disk and revalidated in the background once older than this (seconds)
+RIOT_ID_CACHE_FILE = "data/riot_ids.sqlite3"
+RIOT_ID_REVALIDATE_AFTER = 24 * 3600
+
+# Weekly free champion rotation reset (weekday 0 = Monday, hour in UTC)
+ROTATION_RESET_WEEKDAY = 1
+ROTATION_RESET_HOUR_UTC = 12
+
+# Negative cache for 404s (unknown Riot IDs, "not in game") and empty match lists (seconds)
+NEGATIVE_CACHE_MAX_ENTRIES = 5000
+NEGATIVE_CACHE_TTLS = {
+    "account-v1.by-riot-id": 120,
+    "spectator-v5.active-game": 15,
+    "match-v5.ids-by-puuid": 60,
+}
+
+# Maximum number of match details fetched at the same time by batch lookups
+MATCH_FETCH_CONCURRENCY = 5
+
+# In-memory cache of compact match summaries (entries, seconds)
+MATCH_SUMMARY_CACHE_MAX_ENTRIES = 20000
+MATCH_SUMMARY_CACHE_TTL = 24 * 3600
+
+# Stale-while-revalidate for slow-changing data, as (soft TTL, hard TTL) in seconds. Past the
+# soft TTL the last good value is still served while a background refresh runs; past the
+# hard TTL callers wait for fresh data. The last good copy is kept on disk across restarts.
+# The free rotation is also refreshed after every weekly reset.
+SWR_CACHE_DIR = "data/swr"
+SWR_TTLS = {
+    "champion-v3.rotations": (3600, 7 * 24 * 3600),
+    "clash-v1.tournaments": (3600, 24 * 3600),
+}
+
 # Default region for Riot API requests
 DEFAULT_REGION = "eun1"
 
@@ -62,6 +135,72 @@ REGIONAL_ROUTING = {
 DDRAGON_VERSION = "14.1.1"
 DDRAGON_BASE_URL = f"https://ddragon.leagueoflegends.com/cdn/{DDRAGON_VERSION}"
 
+# Stalking configuration (all guilds). Guilds and players are written at once; the
+# monitor's per-player state is written this many seconds after a change (later
+# changes in that window share the same transaction)
+TRACKING_DB_FILE = "data/tracking.sqlite3"
+TRACKING_FLUSH_DELAY = 5
+
+# Old JSON tracking file, imported into TRACKING_DB_FILE once and renamed to *.migrated
+TRACKING_DATA_FILE = "data/tracked_users.json"
+
+# Champion catalog saved per Data Dragon version (it never changes for a given version)
+CHAMPION_CACHE_DIR = "data/ddragon"
+
+# Prometheus metrics endpoint (http://METRICS_HOST:METRICS_PORT/metrics); port 0 disables it
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+
+# Every Riot routing host plus Data Dragon, in a fixed order. The local fake
+# Riot API (benchmarks/fake_riot_server.py) serves host i on port FAKE_RIOT_API_PORT + i.
+RIOT_ROUTING_HOSTS = sorted(
+    {url.split("/")[2] for url in [*PLATFORM_ROUTING.values(), *REGIONAL_ROUTING.values()]}
+) + [DDRAGON_BASE_URL.split("/")[2]]
+
+# Set FAKE_RIOT_API_PORT to send every Riot and Data Dragon request to the fake server
+# instead (one port per routing host, so per-host rate limits still apply)
+FAKE_RIOT_API_PORT = int(os.getenv("FAKE_RIOT_API_PORT", "0"))
+
+
+def _fake_url(url: str) -> str:
+    """Rewrite a Riot or Data Dragon URL to the fake server's port for its host."""
+    host = url.split("/")[2]
+    return url.replace(f"https://{host}", f"http://127.0.0.1:{FAKE_RIOT_API_PORT + RIOT_ROUTING_HOSTS.index(host)}", 1)
+
+
+if FAKE_RIOT_API_PORT:
+    PLATFORM_ROUTING = {region: _fake_url(url) for region, url in PLATFORM_ROUTING.items()}
+    REGIONAL_ROUTING = {region: _fake_url(url) for region, url in REGIONAL_ROUTING.items()}
+    DDRAGON_BASE_URL = _fake_url(DDRAGON_BASE_URL)
+
+# Circuit breaker per routing host and endpoint family (e.g. euw1 + league-v4). After
+# CIRCUIT_FAILURE_THRESHOLD 5xx/timeouts/network errors in a row, calls fail fast for
+# CIRCUIT_RECOVERY_TIMEOUT seconds, then a single probe request decides whether it closes
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RECOVERY_TIMEOUT = 30
+
+# While a circuit is open, the last good response (up to this old, in seconds) is served
+# instead of failing; live data like "is this player in game" is never served stale
+CIRCUIT_STALE_TTL = 6 * 3600
+CIRCUIT_NO_STALE_ENDPOINTS = ("spectator-v5.active-game",)
+
+# Workers per Riot routing host: each host has its own request queue, so a slow or
+# rate-limited host (e.g. sea) doesn't hold up requests to the others
+RIOT_HOST_WORKERS = 10
+RIOT_HOST_WORKERS_BY_HOST = {}  # e.g. {"europe.api.riotgames.com": 20}
+
+# Players checked at the same time per region by the monitor loop
+MONITOR_CONCURRENCY_PER_REGION = 10
+
+# Shared HTTP session settings (connection pool, DNS cache, timeouts in seconds)
+HTTP_POOL_SIZE = 100
+HTTP_POOL_SIZE_PER_HOST = 20
+HTTP_DNS_CACHE_TTL = 300
+HTTP_KEEPALIVE_TIMEOUT = 60
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 10
+HTTP_TOTAL_TIMEOUT = 20
+
 # League of Legends branding color for embeds
 EMBED_COLOR = 0x0397AB  # Riot Games blue
 
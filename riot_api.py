@@ -3,50 +3,762 @@ Riot Games API handler for League of Legends data.
 Handles all API requests to Riot Games endpoints.
 """
 
+import asyncio
+import math
+import random
+import time
 import aiohttp
-from typing import Optional, Dict, List, Any
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, List, Any, Tuple
+from urllib.parse import urlsplit, urlunsplit
 import config
+from utils import json_codec, metrics
+from utils.cache import TTLCache
+from utils.circuit_breaker import STATE_VALUES, CircuitBreakers
+from utils.champion_catalog import ChampionCatalog
+from utils.match_store import MatchStore
+from utils.match_summary import MatchSummary
+from utils.host_queue import HostScheduler
+from utils.key_pool import ApiKey, KeyPool
+from utils.rate_limiter import RateLimitWaitExceeded, Reservation
+from utils.riot_id_cache import RiotIdCache, normalize_riot_id
+from utils.swr_cache import SWRCache
 
 
 class RiotAPIError(Exception):
-    """Custom exception for Riot API errors."""
+    """
+    Custom exception for Riot API errors.
+    
+    Attributes:
+        status: HTTP status code, or None if no response was received
+        headers: Rate limit headers from the response (X-*-Rate-Limit*, Retry-After, X-Rate-Limit-Type)
+    """
+    
+    def __init__(self, message: str, status: Optional[int] = None, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class NotFoundError(RiotAPIError):
+    """404 - the player or resource does not exist."""
+    pass
+
+
+class ForbiddenError(RiotAPIError):
+    """403 - the API key is invalid, expired or not allowed to use the endpoint."""
+    pass
+
+
+class RateLimitedError(RiotAPIError):
+    """
+    429 - too many requests.
+    
+    Attributes:
+        retry_after: Seconds Riot asked us to wait (None if not given)
+        limit_type: "application", "method" or "service" (None if not given)
+    """
+    
+    def __init__(self, message: str, status: Optional[int] = None, headers: Optional[Dict[str, str]] = None,
+                 retry_after: Optional[float] = None, limit_type: Optional[str] = None):
+        super().__init__(message, status, headers)
+        self.retry_after = retry_after
+        self.limit_type = limit_type
+
+
+class ServerError(RiotAPIError):
+    """5xx - Riot's servers failed to handle the request."""
     pass
 
 
-async def _make_request(url: str, headers: Dict[str, str]) -> Optional[Dict[str, Any]]:
+class RiotTimeoutError(RiotAPIError):
+    """The request timed out before Riot answered."""
+    pass
+
+
+class NetworkError(RiotAPIError):
+    """The request failed at the connection level."""
+    pass
+
+
+class CircuitOpenError(RiotAPIError):
+    """
+    The host's circuit breaker is open, so the request was not sent.
+    
+    Attributes:
+        retry_after: Seconds until the breaker lets a request through again
+    """
+    
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+# Errors the retry policy may try again
+_RETRYABLE_ERRORS = (RateLimitedError, ServerError, RiotTimeoutError, NetworkError)
+
+# Returned instead of raising when a request 404s, so expected misses (e.g. a
+# player not in game) don't pay for an exception
+NOT_FOUND = object()
+
+# Response headers copied onto RiotAPIError for callers and metrics
+_RATE_LIMIT_HEADERS = (
+    "X-App-Rate-Limit", "X-App-Rate-Limit-Count",
+    "X-Method-Rate-Limit", "X-Method-Rate-Limit-Count",
+    "X-Rate-Limit-Type", "Retry-After",
+)
+
+
+# Shared HTTP session (one per process, created lazily or by start_session())
+_session: Optional[aiohttp.ClientSession] = None
+
+# API keys, each with its own rate limiter (buckets per routing host and endpoint)
+key_pool = KeyPool(config.RIOT_API_KEYS, config.RIOT_APP_RATE_LIMITS)
+
+# Request queue and workers per routing host
+host_scheduler = HostScheduler(config.RIOT_HOST_WORKERS, config.RIOT_HOST_WORKERS_BY_HOST)
+
+# Response cache keyed by normalized URL, TTL chosen per endpoint
+response_cache = TTLCache(config.RIOT_CACHE_MAX_ENTRIES)
+
+# Last good response per URL, served while the host's circuit is open
+stale_cache = TTLCache(config.RIOT_CACHE_MAX_ENTRIES)
+stale_served: Dict[str, int] = {}
+
+# Short-lived cache of 404s and empty results, with calls saved per endpoint
+negative_cache = TTLCache(config.NEGATIVE_CACHE_MAX_ENTRIES)
+negative_cache_saved: Dict[str, int] = {}
+
+# Persistent store for finished match details (opened on first use)
+match_store = MatchStore(config.MATCH_STORE_FILE, config.MATCH_STORE_MAX_BYTES)
+
+# Compact summaries of recently used matches, keyed by match ID
+match_summaries = TTLCache(config.MATCH_SUMMARY_CACHE_MAX_ENTRIES)
+
+# Persistent Riot ID -> PUUID/summoner resolutions, and revalidations in progress
+riot_id_cache = RiotIdCache(config.RIOT_ID_CACHE_FILE)
+_riot_id_revalidations: Dict[str, asyncio.Task] = {}
+
+# Free rotation and Clash schedule, served stale-while-revalidate and kept on disk
+swr_cache = SWRCache(config.SWR_CACHE_DIR)
+
+# Champion catalog (champion.json) shared by every command
+champion_catalog = ChampionCatalog(config.CHAMPION_CACHE_DIR)
+_catalog_load_task: Optional[asyncio.Task] = None
+
+
+def _create_session() -> aiohttp.ClientSession:
+    """
+    Build the long-lived HTTP session used for every Riot and Data Dragon call.
+    
+    The connector keeps connections alive and pools them per host, so the
+    platform (e.g. eun1) and regional (e.g. europe) routing hosts each keep
+    their own warm TLS connections, and DNS answers are cached.
+    
+    Returns:
+        A new aiohttp ClientSession
+    """
+    connector = aiohttp.TCPConnector(
+        limit=config.HTTP_POOL_SIZE,
+        limit_per_host=config.HTTP_POOL_SIZE_PER_HOST,
+        ttl_dns_cache=config.HTTP_DNS_CACHE_TTL,
+        keepalive_timeout=config.HTTP_KEEPALIVE_TIMEOUT,
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=config.HTTP_TOTAL_TIMEOUT,
+        connect=config.HTTP_CONNECT_TIMEOUT,
+        sock_read=config.HTTP_READ_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+async def start_session() -> aiohttp.ClientSession:
+    """
+    Open the shared HTTP session if it is not already open.
+    Called from RiotBot.setup_hook so the pool is ready before commands run.
+    
+    Returns:
+        The shared aiohttp ClientSession
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = _create_session()
+    return _session
+
+
+async def close_session():
+    """Stop the host queues and close the shared HTTP session and the on-disk stores."""
+    global _session
+    await host_scheduler.close()
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    match_store.close()
+    riot_id_cache.close()
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, opening it on first use."""
+    if _session is None or _session.closed:
+        return await start_session()
+    return _session
+
+
+# Retry counters, exposed through get_retry_stats() for tuning
+retry_stats = {
+    "requests": 0,
+    "retries": 0,
+    "retries_by_reason": {},
+    "wait_seconds": 0.0,
+    "gave_up": 0,
+}
+
+
+def get_retry_stats() -> Dict[str, Any]:
+    """
+    Get a snapshot of the retry counters.
+    
+    Returns:
+        Dictionary with total requests, retries (overall and per reason),
+        seconds spent waiting between attempts and requests that gave up
+    """
+    return {**retry_stats, "retries_by_reason": dict(retry_stats["retries_by_reason"])}
+
+
+def _retry_reason(error: RiotAPIError) -> str:
+    """Name used in the retry counters for a retryable error."""
+    if isinstance(error, RateLimitedError):
+        return f"rate_limit_{error.limit_type or 'service'}"
+    if isinstance(error, ServerError):
+        return "server_error"
+    if isinstance(error, RiotTimeoutError):
+        return "timeout"
+    return "network"
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt (0-based)."""
+    ceiling = min(config.RIOT_RETRY_MAX_DELAY, config.RIOT_RETRY_BASE_DELAY * (2 ** attempt))
+    return random.uniform(0, ceiling)
+
+
+# Per-endpoint request metrics (one sample per HTTP attempt, retries included)
+request_count = metrics.registry.counter(
+    "riot_requests_total", "HTTP requests sent to Riot by endpoint and status (or timeout/network_error)",
+    ("endpoint", "status")
+)
+request_latency = metrics.registry.histogram(
+    "riot_request_duration_seconds", "Riot HTTP request latency, excluding rate limiter waits", ("endpoint",)
+)
+
+circuit_transitions = metrics.registry.counter(
+    "riot_circuit_transitions_total", "Circuit breaker state changes by host, endpoint family and new state",
+    ("host", "family", "state")
+)
+
+# Circuit breaker per (routing host, endpoint family)
+circuit_breakers = CircuitBreakers(
+    config.CIRCUIT_FAILURE_THRESHOLD, config.CIRCUIT_RECOVERY_TIMEOUT,
+    lambda breaker, old, new: circuit_transitions.inc(breaker.host, breaker.family, new)
+)
+
+
+def _endpoint_family(endpoint: str) -> str:
+    """API family of an endpoint name (e.g. "league-v4.entries-by-puuid" -> "league-v4")."""
+    return endpoint.split(".", 1)[0]
+
+
+def _check_circuit(host: str, family: str):
+    """
+    Fail fast if the circuit for (host, family) is open.
+    
+    Raises:
+        CircuitOpenError: If the breaker doesn't allow a request right now
+    """
+    breaker = circuit_breakers.get(host, family)
+    if not breaker.allow():
+        retry_after = breaker.retry_in()
+        raise CircuitOpenError(
+            f"Riot API is unavailable right now ({breaker.name}), try again in {retry_after:.0f}s", retry_after
+        )
+
+
+def _record_circuit(host: str, family: str, outcome: str):
+    """Feed a request outcome ("200", "503", "timeout", ...) to the host's breaker."""
+    breaker = circuit_breakers.get(host, family)
+    if outcome in ("timeout", "network_error") or (outcome.isdigit() and int(outcome) >= 500):
+        breaker.record_failure()
+    elif outcome.isdigit():
+        breaker.record_success()
+
+
+async def _reserve_key(host: str, endpoint: str, max_wait: float) -> Tuple[ApiKey, Reservation]:
+    """
+    Pick the key that has the most room for (host, endpoint) and wait for
+    its rate limiter to reserve a slot.
+    
+    Args:
+        host: Routing host
+        endpoint: Endpoint name
+        max_wait: Seconds left in the caller's deadline
+    
+    Returns:
+        The key to send the request with, and its reserved slot
+        
+    Raises:
+        ForbiddenError: If every key is disabled
+        RateLimitedError: If no slot frees up before the deadline
+    """
+    api_key = key_pool.choose(host, endpoint)
+    if api_key is None:
+        raise ForbiddenError("No Riot API key available", 403)
+    try:
+        reservation = await api_key.limiter.acquire(host, endpoint, max_wait)
+    except RateLimitWaitExceeded as e:
+        raise RateLimitedError(
+            f"Rate limit exceeded. Please try again in {max(1, math.ceil(e.retry_after))} seconds",
+            retry_after=e.retry_after
+        )
+    api_key.requests += 1
+    return api_key, reservation
+
+
+async def _send_request(url: str, host: str, endpoint: str, api_key: ApiKey, reservation: Reservation) -> Any:
+    """
+    Send a single GET attempt with a key whose rate limit slot is already
+    reserved (see _reserve_key). The slot is timestamped when the answer
+    arrives, which is after Riot counted the request.
+    
+    Returns:
+        The parsed JSON body, or NOT_FOUND for a 404
+        
+    Raises:
+        RateLimitedError, ServerError, RiotTimeoutError, NetworkError: Retryable failures
+        ForbiddenError, RiotAPIError: Any other failure
+    """
+    rate_limiter = api_key.limiter
+    # Set before the first await: from here on the slot is only given back by complete()
+    reservation.sent = True
+    session = await _get_session()
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        async with session.get(url, headers={"X-Riot-Token": api_key.token}) as response:
+            # Completed before the headers are read so the -Count sync sees this request
+            rate_limiter.complete(reservation)
+            rate_limiter.update(host, endpoint, response.headers)
+            status = response.status
+            outcome = str(status)
+            
+            if status == 200:
+                return json_codec.loads(await response.read())
+            elif status == 404:
+                return NOT_FOUND
+            
+            error_headers = {name: response.headers[name] for name in _RATE_LIMIT_HEADERS if name in response.headers}
+            if status == 403:
+                api_key.forbidden += 1
+                key_pool.disable(api_key, f"403 Forbidden from {endpoint}", config.RIOT_KEY_DISABLE_SECONDS)
+                raise ForbiddenError("Invalid API key or forbidden access", status, error_headers)
+            elif status == 429:
+                limit_type = response.headers.get("X-Rate-Limit-Type")
+                retry_after = response.headers.get("Retry-After")
+                retry_after = float(retry_after) if retry_after else None
+                
+                if limit_type in ("application", "method"):
+                    # Our own quota ran out: hold back every queued call until Riot allows it again
+                    rate_limiter.penalize(host, endpoint, retry_after or 1, limit_type)
+                else:
+                    # Service-level limit on Riot's side, not counted against our key
+                    limit_type = "service"
+                
+                message = "Rate limit exceeded. Please try again later"
+                if retry_after:
+                    message = f"Rate limit exceeded. Please try again in {retry_after:g} seconds"
+                raise RateLimitedError(message, status, error_headers, retry_after, limit_type)
+            elif status >= 500:
+                raise ServerError(f"API request failed with status {status}", status, error_headers)
+            else:
+                raise RiotAPIError(f"API request failed with status {status}", status, error_headers)
+    except aiohttp.ClientError as e:
+        outcome = "network_error"
+        raise NetworkError(f"Network error: {str(e)}")
+    except asyncio.TimeoutError:
+        outcome = "timeout"
+        raise RiotTimeoutError("Request timed out")
+    finally:
+        # No answer (timeout, network error): Riot may still have counted it
+        rate_limiter.complete(reservation)
+        request_latency.observe(time.perf_counter() - started, endpoint)
+        request_count.inc(endpoint, outcome)
+        _record_circuit(host, _endpoint_family(endpoint), outcome)
+
+
+async def _fetch_with_retries(url: str, endpoint: str, deadline: Optional[float]) -> Optional[Dict[str, Any]]:
+    """
+    Fetch a URL, retrying 429s (honouring Retry-After) and 5xx/network
+    errors (with jittered backoff) until the retry budget or the deadline runs out.
+    A 403 disables the key that got it and is retried at once with another key.
+    Each attempt reserves a rate limit slot first, then waits its turn in the
+    routing host's queue (see utils.host_queue), so a throttled endpoint never
+    holds a worker that other endpoints on the host need. Both waits count
+    against the deadline: a slot that only frees up after it raises
+    RateLimitedError instead of sleeping. Attempts fail fast with
+    CircuitOpenError while the host's circuit is open.
+    
+    Returns:
+        The parsed JSON body, or NOT_FOUND for a 404
+        
+    Raises:
+        RiotAPIError: If the request still fails after retrying
+    """
+    host = urlsplit(url).netloc
+    if deadline is None:
+        deadline = config.RIOT_REQUEST_DEADLINE
+    deadline_at = time.monotonic() + deadline
+    retry_stats["requests"] += 1
+    
+    family = _endpoint_family(endpoint)
+    attempt = 0
+    forbidden_retries = 0
+    while True:
+        _check_circuit(host, family)
+        try:
+            api_key, reservation = await _reserve_key(host, endpoint, deadline_at - time.monotonic())
+            try:
+                return await asyncio.wait_for(
+                    host_scheduler.run(host, lambda: _send_request(url, host, endpoint, api_key, reservation)),
+                    max(deadline_at - time.monotonic(), 0)
+                )
+            except asyncio.TimeoutError:
+                # Only the deadline lands here (_send_request turns HTTP timeouts into RiotTimeoutError)
+                raise RiotTimeoutError("Request deadline exceeded")
+            finally:
+                # Give the slot back if the job never left the host queue (no-op once it was sent)
+                api_key.limiter.cancel(reservation)
+        except ForbiddenError:
+            # At most len(keys) - 1 keys can be disabled, so this ends
+            if forbidden_retries < len(key_pool.keys) - 1 and key_pool.available():
+                forbidden_retries += 1
+                continue
+            raise
+        except _RETRYABLE_ERRORS as e:
+            if isinstance(e, ServerError) and e.status not in config.RIOT_RETRY_STATUSES:
+                raise
+            
+            if isinstance(e, RateLimitedError) and e.limit_type in ("application", "method"):
+                # Only the key that hit its limit is blocked; another key may be free right away
+                delay = key_pool.wait_time(host, endpoint)
+            else:
+                retry_after = e.retry_after if isinstance(e, RateLimitedError) else None
+                delay = retry_after if retry_after is not None else _backoff_delay(attempt)
+            
+            if attempt >= config.RIOT_MAX_RETRIES or time.monotonic() + delay > deadline_at:
+                retry_stats["gave_up"] += 1
+                raise
+            
+            reason = _retry_reason(e)
+            attempt += 1
+            retry_stats["retries"] += 1
+            retry_stats["retries_by_reason"][reason] = retry_stats["retries_by_reason"].get(reason, 0) + 1
+            retry_stats["wait_seconds"] += delay
+            print(f"[Riot API] {endpoint} failed ({reason}), retry {attempt}/{config.RIOT_MAX_RETRIES} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+
+# Requests currently on the wire, keyed by normalized URL (single-flight)
+_inflight: Dict[str, asyncio.Task] = {}
+
+# Counters for the single-flight layer: requests actually sent vs. callers that shared one
+singleflight_stats = {"issued": 0, "coalesced": 0}
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Normalize a URL so equivalent requests share a single-flight key.
+    Lowercases the scheme and host and sorts the query parameters.
+    """
+    parts = urlsplit(url)
+    query = "&".join(sorted(parts.query.split("&"))) if parts.query else ""
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def _forget_inflight(key: str, task: asyncio.Task):
+    """Drop a finished request from the in-flight table and mark its result as retrieved."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def _single_flight(key: str, fetch):
+    """
+    Run fetch() once per key at a time; concurrent callers await the same task.
+    
+    Args:
+        key: Normalized request key
+        fetch: Zero-argument callable returning the coroutine to run
+        
+    Returns:
+        The shared result of fetch()
+    """
+    task = _inflight.get(key)
+    
+    if task is None:
+        singleflight_stats["issued"] += 1
+        task = asyncio.ensure_future(fetch())
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _forget_inflight(key, t))
+    else:
+        singleflight_stats["coalesced"] += 1
+    
+    # Shield so one caller giving up doesn't cancel the request for the others
+    return await asyncio.shield(task)
+
+
+def _seconds_until_rotation_reset() -> float:
+    """Seconds until the next weekly free champion rotation reset."""
+    now = datetime.now(timezone.utc)
+    reset = now.replace(hour=config.ROTATION_RESET_HOUR_UTC, minute=0, second=0, microsecond=0)
+    reset += timedelta(days=(config.ROTATION_RESET_WEEKDAY - now.weekday()) % 7)
+    if reset <= now:
+        reset += timedelta(days=7)
+    return (reset - now).total_seconds()
+
+
+def _cache_ttl(endpoint: str) -> float:
+    """Time-to-live in seconds for a cached response from the given endpoint."""
+    return config.RIOT_CACHE_TTLS.get(endpoint, 0)
+
+
+async def _make_request(url: str, endpoint: str = "default",
+                        deadline: Optional[float] = None, use_cache: bool = True,
+                        allow_not_found: bool = False) -> Optional[Dict[str, Any]]:
     """
     Make an async HTTP GET request to the Riot API.
+    Responses are cached per endpoint TTL (see config.RIOT_CACHE_TTLS).
+    Concurrent callers for the same URL share one in-flight request and get
+    the same result (or exception). The request waits for the rate limiter
+    and is retried on 429/5xx/network errors.
     
     Args:
         url: The full API endpoint URL
-        headers: Request headers including API key
+        endpoint: Endpoint name used for rate limit buckets and cache TTLs
+        deadline: Seconds this call may take in total, including retries
+                  (defaults to config.RIOT_REQUEST_DEADLINE)
+        use_cache: If False, skip the response cache lookup and fetch fresh
+                   data (the fresh response still refreshes the cache). Recent
+                   misses are still served from the negative cache, which is
+                   short-lived and where polling callers save the most requests
+        allow_not_found: If True, a 404 returns None instead of raising
+                         NotFoundError (for expected misses like "not in game")
         
     Returns:
-        JSON response as dictionary or None if error
+        JSON response as dictionary, or None for an allowed 404 (shared
+        between callers, so treat it as read-only)
         
     Raises:
-        RiotAPIError: If the API request fails
+        NotFoundError: 404 (unless allow_not_found)
+        ForbiddenError, RateLimitedError, ServerError, RiotTimeoutError,
+        NetworkError, RiotAPIError: If the API request fails
+        CircuitOpenError: If the host's circuit is open and there is no stale copy to serve
     """
-    async with aiohttp.ClientSession() as session:
+    key = _normalize_url(url)
+    negative_ttl = config.NEGATIVE_CACHE_TTLS.get(endpoint, 0)
+    
+    result = None
+    hit = False
+    if use_cache:
+        hit, result = response_cache.get(key)
+    if not hit and negative_ttl:
+        hit, result = negative_cache.get(key)
+        if hit:
+            negative_cache_saved[endpoint] = negative_cache_saved.get(endpoint, 0) + 1
+    
+    if not hit:
         try:
-            async with session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 404:
-                    raise RiotAPIError("Player or data not found")
-                elif response.status == 403:
-                    raise RiotAPIError("Invalid API key or forbidden access")
-                elif response.status == 429:
-                    raise RiotAPIError("Rate limit exceeded. Please try again later")
-                else:
-                    raise RiotAPIError(f"API request failed with status {response.status}")
-        except aiohttp.ClientError as e:
-            raise RiotAPIError(f"Network error: {str(e)}")
+            result = await _single_flight(
+                key,
+                lambda: _fetch_with_retries(url, endpoint, deadline)
+            )
+        except CircuitOpenError:
+            # Riot is down for this host: fall back to the last good response if we have one
+            if endpoint in config.CIRCUIT_NO_STALE_ENDPOINTS:
+                raise
+            hit, result = stale_cache.get(key)
+            if not hit:
+                raise
+            stale_served[endpoint] = stale_served.get(endpoint, 0) + 1
+        else:
+            _store_response(key, endpoint, result, negative_ttl)
+    
+    if result is NOT_FOUND:
+        if allow_not_found:
+            return None
+        raise NotFoundError("Player or data not found", 404)
+    return result
+
+
+def _store_response(key: str, endpoint: str, result: Any, negative_ttl: float):
+    """Cache a fresh response: 404s and empty lists in the negative cache, the rest per endpoint TTL."""
+    if result is NOT_FOUND or (negative_ttl and result == []):
+        # Misses (unknown player, not in game, no matches played) get the short negative TTL
+        negative_cache.set(key, result, negative_ttl)
+    else:
+        ttl = _cache_ttl(endpoint)
+        response_cache.set(key, result, ttl)
+        if ttl > 0 and endpoint not in config.CIRCUIT_NO_STALE_ENDPOINTS:
+            stale_cache.set(key, result, config.CIRCUIT_STALE_TTL)
+
+
+def get_negative_cache_stats() -> Dict[str, Any]:
+    """
+    Get negative cache statistics.
+    
+    Returns:
+        Cache statistics plus "saved_by_endpoint", the number of Riot calls
+        avoided per endpoint by answering from the negative cache
+    """
+    return {**negative_cache.stats(), "saved_by_endpoint": dict(negative_cache_saved)}
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get response cache statistics.
+    
+    Returns:
+        Dictionary with size, hits, misses, evictions, expirations and hit ratio
+    """
+    return response_cache.stats()
+
+
+def get_singleflight_stats() -> Dict[str, int]:
+    """
+    Get the single-flight counters.
+    
+    Returns:
+        Dictionary with "issued" (requests sent) and "coalesced" (callers
+        that joined a request already in flight)
+    """
+    return dict(singleflight_stats)
+
+
+def get_all_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get hit/miss statistics for every cache layer.
+    
+    Returns:
+        Statistics keyed by cache name ("response", "negative", "stale", "swr", "match_summary",
+        "match_store", "riot_id"); each has at least hits and misses
+    """
+    return {
+        "response": response_cache.stats(),
+        "negative": negative_cache.stats(),
+        "stale": stale_cache.stats(),
+        "swr": swr_cache.stats(),
+        "match_summary": match_summaries.stats(),
+        "match_store": match_store.stats(),
+        "riot_id": riot_id_cache.stats(),
+    }
+
+
+def _cache_metric(field: str) -> Dict[tuple, float]:
+    """One statistic of every cache layer, for the metrics endpoint."""
+    samples = {}
+    for name, stats in get_all_cache_stats().items():
+        if field == "hit_ratio":
+            total = stats["hits"] + stats["misses"]
+            samples[(name,)] = stats["hits"] / total if total else 0.0
+        else:
+            samples[(name,)] = stats[field]
+    return samples
+
+
+def _rate_limit_metric(field: str) -> Dict[tuple, float]:
+    """Rate limit usage per key, host, scope (application or endpoint) and window, for the metrics endpoint."""
+    samples = {}
+    for key_name, host, scope, window, used, limit in key_pool.usage():
+        labels = (key_name, host, scope, str(window))
+        if field == "used":
+            samples[labels] = used
+        elif field == "limit":
+            samples[labels] = limit
+        else:
+            samples[labels] = max(0.0, 1 - used / limit) if limit else 0.0
+    return samples
+
+
+def _key_metric(field: str) -> Dict[tuple, float]:
+    """Per-key health for the metrics endpoint."""
+    return {(name,): float(stats[field]) for name, stats in key_pool.stats().items()}
+
+
+def _circuit_metric(field: str) -> Dict[tuple, float]:
+    """Per-breaker state or rejection count for the metrics endpoint."""
+    samples = {}
+    for key, stats in circuit_breakers.stats().items():
+        samples[key] = STATE_VALUES[stats["state"]] if field == "state" else stats[field]
+    return samples
+
+
+def _host_queue_metric(field: str) -> Dict[tuple, float]:
+    """Per-host queue stats for the metrics endpoint."""
+    return {(host,): float(stats[field]) for host, stats in host_scheduler.stats().items()}
+
+
+_LIMIT_LABELS = ("key", "host", "scope", "window")
+metrics.registry.callback("riot_rate_limit_used", "Requests counted in each rate limit window",
+                          _LIMIT_LABELS, lambda: _rate_limit_metric("used"))
+metrics.registry.callback("riot_rate_limit_limit", "Size of each rate limit window",
+                          _LIMIT_LABELS, lambda: _rate_limit_metric("limit"))
+metrics.registry.callback("riot_rate_limit_headroom_ratio", "Fraction of each rate limit window still free",
+                          _LIMIT_LABELS, lambda: _rate_limit_metric("headroom"))
+metrics.registry.callback("riot_rate_limit_wait_seconds_total", "Time spent waiting for the rate limiter",
+                          (), lambda: {(): key_pool.total_wait}, kind="counter")
+metrics.registry.callback("riot_rate_limit_throttled_total", "Requests that had to wait for the rate limiter",
+                          (), lambda: {(): key_pool.throttled_requests}, kind="counter")
+metrics.registry.callback("riot_api_key_enabled", "Whether each API key is in rotation (0 after a 403)",
+                          ("key",), lambda: _key_metric("enabled"))
+metrics.registry.callback("riot_api_key_requests_total", "Requests sent with each API key",
+                          ("key",), lambda: _key_metric("requests"), kind="counter")
+metrics.registry.callback("riot_api_key_forbidden_total", "403 responses per API key",
+                          ("key",), lambda: _key_metric("forbidden"), kind="counter")
+metrics.registry.callback("riot_host_queue_depth", "Requests waiting for a worker per routing host",
+                          ("host",), lambda: _host_queue_metric("queued"))
+metrics.registry.callback("riot_host_active_requests", "Requests being sent per routing host",
+                          ("host",), lambda: _host_queue_metric("active"))
+metrics.registry.callback("riot_host_queue_wait_seconds_total", "Time requests spent queued per routing host",
+                          ("host",), lambda: _host_queue_metric("wait_seconds"), kind="counter")
+metrics.registry.callback("riot_circuit_state", "Circuit breaker state (0 closed, 1 half-open, 2 open)",
+                          ("host", "family"), lambda: _circuit_metric("state"))
+metrics.registry.callback("riot_circuit_rejected_total", "Requests failed fast by an open circuit",
+                          ("host", "family"), lambda: _circuit_metric("rejected"), kind="counter")
+metrics.registry.callback("riot_stale_served_total", "Stale responses served while a circuit was open",
+                          ("endpoint",), lambda: {(endpoint,): count for endpoint, count in stale_served.items()},
+                          kind="counter")
+metrics.registry.callback("riot_cache_hits_total", "Cache hits per cache layer",
+                          ("cache",), lambda: _cache_metric("hits"), kind="counter")
+metrics.registry.callback("riot_cache_misses_total", "Cache misses per cache layer",
+                          ("cache",), lambda: _cache_metric("misses"), kind="counter")
+metrics.registry.callback("riot_cache_hit_ratio", "Cache hit ratio per cache layer",
+                          ("cache",), lambda: _cache_metric("hit_ratio"))
+metrics.registry.callback("riot_retries_total", "Retried Riot requests by reason",
+                          ("reason",), lambda: {(r,): n for r, n in retry_stats["retries_by_reason"].items()},
+                          kind="counter")
+metrics.registry.callback("riot_retry_gave_up_total", "Riot requests that failed after exhausting retries",
+                          (), lambda: {(): retry_stats["gave_up"]}, kind="counter")
+metrics.registry.callback("riot_singleflight_total", "Riot calls sent (issued) or shared with one in flight (coalesced)",
+                          ("result",), lambda: {(k,): v for k, v in singleflight_stats.items()}, kind="counter")
+metrics.registry.callback("riot_negative_cache_saved_total", "Riot calls answered from the negative cache",
+                          ("endpoint",), lambda: {(k,): v for k, v in negative_cache_saved.items()}, kind="counter")
 
 
 async def get_summoner_by_riot_id(game_name: str, tag_line: str, region: str = config.DEFAULT_REGION) -> Dict[str, Any]:
     """
     Fetch summoner data by Riot ID (game_name#tag_line).
+    Resolutions are kept in a persistent cache; entries older than
+    config.RIOT_ID_REVALIDATE_AFTER are returned immediately and
+    revalidated in the background.
     
     Args:
         game_name: The player's in-game name
@@ -60,21 +772,36 @@ async def get_summoner_by_riot_id(game_name: str, tag_line: str, region: str = c
         RiotAPIError: If the API request fails
     """
     region_lower = region.lower()
+    if region_lower not in config.REGIONAL_ROUTING:
+        raise RiotAPIError(f"Invalid region: {region}")
+    
+    riot_id = normalize_riot_id(game_name, tag_line, region_lower)
+    cached = await asyncio.to_thread(riot_id_cache.get, riot_id)
+    
+    if cached is not None:
+        summoner_data, resolved_at = cached
+        if time.time() - resolved_at > config.RIOT_ID_REVALIDATE_AFTER:
+            _start_riot_id_revalidation(riot_id, game_name, tag_line, region_lower)
+        return summoner_data
     
+    summoner_data = await _resolve_riot_id(game_name, tag_line, region_lower)
+    await asyncio.to_thread(riot_id_cache.put, riot_id, summoner_data)
+    return summoner_data
+
+
+async def _resolve_riot_id(game_name: str, tag_line: str, region_lower: str, use_cache: bool = True,
+                           deadline: Optional[float] = None) -> Dict[str, Any]:
+    """Resolve a Riot ID through account-v1 and summoner-v4."""
     # First, get the account data using the Account-V1 endpoint
     regional_url = config.REGIONAL_ROUTING.get(region_lower)
-    if not regional_url:
-        raise RiotAPIError(f"Invalid region: {region}")
-    
     url = f"{regional_url}/riot/account/v1/accounts/by-riot-id/{game_name}/{tag_line}"
-    headers = {"X-Riot-Token": config.RIOT_API_KEY}
     
-    account_data = await _make_request(url, headers)
+    account_data = await _make_request(url, "account-v1.by-riot-id", deadline=deadline, use_cache=use_cache)
     
     # Then get summoner data using puuid
     platform_url = config.PLATFORM_ROUTING.get(region_lower)
     summoner_url = f"{platform_url}/lol/summoner/v4/summoners/by-puuid/{account_data['puuid']}"
-    summoner_data = await _make_request(summoner_url, headers)
+    summoner_data = await _make_request(summoner_url, "summoner-v4.by-puuid", deadline=deadline, use_cache=use_cache)
     
     # Combine both data sets
     return {
@@ -84,13 +811,47 @@ async def get_summoner_by_riot_id(game_name: str, tag_line: str, region: str = c
     }
 
 
-async def get_summoner_rank(puuid: str, region: str = config.DEFAULT_REGION) -> List[Dict[str, Any]]:
+def _start_riot_id_revalidation(riot_id: str, game_name: str, tag_line: str, region_lower: str):
+    """Refresh a cached Riot ID resolution in the background (once at a time per Riot ID)."""
+    task = _riot_id_revalidations.get(riot_id)
+    if task is not None and not task.done():
+        return
+    
+    _riot_id_revalidations[riot_id] = asyncio.ensure_future(
+        _revalidate_riot_id(riot_id, game_name, tag_line, region_lower)
+    )
+
+
+async def _revalidate_riot_id(riot_id: str, game_name: str, tag_line: str, region_lower: str):
+    """
+    Re-resolve a cached Riot ID. If the name now belongs to a different
+    PUUID, the new resolution replaces the old one (and put() drops any
+    other name still pointing at the new PUUID); if it no longer exists,
+    the entry is removed.
+    """
+    try:
+        summoner_data = await _resolve_riot_id(game_name, tag_line, region_lower, use_cache=False,
+                                               deadline=config.RIOT_BACKGROUND_DEADLINE)
+        await asyncio.to_thread(riot_id_cache.put, riot_id, summoner_data)
+    except NotFoundError:
+        # The Riot ID no longer exists (renamed away), so stop serving the old PUUID
+        await asyncio.to_thread(riot_id_cache.delete, riot_id)
+    except RiotAPIError as e:
+        print(f"[Riot API] Could not revalidate {game_name}#{tag_line}: {e}")
+    finally:
+        _riot_id_revalidations.pop(riot_id, None)
+
+
+async def get_summoner_rank(puuid: str, region: str = config.DEFAULT_REGION, use_cache: bool = True,
+                            deadline: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     Fetch ranked data for a summoner.
     
     Args:
         puuid: The player's PUUID
         region: Platform region code
+        use_cache: If False, bypass the response cache and fetch fresh data
+        deadline: Seconds the call may take (defaults to config.RIOT_REQUEST_DEADLINE)
         
     Returns:
         List of ranked queue data (solo/duo, flex, etc.)
@@ -105,11 +866,11 @@ async def get_summoner_rank(puuid: str, region: str = config.DEFAULT_REGION) ->
     
     # Use the new PUUID-based endpoint (no need for summoner ID!)
     url = f"{platform_url}/lol/league/v4/entries/by-puuid/{puuid}"
-    headers = {"X-Riot-Token": config.RIOT_API_KEY}
-    return await _make_request(url, headers)
+    return await _make_request(url, "league-v4.entries-by-puuid", deadline=deadline, use_cache=use_cache)
 
 
-async def get_match_history(puuid: str, region: str = config.DEFAULT_REGION, count: int = 5) -> List[str]:
+async def get_match_history(puuid: str, region: str = config.DEFAULT_REGION, count: int = 5,
+                            use_cache: bool = True, deadline: Optional[float] = None) -> List[str]:
     """
     Fetch recent match IDs for a summoner.
     
@@ -117,6 +878,8 @@ async def get_match_history(puuid: str, region: str = config.DEFAULT_REGION, cou
         puuid: The player's PUUID
         region: Platform region code
         count: Number of matches to fetch (default 5)
+        use_cache: If False, bypass the response cache and fetch fresh data
+        deadline: Seconds the call may take (defaults to config.RIOT_REQUEST_DEADLINE)
         
     Returns:
         List of match IDs
@@ -130,18 +893,21 @@ async def get_match_history(puuid: str, region: str = config.DEFAULT_REGION, cou
         raise RiotAPIError(f"Invalid region: {region}")
     
     url = f"{regional_url}/lol/match/v5/matches/by-puuid/{puuid}/ids?start=0&count={count}"
-    headers = {"X-Riot-Token": config.RIOT_API_KEY}
     
-    return await _make_request(url, headers)
+    return await _make_request(url, "match-v5.ids-by-puuid", deadline=deadline, use_cache=use_cache)
 
 
-async def get_match_details(match_id: str, region: str = config.DEFAULT_REGION) -> Dict[str, Any]:
+async def get_match_details(match_id: str, region: str = config.DEFAULT_REGION,
+                            deadline: Optional[float] = None) -> Dict[str, Any]:
     """
     Fetch detailed information about a specific match.
+    Finished matches never change, so they are served from the on-disk
+    match store when available and saved there after the first download.
     
     Args:
         match_id: The match ID
         region: Platform region code
+        deadline: Seconds the call may take (defaults to config.RIOT_REQUEST_DEADLINE)
         
     Returns:
         Dictionary containing match details
@@ -154,10 +920,70 @@ async def get_match_details(match_id: str, region: str = config.DEFAULT_REGION)
     if not regional_url:
         raise RiotAPIError(f"Invalid region: {region}")
     
+    stored = await asyncio.to_thread(match_store.get, match_id)
+    if stored is not None:
+        return stored
+    
     url = f"{regional_url}/lol/match/v5/matches/{match_id}"
-    headers = {"X-Riot-Token": config.RIOT_API_KEY}
     
-    return await _make_request(url, headers)
+    match_data = await _make_request(url, "match-v5.match", deadline=deadline)
+    await asyncio.to_thread(match_store.put, match_id, match_data)
+    return match_data
+
+
+async def get_match_summary(match_id: str, region: str = config.DEFAULT_REGION,
+                            deadline: Optional[float] = None) -> MatchSummary:
+    """
+    Get the compact summary of a match (what the commands and tracker display).
+    Summaries are kept in memory; the full match JSON is only loaded, from the
+    match store or Riot, when a summary isn't cached.
+    
+    Args:
+        match_id: The match ID
+        region: Platform region code
+        deadline: Seconds the call may take (defaults to config.RIOT_REQUEST_DEADLINE)
+        
+    Returns:
+        The match summary
+        
+    Raises:
+        RiotAPIError: If the API request fails
+    """
+    hit, summary = match_summaries.get(match_id)
+    if hit:
+        return summary
+    
+    summary = MatchSummary.from_json(await get_match_details(match_id, region, deadline))
+    match_summaries.set(match_id, summary, config.MATCH_SUMMARY_CACHE_TTL)
+    return summary
+
+
+async def get_match_summaries_batch(match_ids: List[str], region: str = config.DEFAULT_REGION,
+                                    max_concurrency: int = config.MATCH_FETCH_CONCURRENCY) -> List[Any]:
+    """
+    Fetch summaries for several matches concurrently.
+    
+    Args:
+        match_ids: The match IDs to fetch
+        region: Platform region code
+        max_concurrency: Maximum number of matches fetched at the same time
+        
+    Returns:
+        One entry per match ID, in the same order: the MatchSummary,
+        or the RiotAPIError raised for that match
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def fetch(match_id: str):
+        async with semaphore:
+            try:
+                return await get_match_summary(match_id, region)
+            except RiotAPIError as e:
+                return e
+            except Exception as e:
+                return RiotAPIError(f"Failed to load match {match_id}: {str(e)}")
+    
+    return await asyncio.gather(*(fetch(match_id) for match_id in match_ids))
 
 
 async def get_champion_mastery(puuid: str, region: str = config.DEFAULT_REGION, count: int = 5) -> List[Dict[str, Any]]:
@@ -181,14 +1007,15 @@ async def get_champion_mastery(puuid: str, region: str = config.DEFAULT_REGION,
         raise RiotAPIError(f"Invalid region: {region}")
     
     url = f"{platform_url}/lol/champion-mastery/v4/champion-masteries/by-puuid/{puuid}/top?count={count}"
-    headers = {"X-Riot-Token": config.RIOT_API_KEY}
     
-    return await _make_request(url, headers)
+    return await _make_request(url, "champion-mastery-v4.top")
 
 
 async def get_champion_rotation(region: str = config.DEFAULT_REGION) -> Dict[str, Any]:
     """
     Fetch current free champion rotation.
+    Answered from the stale-while-revalidate cache (see config.SWR_TTLS);
+    a copy fetched before the last weekly reset is refreshed in the background.
     
     Args:
         region: Platform region code
@@ -197,7 +1024,7 @@ async def get_champion_rotation(region: str = config.DEFAULT_REGION) -> Dict[str
         Dictionary containing free champion IDs
         
     Raises:
-        RiotAPIError: If the API request fails
+        RiotAPIError: If the API request fails and no usable copy is cached
     """
     region_lower = region.lower()
     platform_url = config.PLATFORM_ROUTING.get(region_lower)
@@ -205,18 +1032,26 @@ async def get_champion_rotation(region: str = config.DEFAULT_REGION) -> Dict[str
         raise RiotAPIError(f"Invalid region: {region}")
     
     url = f"{platform_url}/lol/platform/v3/champion-rotations"
-    headers = {"X-Riot-Token": config.RIOT_API_KEY}
     
-    return await _make_request(url, headers)
+    soft_ttl, hard_ttl = config.SWR_TTLS["champion-v3.rotations"]
+    seconds_since_reset = 7 * 24 * 3600 - _seconds_until_rotation_reset()
+    return await swr_cache.get(
+        f"rotation-{region_lower}",
+        lambda: _make_request(url, "champion-v3.rotations", use_cache=False),
+        min(soft_ttl, seconds_since_reset), hard_ttl
+    )
 
 
-async def get_active_game(puuid: str, region: str = config.DEFAULT_REGION) -> Optional[Dict[str, Any]]:
+async def get_active_game(puuid: str, region: str = config.DEFAULT_REGION, use_cache: bool = True,
+                          deadline: Optional[float] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch current active game for a summoner.
     
     Args:
         puuid: The player's PUUID
         region: Platform region code
+        use_cache: If False, bypass the response cache and fetch fresh data
+        deadline: Seconds the call may take (defaults to config.RIOT_REQUEST_DEADLINE)
         
     Returns:
         Dictionary containing active game data or None if not in game
@@ -231,19 +1066,91 @@ async def get_active_game(puuid: str, region: str = config.DEFAULT_REGION) -> Op
     
     # Use the new PUUID-based spectator v5 endpoint
     url = f"{platform_url}/lol/spectator/v5/active-games/by-summoner/{puuid}"
-    headers = {"X-Riot-Token": config.RIOT_API_KEY}
     
-    try:
-        return await _make_request(url, headers)
-    except RiotAPIError as e:
-        if "not found" in str(e).lower() or "404" in str(e):
-            return None  # Player is not in an active game
-        raise
+    # A 404 means the player is not in an active game: returned as None without raising
+    return await _make_request(url, "spectator-v5.active-game", deadline=deadline, use_cache=use_cache,
+                               allow_not_found=True)
+
+
+async def load_champion_catalog(force_refresh: bool = False):
+    """
+    Load the champion catalog for config.DDRAGON_VERSION into memory.
+    Uses the copy saved on disk when there is one, otherwise downloads
+    champion.json once and saves it.
+    
+    Args:
+        force_refresh: Download champion.json even if a copy is already loaded
+        
+    Raises:
+        RiotAPIError: If the download fails
+    """
+    version = config.DDRAGON_VERSION
+    if not force_refresh:
+        if champion_catalog.loaded and champion_catalog.version == version:
+            return
+        if await asyncio.to_thread(champion_catalog.load_from_disk, version):
+            print(f"[Champions] Loaded champion catalog {version} from disk")
+            return
+    
+    url = f"{config.DDRAGON_BASE_URL}/data/en_US/champion.json"
+    data = await _single_flight(_normalize_url(url), lambda: _fetch_champion_data(url))
+    champion_catalog.set(version, data)
+    await asyncio.to_thread(champion_catalog.save_to_disk)
+    print(f"[Champions] Downloaded champion catalog {version} ({len(data.get('data', {}))} champions)")
+
+
+def get_champion_catalog() -> ChampionCatalog:
+    """
+    Get the in-memory champion catalog without touching the network.
+    If it has not been loaded yet, a background load is started and the
+    (empty) catalog is returned straight away.
+    
+    Returns:
+        The process-wide ChampionCatalog
+    """
+    if not champion_catalog.loaded:
+        _start_background_catalog_load()
+    return champion_catalog
+
+
+async def get_loaded_champion_catalog() -> ChampionCatalog:
+    """
+    Get the champion catalog, loading it first if it isn't loaded yet
+    (e.g. the startup load failed). Concurrent callers share one load.
+    
+    Returns:
+        The process-wide ChampionCatalog, loaded
+        
+    Raises:
+        RiotAPIError: If the catalog can't be loaded
+    """
+    if not champion_catalog.loaded:
+        _start_background_catalog_load()
+        # Shielded so one caller giving up doesn't cancel the load for the others
+        await asyncio.shield(_catalog_load_task)
+    return champion_catalog
+
+
+def _start_background_catalog_load():
+    """Start loading the champion catalog in the background if not already loading."""
+    global _catalog_load_task
+    if _catalog_load_task is None or _catalog_load_task.done():
+        _catalog_load_task = asyncio.ensure_future(load_champion_catalog())
+        _catalog_load_task.add_done_callback(_report_catalog_load)
+
+
+def _report_catalog_load(task: asyncio.Task):
+    """Log a failed background catalog load."""
+    if not task.cancelled() and task.exception():
+        print(f"[Champions] Failed to load champion catalog: {task.exception()}")
 
 
 async def get_champion_data() -> Dict[str, Any]:
     """
     Fetch champion static data from Data Dragon.
+    Served from the in-memory champion catalog; only the first call for a
+    Data Dragon version (with no copy on disk) goes to the network. While
+    Data Dragon's circuit is open, an older loaded version is served instead.
     
     Returns:
         Dictionary containing all champion data
@@ -251,17 +1158,40 @@ async def get_champion_data() -> Dict[str, Any]:
     Raises:
         RiotAPIError: If the request fails
     """
-    url = f"{config.DDRAGON_BASE_URL}/data/en_US/champion.json"
-    
-    async with aiohttp.ClientSession() as session:
+    if not champion_catalog.loaded or champion_catalog.version != config.DDRAGON_VERSION:
         try:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    raise RiotAPIError(f"Failed to fetch champion data: {response.status}")
-        except aiohttp.ClientError as e:
-            raise RiotAPIError(f"Network error fetching champion data: {str(e)}")
+            await load_champion_catalog()
+        except CircuitOpenError:
+            if not champion_catalog.loaded:
+                raise
+            stale_served["ddragon.champions"] = stale_served.get("ddragon.champions", 0) + 1
+    return champion_catalog.data
+
+
+async def _fetch_champion_data(url: str) -> Dict[str, Any]:
+    """Download champion.json from Data Dragon (failing fast while its circuit is open)."""
+    host = urlsplit(url).netloc
+    _check_circuit(host, "ddragon")
+    session = await _get_session()
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        async with session.get(url) as response:
+            outcome = str(response.status)
+            if response.status == 200:
+                return json_codec.loads(await response.read())
+            else:
+                raise RiotAPIError(f"Failed to fetch champion data: {response.status}")
+    except aiohttp.ClientError as e:
+        outcome = "network_error"
+        raise RiotAPIError(f"Network error fetching champion data: {str(e)}")
+    except asyncio.TimeoutError:
+        outcome = "timeout"
+        raise RiotAPIError("Timed out fetching champion data")
+    finally:
+        request_latency.observe(time.perf_counter() - started, "ddragon.champions")
+        request_count.inc("ddragon.champions", outcome)
+        _record_circuit(host, "ddragon", outcome)
 
 
 def get_champion_name_by_id(champion_id: int, champion_data: Dict[str, Any]) -> str:
@@ -275,6 +1205,9 @@ def get_champion_name_by_id(champion_id: int, champion_data: Dict[str, Any]) ->
     Returns:
         Champion name or "Unknown Champion"
     """
+    if champion_data is champion_catalog.data:
+        return champion_catalog.get_name(champion_id)
+    
     for champ_name, champ_info in champion_data.get("data", {}).items():
         if int(champ_info.get("key", -1)) == champion_id:
             return champ_info.get("name", "Unknown Champion")
@@ -284,6 +1217,7 @@ def get_champion_name_by_id(champion_id: int, champion_data: Dict[str, Any]) ->
 async def get_clash_tournaments(region: str = config.DEFAULT_REGION) -> List[Dict[str, Any]]:
     """
     Fetch upcoming Clash tournament data.
+    Answered from the stale-while-revalidate cache (see config.SWR_TTLS).
     
     Args:
         region: Region code (e.g., 'na1', 'euw1')
@@ -292,14 +1226,19 @@ async def get_clash_tournaments(region: str = config.DEFAULT_REGION) -> List[Dic
         List of clash tournaments
         
     Raises:
-        RiotAPIError: If the request fails
+        RiotAPIError: If the request fails and no usable copy is cached
     """
-    platform_url = config.RIOT_REGIONS.get(region.lower())
+    platform_url = config.PLATFORM_ROUTING.get(region.lower())
     if not platform_url:
         raise RiotAPIError(f"Invalid region: {region}")
     
     url = f"{platform_url}/lol/clash/v1/tournaments"
-    headers = {"X-Riot-Token": config.RIOT_API_KEY}
     
-    return await _make_request(url, headers) or []
+    soft_ttl, hard_ttl = config.SWR_TTLS["clash-v1.tournaments"]
+    tournaments = await swr_cache.get(
+        f"clash-{region.lower()}",
+        lambda: _make_request(url, "clash-v1.tournaments", use_cache=False),
+        soft_ttl, hard_ttl
+    )
+    return tournaments or []
 
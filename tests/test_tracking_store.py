@@ -0,0 +1,130 @@
+"""
+Tests for the SQLite tracking store: importing the old tracked_users.json,
+writing changes behind and reading them back after a restart.
+"""
+
+import asyncio
+import json
+
+from utils.tracking_store import TrackingStore
+
+GUILD_ID = 111
+PLAYER = {
+    "puuid": "puuid-a",
+    "game_name": "Faker",
+    "tag_line": "KR1",
+    "region": "kr",
+    "thread_id": 222,
+    "tracked_at": "2024-01-01T00:00:00",
+    "tracked_by": 333,
+    "last_match_id": "KR_1",
+    "is_in_game": False,
+    "last_rank": {"tier": "GOLD", "rank": "II", "lp": 40},
+    "duo_partners": {"puuid-b": {"name": "Duo#EUW", "count": 3}},
+}
+
+
+def _write_legacy_json(path):
+    path.write_text(json.dumps({
+        "guilds": {str(GUILD_ID): {"tracking_channel_id": 444, "tracked_players": [PLAYER]}}
+    }))
+
+
+def _open(tmp_path) -> TrackingStore:
+    store = TrackingStore(str(tmp_path / "tracking.sqlite3"), str(tmp_path / "tracked_users.json"), flush_delay=60)
+    store.load()
+    return store
+
+
+def test_migrates_legacy_json(tmp_path):
+    _write_legacy_json(tmp_path / "tracked_users.json")
+
+    async def check():
+        store = _open(tmp_path)
+        try:
+            guild = store.guilds[str(GUILD_ID)]
+            assert guild["tracking_channel_id"] == 444
+            [player] = guild["tracked_players"]
+            assert player["puuid"] == "puuid-a"
+            assert player["last_match_id"] == "KR_1"
+            assert player["last_rank"] == PLAYER["last_rank"]
+            assert await store.get_channel(GUILD_ID) == 444
+            assert (await store.find_player_by_riot_id(GUILD_ID, "faker", "#kr1"))["id"] == player["id"]
+            assert await store.add_duo_games(player, [("puuid-b", "Duo#EUW")]) == {"puuid-b": 4}
+        finally:
+            await store.close()
+
+    asyncio.run(check())
+    assert not (tmp_path / "tracked_users.json").exists()
+    assert (tmp_path / "tracked_users.json.migrated").exists()
+
+
+def test_changes_survive_restart(tmp_path):
+    _write_legacy_json(tmp_path / "tracked_users.json")
+
+    async def change():
+        store = _open(tmp_path)
+        await store.set_channel(GUILD_ID, 555)
+        added = await store.add_player({**PLAYER, "guild_id": GUILD_ID, "puuid": "puuid-c", "game_name": "Other", "thread_id": 666})
+
+        [player, _] = store.guilds[str(GUILD_ID)]["tracked_players"]
+        player["prev_last_rank"] = player["last_rank"]
+        player["last_rank"] = {"tier": "GOLD", "rank": "I", "lp": 10}
+        player["last_match_id"] = "KR_2"
+        player["is_in_game"] = True
+        store.mark_player_dirty(player)
+        store.record_rank(player, "GOLD", "I", 10)
+        await store.add_duo_games(player, [("puuid-b", "Duo#EUW"), ("puuid-d", "New#EUW")])
+        assert store.dirty
+
+        await store.flush()
+        assert not store.dirty
+        await store.close()
+        return player["id"], added["id"]
+
+    player_id, added_id = asyncio.run(change())
+
+    async def reopen():
+        store = _open(tmp_path)
+        try:
+            assert await store.get_channel(GUILD_ID) == 555
+            assert await store.count_players(GUILD_ID) == 2
+            player = await store.find_player(GUILD_ID, "puuid-a")
+            assert player["id"] == player_id
+            assert player["last_match_id"] == "KR_2"
+            assert player["is_in_game"] is True
+            assert player["last_rank"] == {"tier": "GOLD", "rank": "I", "lp": 10}
+            assert player["prev_last_rank"] == PLAYER["last_rank"]
+            assert (await store.find_player(GUILD_ID, "puuid-c"))["id"] == added_id
+            counts = await store.add_duo_games(player, [("puuid-b", "Duo#EUW"), ("puuid-d", "New#EUW")])
+            assert counts == {"puuid-b": 5, "puuid-d": 2}
+            snapshots = store._query("SELECT tier, rank, lp FROM rank_snapshots WHERE player_id = ? ORDER BY id",
+                                     (player_id,))
+            assert snapshots == [("GOLD", "II", 40), ("GOLD", "I", 10)]
+        finally:
+            await store.close()
+
+    asyncio.run(reopen())
+    # Already migrated: the renamed file is left alone
+    assert (tmp_path / "tracked_users.json.migrated").exists()
+
+
+def test_close_writes_pending_changes(tmp_path):
+    async def change():
+        store = _open(tmp_path)
+        player = await store.add_player({**PLAYER, "guild_id": GUILD_ID})
+        player["last_match_id"] = "KR_9"
+        store.mark_player_dirty(player)
+        # The delayed flush is still waiting (flush_delay=60), so only close() can write this
+        await store.close()
+
+    asyncio.run(change())
+
+    async def reopen():
+        store = _open(tmp_path)
+        try:
+            assert (await store.find_player(GUILD_ID, "puuid-a"))["last_match_id"] == "KR_9"
+        finally:
+            await store.close()
+
+    asyncio.run(reopen())
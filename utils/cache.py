@@ -0,0 +1,98 @@
+"""
+In-memory TTL cache with LRU eviction, used for Riot API responses.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded cache where every entry has its own time-to-live.
+
+    Entries are kept in least-recently-used order; once max_size is reached
+    the oldest entry is evicted to make room.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (True, value) on a hit, (False, None) on a miss or expired entry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        """
+        Store a value for `ttl` seconds, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds (values <= 0 are not stored)
+        """
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove every entry (statistics are kept)."""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions,
+            expirations and hit_ratio (None before the first lookup)
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+        }
@@ -0,0 +1,205 @@
+"""
+Process-wide Data Dragon champion catalog.
+
+champion.json only changes with a new patch, so it is downloaded once per
+Data Dragon version, kept in memory for every command, and saved to disk
+(one file per version) so restarts don't need to download it again.
+Lookup indexes (by numeric id, internal key, normalized name and tag) are
+rebuilt whenever the catalog contents change.
+"""
+
+import difflib
+import os
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional
+
+from utils import json_codec
+
+
+def normalize_champion_name(name: str) -> str:
+    """
+    Fold a champion name for lookups: lowercase, keep only letters and digits.
+    "Lee Sin", "leesin" and "LEE-SIN" all become "leesin"; "Kai'Sa" becomes "kaisa".
+
+    Args:
+        name: Champion name as typed or as shown in Data Dragon
+
+    Returns:
+        Normalized name
+    """
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
+class ChampionCatalog:
+    """In-memory champion.json for one Data Dragon version, persisted to disk."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self.version: Optional[str] = None
+        self.data: Dict[str, Any] = {}
+        self.by_id: Dict[int, Dict[str, Any]] = {}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.by_tag: Dict[str, List[Dict[str, Any]]] = {}
+        self._sorted_names: List[str] = []
+
+    @property
+    def loaded(self) -> bool:
+        """True once champion data has been loaded."""
+        return bool(self.data)
+
+    def _path(self, version: str) -> str:
+        """File used to persist the catalog for a Data Dragon version."""
+        return os.path.join(self.cache_dir, f"champion_{version}.json")
+
+    def set(self, version: str, data: Dict[str, Any]):
+        """
+        Replace the catalog contents.
+
+        Args:
+            version: Data Dragon version the data belongs to
+            data: Parsed champion.json
+        """
+        self.version = version
+        self.data = data
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Build the id, name and tag indexes from the raw champion data."""
+        by_id = {}
+        by_name = {}
+        by_tag = {}
+
+        for champ_key, champ_info in self.data.get("data", {}).items():
+            try:
+                by_id[int(champ_info.get("key", -1))] = champ_info
+            except (TypeError, ValueError):
+                continue
+
+            # Index the display name and the internal key ("Wukong" and "MonkeyKing")
+            by_name[normalize_champion_name(champ_key)] = champ_info
+            by_name[normalize_champion_name(champ_info.get("name", ""))] = champ_info
+
+            for tag in champ_info.get("tags", []):
+                by_tag.setdefault(tag.lower(), []).append(champ_info)
+
+        self.by_id = by_id
+        self.by_name = by_name
+        self.by_tag = by_tag
+        self._sorted_names = sorted(by_name)
+
+    def get(self, champion_id: int) -> Optional[Dict[str, Any]]:
+        """Get a champion's Data Dragon entry by numeric ID, or None."""
+        return self.by_id.get(champion_id)
+
+    def get_name(self, champion_id: int) -> str:
+        """
+        Get a champion's display name by numeric ID.
+
+        Args:
+            champion_id: The champion's ID number
+
+        Returns:
+            Champion name or "Unknown Champion"
+        """
+        champ_info = self.by_id.get(champion_id)
+        return champ_info.get("name", "Unknown Champion") if champ_info else "Unknown Champion"
+
+    def get_key(self, champion_id: int) -> Optional[str]:
+        """Get a champion's internal key (used in image and build URLs, e.g. "MonkeyKing") by numeric ID."""
+        champ_info = self.by_id.get(champion_id)
+        return champ_info.get("id") if champ_info else None
+
+    def find(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a champion by name, ignoring case, spaces and punctuation.
+
+        Args:
+            name: Champion name as typed (e.g. "lee sin", "LeeSin", "kaisa")
+
+        Returns:
+            The champion's Data Dragon entry, or None if no champion matches
+        """
+        return self.by_name.get(normalize_champion_name(name))
+
+    def suggest(self, query: str, limit: int = 25) -> List[Dict[str, Any]]:
+        """
+        Suggest champions for a partially typed name (used by autocomplete).
+        Prefix matches come first, in alphabetical order; if there are none,
+        close fuzzy matches are returned instead so typos still find a champion.
+
+        Args:
+            query: What the user has typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            Up to `limit` champion entries
+        """
+        normalized = normalize_champion_name(query)
+        suggestions = []
+        seen = set()
+
+        def add(name: str):
+            champ_info = self.by_name[name]
+            if id(champ_info) not in seen:
+                seen.add(id(champ_info))
+                suggestions.append(champ_info)
+
+        # Prefix matches: a contiguous run in the sorted name list
+        start = bisect_left(self._sorted_names, normalized)
+        for name in self._sorted_names[start:]:
+            if not name.startswith(normalized) or len(suggestions) >= limit:
+                break
+            add(name)
+
+        if not suggestions and normalized:
+            for name in difflib.get_close_matches(normalized, self._sorted_names, n=limit, cutoff=0.6):
+                add(name)
+
+        return suggestions
+
+    def with_tag(self, tag: str) -> List[Dict[str, Any]]:
+        """Get every champion with a Data Dragon tag/role (e.g. "Mage", "tank")."""
+        return self.by_tag.get(tag.lower(), [])
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Get every champion's Data Dragon entry."""
+        return list(self.by_id.values())
+
+    def load_from_disk(self, version: str) -> bool:
+        """
+        Load the persisted catalog for a version.
+
+        Args:
+            version: Data Dragon version to load
+
+        Returns:
+            True if a valid copy was found and loaded
+        """
+        path = self._path(version)
+        if not os.path.exists(path):
+            return False
+
+        try:
+            with open(path, "rb") as f:
+                data = json_codec.loads(f.read())
+        except (OSError, ValueError) as e:
+            print(f"[Champions] Ignoring unreadable catalog file {path}: {e}")
+            return False
+
+        if not data.get("data"):
+            return False
+
+        self.set(version, data)
+        return True
+
+    def save_to_disk(self):
+        """Persist the current catalog (written to a temp file, then renamed into place)."""
+        if not self.loaded:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(self.version)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(json_codec.dumps(self.data))
+        os.replace(temp_path, path)
@@ -0,0 +1,138 @@
+"""
+Circuit breakers for Riot and Data Dragon hosts.
+
+A breaker counts consecutive outage-type failures (5xx, timeouts, network
+errors). Once the threshold is reached it opens and calls fail fast instead
+of each waiting on a timeout. After the recovery timeout it goes half-open
+and lets a single probe request through: a success closes it again, a
+failure reopens it.
+
+    closed --(threshold failures)--> open --(recovery timeout)--> half_open
+    half_open --(probe succeeds)--> closed
+    half_open --(probe fails)--> open
+"""
+
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Numeric state for the metrics endpoint
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    """Breaker for one host and endpoint family."""
+
+    def __init__(self, host: str, family: str, failure_threshold: int, recovery_timeout: float,
+                 on_transition: Optional[Callable[["CircuitBreaker", str, str], None]] = None):
+        self.host = host
+        self.family = family
+        self.name = f"{host} {family}"
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_transition = on_transition
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.next_probe_at = 0.0
+        self.rejected = 0
+
+    def _transition(self, state: str):
+        """Change state, log it and notify the listener."""
+        old = self.state
+        self.state = state
+        print(f"[Circuit] {self.name}: {old} -> {state}")
+        if self.on_transition:
+            self.on_transition(self, old, state)
+
+    def allow(self) -> bool:
+        """
+        Whether a request may be sent now.
+
+        Returns:
+            True when closed, or for the one probe allowed while half-open;
+            False (and counted as rejected) otherwise
+        """
+        if self.state == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if self.state == OPEN:
+            if now < self.opened_at + self.recovery_timeout:
+                self.rejected += 1
+                return False
+            self._transition(HALF_OPEN)
+            self.next_probe_at = now
+
+        if now >= self.next_probe_at:
+            # A probe that never reports back (e.g. cancelled) only delays the next one
+            self.next_probe_at = now + self.recovery_timeout
+            return True
+        self.rejected += 1
+        return False
+
+    def retry_in(self) -> float:
+        """Seconds until the breaker will let a request through (0 if it would now)."""
+        now = time.monotonic()
+        if self.state == OPEN:
+            return max(0.0, self.opened_at + self.recovery_timeout - now)
+        if self.state == HALF_OPEN:
+            return max(0.0, self.next_probe_at - now)
+        return 0.0
+
+    def record_success(self):
+        """The host answered: reset the failure count and close the breaker."""
+        self.failures = 0
+        if self.state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self):
+        """The host failed (5xx, timeout or network error)."""
+        self.failures += 1
+        if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+            self.opened_at = time.monotonic()
+            self._transition(OPEN)
+
+
+class CircuitBreakers:
+    """Creates a CircuitBreaker per (host, endpoint family) on first use."""
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float,
+                 on_transition: Optional[Callable[[CircuitBreaker, str, str], None]] = None):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_transition = on_transition
+        self.breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+
+    def get(self, host: str, family: str) -> CircuitBreaker:
+        """
+        Get the breaker for a host and endpoint family.
+
+        Args:
+            host: Routing host (e.g. "euw1.api.riotgames.com")
+            family: Endpoint family (e.g. "league-v4")
+
+        Returns:
+            The breaker, created closed if it didn't exist
+        """
+        breaker = self.breakers.get((host, family))
+        if breaker is None:
+            breaker = self.breakers[(host, family)] = CircuitBreaker(
+                host, family, self.failure_threshold, self.recovery_timeout, self.on_transition
+            )
+        return breaker
+
+    def stats(self) -> Dict[Tuple[str, str], Dict[str, object]]:
+        """
+        Get the state of every breaker.
+
+        Returns:
+            Dictionary keyed by (host, family) with state, failures and rejected
+        """
+        return {
+            key: {"state": breaker.state, "failures": breaker.failures, "rejected": breaker.rejected}
+            for key, breaker in self.breakers.items()
+        }
@@ -3,9 +3,10 @@ Helper functions for formatting data and creating Discord embeds.
 """
 
 import discord
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import config
+import riot_api
 
 
 def format_rank(rank_data: Dict[str, Any]) -> str:
@@ -288,3 +289,21 @@ def get_region_choices() -> list:
     
     return [discord.app_commands.Choice(name=name, value=value) for name, value in regions]
 
+
+async def champion_autocomplete(interaction: discord.Interaction, current: str) -> List[discord.app_commands.Choice[str]]:
+    """
+    Autocomplete callback for champion name parameters.
+    Answered from the in-memory champion index, so it never waits on the network.
+    
+    Args:
+        interaction: Discord interaction
+        current: What the user has typed so far
+        
+    Returns:
+        Up to 25 champion name choices
+    """
+    champions = riot_api.get_champion_catalog()
+    return [
+        discord.app_commands.Choice(name=champ_info["name"], value=champ_info["name"])
+        for champ_info in champions.suggest(current, limit=25)
+    ]
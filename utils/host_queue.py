@@ -0,0 +1,129 @@
+"""
+Per-routing-host request queues for the Riot API.
+
+Every routing host (eun1, europe, sea, ...) gets its own FIFO queue and a
+fixed set of workers that send its requests. A slow host only ties up its
+own workers, so requests to other hosts keep flowing at their normal
+latency. Callers reserve their rate limit slot (per host and method, see
+RateLimiter) before joining the queue, so workers only ever wait on the
+network: an endpoint out of budget doesn't hold up other endpoints on the
+same host.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+class HostQueue:
+    """One host's queue and workers."""
+
+    def __init__(self, host: str, workers: int):
+        self.host = host
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.active = 0
+        self.completed = 0
+        self.wait_seconds = 0.0
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(workers)]
+
+    async def _work(self):
+        """Run queued jobs one at a time, handing each result to its caller."""
+        while True:
+            job, future, queued_at = await self.queue.get()
+            try:
+                if future.done():
+                    continue  # The caller gave up while the job was queued
+                self.wait_seconds += time.monotonic() - queued_at
+                self.active += 1
+                try:
+                    result = await job()
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+                finally:
+                    self.active -= 1
+                    self.completed += 1
+            finally:
+                self.queue.task_done()
+
+    async def run(self, job: Callable[[], Awaitable[Any]]) -> Any:
+        """Queue a job and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((job, future, time.monotonic()))
+        return await future
+
+    async def close(self):
+        """Stop the workers; callers of jobs still queued get CancelledError."""
+        while not self.queue.empty():
+            _, future, _ = self.queue.get_nowait()
+            future.cancel()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+class HostScheduler:
+    """Creates a HostQueue per routing host on first use."""
+
+    def __init__(self, workers: int, workers_by_host: Optional[Dict[str, int]] = None):
+        self.default_workers = workers
+        self.workers_by_host = workers_by_host or {}
+        self.queues: Dict[str, HostQueue] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _queue(self, host: str) -> HostQueue:
+        """Get (or start) the queue for a host."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Workers belong to the loop that started them (tests and benchmarks may run several)
+            self._loop = loop
+            self.queues = {}
+        if host not in self.queues:
+            self.queues[host] = HostQueue(host, self.workers_by_host.get(host, self.default_workers))
+        return self.queues[host]
+
+    async def run(self, host: str, job: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a request on the host's workers.
+
+        Args:
+            host: Routing host the request goes to
+            job: Zero-argument callable returning the coroutine to run
+
+        Returns:
+            The job's result (its exception is re-raised in the caller)
+        """
+        return await self._queue(host).run(job)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-host queue stats.
+
+        Returns:
+            Dictionary keyed by host with queued, active, workers, completed and wait_seconds
+        """
+        return {
+            host: {
+                "queued": queue.queue.qsize(),
+                "active": queue.active,
+                "workers": queue.workers,
+                "completed": queue.completed,
+                "wait_seconds": queue.wait_seconds,
+            }
+            for host, queue in self.queues.items()
+        }
+
+    async def close(self):
+        """Stop every host's workers."""
+        if self._loop is asyncio.get_running_loop():
+            for queue in self.queues.values():
+                await queue.close()
+        self.queues = {}
+        self._loop = None
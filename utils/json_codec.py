@@ -0,0 +1,49 @@
+"""
+Pluggable JSON codec.
+
+Uses orjson when it is installed (much faster on large match-v5 payloads)
+and falls back to the standard library json module otherwise. Both paths
+work on bytes and write compact JSON (no pretty-printing).
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+
+# Name of the codec in use ("orjson" or "json")
+NAME = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        The parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a value to compact UTF-8 JSON.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
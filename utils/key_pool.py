@@ -0,0 +1,127 @@
+"""
+Pool of Riot API keys, each with its own rate limit state.
+
+Riot enforces rate limits per key, so every key gets a separate
+RateLimiter. Each request goes to the usable key that can send soonest
+(ties broken by the most free room in its windows), which spreads load
+evenly and lets throughput grow with the number of keys. A key that gets
+a 403 is taken out of rotation for a while, then tried again (the last
+usable key is never disabled, so one bad endpoint can't stop every call).
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+from utils.rate_limiter import RateLimiter
+
+
+class ApiKey:
+    """One API key with its rate limiter and health counters."""
+
+    def __init__(self, name: str, token: str, default_app_limits: str):
+        self.name = name
+        self.token = token
+        self.limiter = RateLimiter(default_app_limits)
+        self.disabled_until = 0.0
+        self.disabled_reason: Optional[str] = None
+        self.requests = 0
+        self.forbidden = 0
+
+    def enabled(self, now: float) -> bool:
+        """Whether the key may be used (disabled keys come back once their time is up)."""
+        return now >= self.disabled_until
+
+
+class KeyPool:
+    """Chooses a key per request and tracks per-key health."""
+
+    def __init__(self, tokens: List[str], default_app_limits: str = ""):
+        self.keys = [ApiKey(f"key{i + 1}", token, default_app_limits) for i, token in enumerate(tokens)]
+
+    def _enabled_keys(self) -> List[ApiKey]:
+        now = time.monotonic()
+        return [key for key in self.keys if key.enabled(now)]
+
+    def available(self) -> bool:
+        """Whether at least one key is currently usable."""
+        return bool(self._enabled_keys())
+
+    def choose(self, host: str, method: str) -> Optional[ApiKey]:
+        """
+        Pick the key for a request to (host, method).
+
+        Args:
+            host: Routing host
+            method: Endpoint name
+
+        Returns:
+            The usable key that can send soonest, preferring the most
+            headroom; None if every key is disabled
+        """
+        best = None
+        best_rank: Tuple[float, float] = (0.0, 0.0)
+        for key in self._enabled_keys():
+            rank = (key.limiter.wait_time(host, method), -key.limiter.headroom(host, method))
+            if best is None or rank < best_rank:
+                best, best_rank = key, rank
+        return best
+
+    def wait_time(self, host: str, method: str) -> float:
+        """Seconds until any usable key could send a request to (host, method)."""
+        return min((key.limiter.wait_time(host, method) for key in self._enabled_keys()), default=0.0)
+
+    def disable(self, key: ApiKey, reason: str, seconds: float) -> bool:
+        """
+        Take a key out of rotation, unless it is the only usable key left.
+
+        Args:
+            key: The key to disable
+            reason: Why (shown in logs and stats)
+            seconds: How long before the key is tried again
+
+        Returns:
+            True if the key was disabled
+        """
+        if self._enabled_keys() == [key]:
+            return False
+        key.disabled_until = time.monotonic() + seconds
+        key.disabled_reason = reason
+        print(f"[Riot API] Disabled {key.name} for {seconds:.0f}s: {reason}")
+        return True
+
+    @property
+    def total_wait(self) -> float:
+        """Seconds spent waiting for rate limiters, across all keys."""
+        return sum(key.limiter.total_wait for key in self.keys)
+
+    @property
+    def throttled_requests(self) -> int:
+        """Requests that had to wait for a rate limiter, across all keys."""
+        return sum(key.limiter.throttled_requests for key in self.keys)
+
+    def usage(self) -> List[Tuple[str, str, str, int, int, int]]:
+        """
+        Current usage of every known rate limit bucket.
+
+        Returns:
+            (key name, host, method or "application", window seconds, requests used, limit) tuples
+        """
+        return [(key.name, *row) for key in self.keys for row in key.limiter.usage()]
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """
+        Get per-key health.
+
+        Returns:
+            Dictionary keyed by key name with enabled, disabled_reason, requests and forbidden
+        """
+        now = time.monotonic()
+        return {
+            key.name: {
+                "enabled": key.enabled(now),
+                "disabled_reason": None if key.enabled(now) else key.disabled_reason,
+                "requests": key.requests,
+                "forbidden": key.forbidden,
+            }
+            for key in self.keys
+        }
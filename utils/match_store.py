@@ -0,0 +1,143 @@
+"""
+Persistent on-disk store for finished match-v5 details.
+
+Match details never change once a game has ended, so each match is fetched
+once, stored zlib-compressed in a SQLite file keyed by its match ID, and
+served from disk from then on (including after a restart). When the file
+grows past its size budget, the least recently read matches are evicted.
+Read times are kept in memory and written with the next store (or on
+close), so reads never commit.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+from utils import json_codec
+
+
+class MatchStore:
+    """SQLite-backed, size-bounded store of compressed match JSON."""
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self._pending_access: Dict[str, float] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the table if needed."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS matches ("
+                " match_id TEXT PRIMARY KEY,"
+                " data BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_matches_last_access ON matches (last_access)")
+            self._conn.commit()
+            row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM matches").fetchone()
+            self._total_bytes = row[0]
+        return self._conn
+
+    def get(self, match_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a stored match.
+
+        Args:
+            match_id: The match ID (e.g. "EUN1_1234567890")
+
+        Returns:
+            The match details dictionary, or None if the match is not stored
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT data FROM matches WHERE match_id = ?", (match_id,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._pending_access[match_id] = time.time()
+            self.hits += 1
+        return json_codec.loads(zlib.decompress(row[0]))
+
+    def put(self, match_id: str, match_data: Dict[str, Any]):
+        """
+        Store a match (no-op if it is already stored), then evict old matches if over budget.
+
+        Args:
+            match_id: The match ID
+            match_data: Match details from match-v5
+        """
+        blob = zlib.compress(json_codec.dumps(match_data))
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO matches (match_id, data, size, last_access) VALUES (?, ?, ?, ?)",
+                (match_id, blob, len(blob), time.time())
+            )
+            self._write_access_times()
+            if cursor.rowcount:
+                self._total_bytes += len(blob)
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+            conn.commit()
+
+    def _write_access_times(self):
+        """Write the read times collected since the last store (in the caller's transaction)."""
+        if self._pending_access:
+            self._conn.executemany(
+                "UPDATE matches SET last_access = ? WHERE match_id = ?",
+                [(accessed, match_id) for match_id, accessed in self._pending_access.items()]
+            )
+            self._pending_access = {}
+
+    def _evict(self):
+        """Delete least recently read matches until the store is at 90% of its budget."""
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT match_id, size FROM matches ORDER BY last_access").fetchall()
+        for match_id, size in rows:
+            if self._total_bytes <= target:
+                break
+            self._conn.execute("DELETE FROM matches WHERE match_id = ?", (match_id,))
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with stored bytes, budget, hits, misses and evictions
+        """
+        return {
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def close(self):
+        """Write pending read times and close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._write_access_times()
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
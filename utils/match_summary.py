@@ -0,0 +1,122 @@
+"""
+Compact, read-only view of a match-v5 response.
+
+A full match-v5 document is tens of kilobytes, mostly per-participant stats
+and challenges the bot never shows. MatchSummary keeps only the fields the
+commands and the tracker render, in slotted objects, with a PUUID index so
+looking up a player doesn't scan the participant list.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ParticipantSummary:
+    """One player's result in a match."""
+
+    __slots__ = (
+        "puuid", "game_name", "tag_line", "champion_id", "team_id",
+        "kills", "deaths", "assists", "win",
+    )
+
+    def __init__(self, puuid: str, game_name: str, tag_line: str, champion_id: int, team_id: int,
+                 kills: int, deaths: int, assists: int, win: bool):
+        self.puuid = puuid
+        self.game_name = game_name
+        self.tag_line = tag_line
+        self.champion_id = champion_id
+        self.team_id = team_id
+        self.kills = kills
+        self.deaths = deaths
+        self.assists = assists
+        self.win = win
+
+    @classmethod
+    def from_json(cls, participant: Dict[str, Any]) -> "ParticipantSummary":
+        """
+        Build a summary from one entry of match-v5 info.participants.
+
+        Args:
+            participant: Participant dictionary from match-v5
+
+        Returns:
+            The participant summary
+        """
+        return cls(
+            puuid=participant["puuid"],
+            game_name=participant.get("riotIdGameName") or "Unknown",
+            # match-v5 spells it "riotIdTagline"; accept the other casing too
+            tag_line=participant.get("riotIdTagline") or participant.get("riotIdTagLine") or "????",
+            champion_id=participant["championId"],
+            team_id=participant["teamId"],
+            kills=participant["kills"],
+            deaths=participant["deaths"],
+            assists=participant["assists"],
+            win=participant["win"],
+        )
+
+    @property
+    def riot_id(self) -> str:
+        """The player's Riot ID as "gameName#tagLine"."""
+        return f"{self.game_name}#{self.tag_line}"
+
+
+class MatchSummary:
+    """The parts of a finished match the bot displays."""
+
+    __slots__ = ("match_id", "queue_id", "duration", "end_timestamp", "participants", "_by_puuid")
+
+    def __init__(self, match_id: str, queue_id: int, duration: int, end_timestamp: int,
+                 participants: Tuple[ParticipantSummary, ...]):
+        self.match_id = match_id
+        self.queue_id = queue_id
+        self.duration = duration
+        self.end_timestamp = end_timestamp
+        self.participants = participants
+        self._by_puuid = {p.puuid: p for p in participants}
+
+    @classmethod
+    def from_json(cls, match_data: Dict[str, Any]) -> "MatchSummary":
+        """
+        Build a summary from a match-v5 response.
+
+        Args:
+            match_data: Match details from match-v5
+
+        Returns:
+            The match summary
+        """
+        info = match_data["info"]
+        return cls(
+            match_id=match_data.get("metadata", {}).get("matchId", ""),
+            queue_id=info.get("queueId", 0),
+            duration=info.get("gameDuration", 0),
+            end_timestamp=info.get("gameEndTimestamp", 0),
+            participants=tuple(ParticipantSummary.from_json(p) for p in info["participants"]),
+        )
+
+    def participant(self, puuid: str) -> Optional[ParticipantSummary]:
+        """
+        Find a player in the match.
+
+        Args:
+            puuid: The player's PUUID
+
+        Returns:
+            The player's summary, or None if they weren't in this match
+        """
+        return self._by_puuid.get(puuid)
+
+    def teammates(self, puuid: str) -> List[ParticipantSummary]:
+        """
+        List the other players on the given player's team.
+
+        Args:
+            puuid: The player's PUUID
+
+        Returns:
+            Teammates (excluding the player), or an empty list if they weren't in this match
+        """
+        player = self._by_puuid.get(puuid)
+        if player is None:
+            return []
+        return [p for p in self.participants if p.team_id == player.team_id and p.puuid != puuid]
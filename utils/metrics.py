@@ -0,0 +1,221 @@
+"""
+In-process metrics (counters, histograms, gauges) with a Prometheus text endpoint.
+
+Metrics are registered once at import time by the modules that own them
+(riot_api, bot.py) and rendered on demand in the Prometheus exposition
+format. Gauges are read through a callback at scrape time, so values that
+already live elsewhere (rate limit buckets, cache counters) aren't copied.
+"""
+
+import bisect
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from aiohttp import web
+
+# Latency buckets in seconds (Riot calls, Discord commands, monitor cycles)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value) -> str:
+    """Escape a label value (backslash, double quote, newline)."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Labels, extra: str = "") -> str:
+    """Render {name="value",...} (empty string if there are no labels)."""
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value (integers without a trailing .0)."""
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        """Add `amount` to the counter for the given label values."""
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in sorted(self.values.items())]
+
+
+class Histogram:
+    """Distribution of observed values (e.g. latencies) in fixed buckets, per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+1 for +Inf), sum, count]
+        self._series: Dict[Labels, list] = {}
+
+    def observe(self, value: float, *labels: str):
+        """Record one value for the given label values."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def label_sets(self) -> List[Labels]:
+        """Every label combination observed so far."""
+        return list(self._series)
+
+    def count(self, *labels: str) -> int:
+        """Number of observations for the given label values."""
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def mean(self, *labels: str) -> Optional[float]:
+        """Average observed value, or None if nothing was observed."""
+        series = self._series.get(labels)
+        return series[1] / series[2] if series and series[2] else None
+
+    def quantile(self, q: float, *labels: str) -> Optional[float]:
+        """
+        Estimate a quantile by interpolating inside the bucket that contains it.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95)
+            labels: Label values
+
+        Returns:
+            The estimate (capped at the largest bucket bound), or None if nothing was observed
+        """
+        series = self._series.get(labels)
+        if not series or not series[2]:
+            return None
+        rank = q * series[2]
+        seen = 0
+        for i, bucket_count in enumerate(series[0]):
+            if seen + bucket_count >= rank and bucket_count:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def render(self) -> List[str]:
+        lines = []
+        for labels, (bucket_counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(list(self.buckets) + ["+Inf"], bucket_counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound == "+Inf" else f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class CallbackMetric:
+    """Gauge (or counter kept elsewhere) whose samples are read from a callback at scrape time."""
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str],
+                 collect: Callable[[], Dict[Labels, float]], kind: str = "gauge"):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self.collect = collect
+        self.kind = kind
+
+    def render(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+                for labels, value in sorted(self.collect().items())]
+
+
+class Registry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self.metrics: Dict[str, object] = {}
+
+    def _add(self, metric):
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, description: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Register a counter."""
+        return self._add(Counter(name, description, labelnames))
+
+    def histogram(self, name: str, description: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Register a histogram."""
+        return self._add(Histogram(name, description, labelnames, buckets))
+
+    def callback(self, name: str, description: str, labelnames: Sequence[str],
+                 collect: Callable[[], Dict[Labels, float]], kind: str = "gauge") -> CallbackMetric:
+        """Register a metric read from `collect()` at scrape time ({label values: value})."""
+        return self._add(CallbackMetric(name, description, labelnames, collect, kind))
+
+    def get(self, name: str):
+        """Look up a registered metric by name (None if it isn't registered)."""
+        return self.metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.metrics.values():
+            try:
+                samples = metric.render()
+            except Exception as e:
+                print(f"[Metrics] Failed to collect {metric.name}: {e}")
+                continue
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry used by the bot
+registry = Registry()
+
+
+async def start_server(host: str, port: int) -> web.AppRunner:
+    """
+    Serve the registry on http://host:port/metrics.
+
+    Args:
+        host: Interface to bind (keep it on 127.0.0.1 unless a scraper needs remote access)
+        port: TCP port
+
+    Returns:
+        The runner; call cleanup() on it to stop the server
+    """
+    async def handle(request: web.Request) -> web.Response:
+        return web.Response(text=registry.render(), content_type="text/plain", charset="utf-8",
+                            headers={"Cache-Control": "no-store"})
+
+    app = web.Application()
+    app.router.add_get("/metrics", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
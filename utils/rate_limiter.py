@@ -0,0 +1,329 @@
+"""
+Header-driven rate limiter for the Riot API.
+
+Riot enforces an application limit per routing host and a method limit per
+host and endpoint, and reports both on every response:
+
+    X-App-Rate-Limit: 20:1,100:120          (limit:window_seconds, ...)
+    X-App-Rate-Limit-Count: 3:1,41:120      (used:window_seconds, ...)
+    X-Method-Rate-Limit / X-Method-Rate-Limit-Count (same format)
+
+The limiter keeps a sliding-window bucket for every (limit, window) pair and
+makes callers wait until every bucket that applies to their request has room.
+Riot counts a request when it arrives, so a reserved slot counts as in
+flight until the answer comes back and is only then timestamped: the
+window expires after Riot's, never before it.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+
+def parse_rate_limit_header(value: Optional[str]) -> List[Tuple[int, int]]:
+    """
+    Parse a Riot rate limit header into (number, window_seconds) pairs.
+
+    Args:
+        value: Header value such as "20:1,100:120"
+
+    Returns:
+        List of (number, window_seconds) tuples, empty if the header is missing or malformed
+    """
+    pairs = []
+    if not value:
+        return pairs
+
+    for part in value.split(","):
+        try:
+            number, window = part.strip().split(":")
+            pairs.append((int(number), int(window)))
+        except ValueError:
+            continue
+    return pairs
+
+
+class RateLimitWaitExceeded(Exception):
+    """
+    No slot frees up within the time the caller is willing to wait.
+    
+    Attributes:
+        retry_after: Seconds until a slot is expected to be free
+    """
+    
+    def __init__(self, retry_after: float):
+        super().__init__(f"No rate limit slot free for {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class Reservation:
+    """
+    A slot reserved by RateLimiter.acquire(), in flight until completed or
+    cancelled. The sender sets `sent` once the request goes out; until then
+    cancel() gives the slot back (e.g. the caller gave up while it was queued).
+    """
+
+    def __init__(self, buckets: List["SlidingWindowBucket"]):
+        self.buckets = buckets
+        self.sent = False
+        self.done = False
+
+
+class SlidingWindowBucket:
+    """Allows at most `limit` requests in any `window` second period."""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.timestamps = deque()
+        self.in_flight = 0
+        self.blocked_until = 0.0
+
+    def _expire(self, now: float):
+        """Drop timestamps that have left the window."""
+        while self.timestamps and self.timestamps[0] <= now - self.window:
+            self.timestamps.popleft()
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until this bucket can accept another request (0 if it can now)."""
+        self._expire(now)
+        wait = max(0.0, self.blocked_until - now)
+        # Requests to expire before one more fits (in-flight ones only start their window when answered)
+        excess = self.used - self.limit
+        if excess >= 0:
+            if excess < len(self.timestamps):
+                wait = max(wait, self.timestamps[excess] + self.window - now)
+            else:
+                wait = max(wait, self.window)
+        return wait
+
+    @property
+    def used(self) -> int:
+        """Requests counted in the current window, including those in flight."""
+        return len(self.timestamps) + self.in_flight
+
+    def record(self, now: float):
+        """Record a request answered at `now`."""
+        self.timestamps.append(now)
+
+    def sync_count(self, count: int, now: float):
+        """
+        Catch up with the count Riot reports for this window.
+        Requests made before a restart (or by another process using the
+        same key) are only visible through the -Count headers.
+        """
+        self._expire(now)
+        # Riot may already have counted requests that are still in flight here
+        missing = min(count, self.limit) - self.used
+        for _ in range(missing):
+            self.timestamps.append(now)
+
+    def block(self, until: float):
+        """Refuse requests until the given monotonic time."""
+        self.blocked_until = max(self.blocked_until, until)
+
+
+class RateLimiter:
+    """
+    Per-host application buckets plus per-(host, method) method buckets.
+
+    acquire() waits until a request fits in every applicable bucket and
+    reserves the slot; update() re-reads the limits and counts from the
+    response headers.
+    """
+
+    def __init__(self, default_app_limits: str = ""):
+        self.default_app_limits = parse_rate_limit_header(default_app_limits)
+        self.app_buckets: Dict[str, Dict[Tuple[int, int], SlidingWindowBucket]] = {}
+        self.method_buckets: Dict[Tuple[str, str], Dict[Tuple[int, int], SlidingWindowBucket]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self.total_wait = 0.0
+        self.throttled_requests = 0
+
+    def _get_app_buckets(self, host: str) -> Dict[Tuple[int, int], SlidingWindowBucket]:
+        """Get (or create from the configured defaults) the app buckets for a host."""
+        if host not in self.app_buckets:
+            self.app_buckets[host] = {
+                (limit, window): SlidingWindowBucket(limit, window)
+                for limit, window in self.default_app_limits
+            }
+        return self.app_buckets[host]
+
+    def _buckets_for(self, host: str, method: str) -> List[SlidingWindowBucket]:
+        """All buckets a request to (host, method) has to fit in."""
+        buckets = list(self._get_app_buckets(host).values())
+        buckets.extend(self.method_buckets.get((host, method), {}).values())
+        return buckets
+
+    def wait_time(self, host: str, method: str) -> float:
+        """Seconds until a request to (host, method) could be sent, without reserving it."""
+        now = time.monotonic()
+        return max((bucket.wait_time(now) for bucket in self._buckets_for(host, method)), default=0.0)
+
+    def headroom(self, host: str, method: str) -> float:
+        """Smallest free fraction across the buckets for (host, method) (1.0 if none are known)."""
+        now = time.monotonic()
+        free = 1.0
+        for bucket in self._buckets_for(host, method):
+            bucket._expire(now)
+            if bucket.limit:
+                free = min(free, 1 - bucket.used / bucket.limit)
+        return max(free, 0.0)
+
+    async def acquire(self, host: str, method: str, max_wait: Optional[float] = None) -> Reservation:
+        """
+        Wait until a request to (host, method) is allowed and reserve its slot.
+        Callers for the same host and method queue in arrival order. The slot
+        must then be passed to complete() once answered, or to cancel() if the
+        request is never sent.
+
+        Args:
+            host: Routing host
+            method: Endpoint name
+            max_wait: Longest time to wait, including the queue of earlier
+                      callers (None waits as long as it takes)
+
+        Returns:
+            The reservation
+
+        Raises:
+            RateLimitWaitExceeded: If no slot would be free within max_wait
+                                   (nothing is reserved)
+        """
+        key = (host, method)
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        lock = self._locks[key]
+
+        give_up_at = None
+        if max_wait is None:
+            await lock.acquire()
+        else:
+            give_up_at = time.monotonic() + max_wait
+            try:
+                await asyncio.wait_for(lock.acquire(), max(max_wait, 0))
+            except asyncio.TimeoutError:
+                raise RateLimitWaitExceeded(self.wait_time(host, method))
+
+        try:
+            throttled = False
+            while True:
+                now = time.monotonic()
+                buckets = self._buckets_for(host, method)
+                wait = max((bucket.wait_time(now) for bucket in buckets), default=0.0)
+                if wait <= 0:
+                    for bucket in buckets:
+                        bucket.in_flight += 1
+                    return Reservation(buckets)
+                if give_up_at is not None and now + wait > give_up_at:
+                    # Don't sleep towards a slot the caller can't use anyway
+                    raise RateLimitWaitExceeded(wait)
+
+                if not throttled:
+                    throttled = True
+                    self.throttled_requests += 1
+                self.total_wait += wait
+                await asyncio.sleep(wait)
+        finally:
+            lock.release()
+
+    def complete(self, reservation: Reservation):
+        """Timestamp a reserved slot now that its request was answered (or failed in transit)."""
+        if reservation.done:
+            return
+        reservation.done = True
+        now = time.monotonic()
+        for bucket in reservation.buckets:
+            bucket.in_flight -= 1
+            bucket.record(now)
+
+    def cancel(self, reservation: Reservation):
+        """Give back a reserved slot whose request was never sent (no-op once sent)."""
+        if reservation.done or reservation.sent:
+            return
+        reservation.done = True
+        for bucket in reservation.buckets:
+            bucket.in_flight -= 1
+
+    @staticmethod
+    def _apply_limits(buckets: Dict[Tuple[int, int], SlidingWindowBucket],
+                      limits_header: Optional[str], count_header: Optional[str], now: float):
+        """Reconcile a bucket set with a limit header and its -Count header."""
+        limits = parse_rate_limit_header(limits_header)
+        if limits:
+            wanted = set(limits)
+            for key in list(buckets):
+                if key not in wanted:
+                    del buckets[key]
+            for limit, window in limits:
+                if (limit, window) not in buckets:
+                    buckets[(limit, window)] = SlidingWindowBucket(limit, window)
+
+        counts = dict((window, count) for count, window in parse_rate_limit_header(count_header))
+        for (limit, window), bucket in buckets.items():
+            if window in counts:
+                bucket.sync_count(counts[window], now)
+
+    def update(self, host: str, method: str, headers):
+        """
+        Update limits and usage counts from a Riot response's headers.
+
+        Args:
+            host: Routing host the request went to
+            method: Endpoint name the request used
+            headers: Response headers (any mapping with .get())
+        """
+        now = time.monotonic()
+        self._apply_limits(
+            self._get_app_buckets(host),
+            headers.get("X-App-Rate-Limit"), headers.get("X-App-Rate-Limit-Count"), now
+        )
+        if headers.get("X-Method-Rate-Limit"):
+            method_buckets = self.method_buckets.setdefault((host, method), {})
+            self._apply_limits(
+                method_buckets,
+                headers.get("X-Method-Rate-Limit"), headers.get("X-Method-Rate-Limit-Count"), now
+            )
+
+    def usage(self) -> List[Tuple[str, str, int, int, int]]:
+        """
+        Current usage of every known bucket.
+
+        Returns:
+            (host, method or "application", window seconds, requests used, limit) tuples
+        """
+        now = time.monotonic()
+        rows = []
+        for host, buckets in self.app_buckets.items():
+            for (limit, window), bucket in buckets.items():
+                bucket._expire(now)
+                rows.append((host, "application", window, bucket.used, limit))
+        for (host, method), buckets in self.method_buckets.items():
+            for (limit, window), bucket in buckets.items():
+                bucket._expire(now)
+                rows.append((host, method, window, bucket.used, limit))
+        return rows
+
+    def penalize(self, host: str, method: str, retry_after: float, limit_type: Optional[str] = None):
+        """
+        Block a host (application limit) or a host/method pair after a 429.
+
+        Args:
+            host: Routing host that returned the 429
+            method: Endpoint name that returned the 429
+            retry_after: Seconds to wait, from the Retry-After header
+            limit_type: Value of X-Rate-Limit-Type ("application", "method" or "service")
+        """
+        until = time.monotonic() + retry_after
+        if limit_type == "application":
+            buckets = self._get_app_buckets(host).values()
+        else:
+            buckets = self.method_buckets.setdefault((host, method), {}).values()
+            if not buckets:
+                # No method limits known yet, so hold the method back with a 1-slot bucket
+                bucket = SlidingWindowBucket(1, 1)
+                self.method_buckets[(host, method)][(1, 1)] = bucket
+                buckets = [bucket]
+        for bucket in buckets:
+            bucket.block(until)
@@ -0,0 +1,127 @@
+"""
+Persistent Riot ID -> account/summoner resolution cache.
+
+Resolving "gameName#tagLine" costs an account-v1 and a summoner-v4 call,
+but PUUIDs never change and Riot IDs rarely do. Resolutions are stored in
+SQLite keyed by the normalized Riot ID and region, together with the time
+they were last confirmed, so the caller can revalidate old entries.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from utils import json_codec
+
+
+def normalize_riot_id(game_name: str, tag_line: str, region: str) -> str:
+    """
+    Build the cache key for a Riot ID (Riot IDs are case-insensitive).
+
+    Args:
+        game_name: The player's in-game name
+        tag_line: The player's tag (without #)
+        region: Platform region code
+
+    Returns:
+        Key such as "faker#kr1@kr"
+    """
+    return f"{game_name.strip().casefold()}#{tag_line.strip().lstrip('#').casefold()}@{region.lower()}"
+
+
+class RiotIdCache:
+    """SQLite-backed store of resolved Riot IDs."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the table if needed."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS riot_ids ("
+                " riot_id TEXT PRIMARY KEY,"
+                " puuid TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " resolved_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_riot_ids_puuid ON riot_ids (puuid)")
+            self._conn.commit()
+        return self._conn
+
+    def get(self, riot_id: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Look up a resolved Riot ID.
+
+        Args:
+            riot_id: Key from normalize_riot_id()
+
+        Returns:
+            (summoner data, resolved_at unix time), or None if not cached
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT data, resolved_at FROM riot_ids WHERE riot_id = ?", (riot_id,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json_codec.loads(row[0]), row[1]
+
+    def put(self, riot_id: str, summoner_data: Dict[str, Any]):
+        """
+        Store a resolution. Any other Riot ID that pointed at the same PUUID
+        in the same region is dropped, since that player has been renamed.
+
+        Args:
+            riot_id: Key from normalize_riot_id()
+            summoner_data: Combined account + summoner data (must contain "puuid")
+        """
+        puuid = summoner_data["puuid"]
+        region_suffix = riot_id[riot_id.rindex("@"):]
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "DELETE FROM riot_ids WHERE puuid = ? AND riot_id != ? AND riot_id LIKE ?",
+                (puuid, riot_id, f"%{region_suffix}")
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO riot_ids (riot_id, puuid, data, resolved_at) VALUES (?, ?, ?, ?)",
+                (riot_id, puuid, json_codec.dumps(summoner_data).decode("utf-8"), time.time())
+            )
+            conn.commit()
+
+    def delete(self, riot_id: str):
+        """Forget a Riot ID (e.g. it no longer exists)."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM riot_ids WHERE riot_id = ?", (riot_id,))
+            conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits and misses
+        """
+        return {"hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,139 @@
+"""
+Stale-while-revalidate store for slow-changing Riot data (free rotation, Clash).
+
+Each value is kept with the wall-clock time it was fetched. Younger than its
+soft TTL it is served as is; between the soft and hard TTL it is still served
+straight away while one background refresh fetches a new copy; past the hard
+TTL (or if there is none) the caller waits for the fetch. The last good copy
+of every key is saved to disk, so a restarted bot answers from it at once.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from utils import json_codec
+
+
+class SWRCache:
+    """Keyed values with soft/hard TTLs, persisted one file per key."""
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._checked_disk: Set[str] = set()
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def _path(self, key: str) -> str:
+        """File used to persist a key."""
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Read a key's last good copy from disk (None if missing or unreadable)."""
+        try:
+            with open(self._path(key), "rb") as f:
+                stored = json_codec.loads(f.read())
+            return float(stored["fetched_at"]), stored["value"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _save(self, key: str, entry: Tuple[float, Any]):
+        """Persist a key (written to a temp file, then renamed into place)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(json_codec.dumps({"fetched_at": entry[0], "value": entry[1]}))
+        os.replace(temp_path, path)
+
+    async def get(self, key: str, fetch: Callable[[], Awaitable[Any]],
+                  soft_ttl: float, hard_ttl: float) -> Any:
+        """
+        Get a value, refreshing it in the background once past its soft TTL.
+
+        Args:
+            key: Cache key (also the file name on disk, e.g. "rotation-euw1")
+            fetch: Zero-argument callable returning a coroutine that fetches a fresh value
+            soft_ttl: Seconds after which the value is refreshed in the background
+            hard_ttl: Seconds after which the value is no longer served
+
+        Returns:
+            The cached or freshly fetched value (shared, treat it as read-only)
+
+        Raises:
+            Whatever fetch() raises, when there is no value young enough to serve
+        """
+        entry = self._entries.get(key)
+        if entry is None and key not in self._checked_disk:
+            self._checked_disk.add(key)
+            entry = await asyncio.to_thread(self._load, key)
+            if entry is not None:
+                self._entries.setdefault(key, entry)
+                entry = self._entries[key]
+
+        if entry is not None:
+            fetched_at, value = entry
+            age = time.time() - fetched_at
+            if age < soft_ttl:
+                self.hits += 1
+                return value
+            if age < hard_ttl:
+                self.stale_hits += 1
+                self._refresh(key, fetch)
+                return value
+
+        self.misses += 1
+        # Shield so one caller giving up doesn't cancel the refresh for the others
+        return await asyncio.shield(self._refresh(key, fetch))
+
+    def _refresh(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Start a refresh for a key unless one is already running."""
+        task = self._refreshes.get(key)
+        if task is None or task.done():
+            self.refreshes += 1
+            task = asyncio.ensure_future(self._revalidate(key, fetch))
+            task.add_done_callback(lambda t: self._report_refresh(key, t))
+            self._refreshes[key] = task
+        return task
+
+    async def _revalidate(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Fetch a fresh value, keep it and save it to disk."""
+        value = await fetch()
+        entry = (time.time(), value)
+        self._entries[key] = entry
+        try:
+            await asyncio.to_thread(self._save, key, entry)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[SWR] Could not save {key}: {e}")
+        return value
+
+    def _report_refresh(self, key: str, task: asyncio.Task):
+        """Count and log a failed refresh."""
+        if self._refreshes.get(key) is task:
+            del self._refreshes[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.refresh_failures += 1
+            print(f"[SWR] Refresh of {key} failed: {task.exception()}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits (fresh and stale), stale_hits, misses,
+            refreshes and refresh_failures
+        """
+        return {
+            "size": len(self._entries),
+            "hits": self.hits + self.stale_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+        }
@@ -0,0 +1,493 @@
+"""
+Process-wide store for the stalking configuration, backed by SQLite.
+
+Tables:
+    guilds            one row per guild (stalking channel)
+    tracked_players   one row per stalked player per guild, with the monitor's
+                      state (last match, in game, last ranks); indexed by
+                      guild_id, puuid, thread_id and (guild_id, Riot ID)
+    duo_partners      games played together, per player and teammate
+    rank_snapshots    Solo/Duo rank history, one row per observed change
+
+Guild and player changes made by commands (/stalk set/add/remove) are
+written straight away. The monitor's per-player state lives in memory and
+is written behind: changed players, new rank snapshots and duo games are
+collected and flushed together in one transaction a few seconds after the
+first change. Every write runs in a worker thread, off the event loop. On first
+start, an existing tracked_users.json is imported and renamed.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import config
+from utils import json_codec
+
+# Player fields the monitor changes (written behind)
+STATE_FIELDS = ("last_match_id", "is_in_game", "last_rank", "prev_last_rank")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS guilds (
+    guild_id INTEGER PRIMARY KEY,
+    tracking_channel_id INTEGER
+);
+CREATE TABLE IF NOT EXISTS tracked_players (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    guild_id INTEGER NOT NULL,
+    puuid TEXT NOT NULL,
+    game_name TEXT NOT NULL,
+    tag_line TEXT NOT NULL,
+    riot_id_key TEXT NOT NULL,
+    region TEXT NOT NULL,
+    thread_id INTEGER NOT NULL,
+    tracked_at TEXT,
+    tracked_by INTEGER,
+    last_match_id TEXT,
+    is_in_game INTEGER NOT NULL DEFAULT 0,
+    last_rank TEXT,
+    prev_last_rank TEXT,
+    UNIQUE (guild_id, puuid)
+);
+CREATE INDEX IF NOT EXISTS idx_tracked_players_guild ON tracked_players (guild_id);
+CREATE INDEX IF NOT EXISTS idx_tracked_players_puuid ON tracked_players (puuid);
+CREATE INDEX IF NOT EXISTS idx_tracked_players_thread ON tracked_players (thread_id);
+CREATE INDEX IF NOT EXISTS idx_tracked_players_riot_id ON tracked_players (guild_id, riot_id_key);
+CREATE TABLE IF NOT EXISTS duo_partners (
+    player_id INTEGER NOT NULL,
+    partner_puuid TEXT NOT NULL,
+    name TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (player_id, partner_puuid)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rank_snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    player_id INTEGER NOT NULL,
+    tier TEXT NOT NULL,
+    rank TEXT NOT NULL,
+    lp INTEGER NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rank_snapshots_player ON rank_snapshots (player_id, recorded_at);
+"""
+
+_PLAYER_COLUMNS = (
+    "id, guild_id, puuid, game_name, tag_line, region, thread_id, tracked_at, tracked_by,"
+    " last_match_id, is_in_game, last_rank, prev_last_rank"
+)
+
+
+def riot_id_key(game_name: str, tag_line: str) -> str:
+    """Case-insensitive key used to find a player by Riot ID within a guild."""
+    return f"{game_name.strip().casefold()}#{tag_line.strip().lstrip('#').casefold()}"
+
+
+def _encode(value: Any) -> Optional[str]:
+    """Store a dict column (ranks) as JSON text."""
+    return None if value is None else json_codec.dumps(value).decode("utf-8")
+
+
+def _player_from_row(row: tuple) -> Dict[str, Any]:
+    """Build the player dictionary used by the commands and the monitor from a row."""
+    player = {
+        "id": row[0],
+        "guild_id": row[1],
+        "puuid": row[2],
+        "game_name": row[3],
+        "tag_line": row[4],
+        "region": row[5],
+        "thread_id": row[6],
+        "tracked_at": row[7],
+        "tracked_by": row[8],
+        "last_match_id": row[9],
+        "is_in_game": bool(row[10]),
+    }
+    if row[11] is not None:
+        player["last_rank"] = json_codec.loads(row[11])
+    if row[12] is not None:
+        player["prev_last_rank"] = json_codec.loads(row[12])
+    return player
+
+
+def player_state(player: Dict[str, Any]) -> tuple:
+    """The monitor-owned part of a player, to tell whether a check changed it."""
+    return tuple(player.get(field) for field in STATE_FIELDS)
+
+
+class TrackingStore:
+    """SQLite-backed tracking data with an in-memory copy for the monitor loop."""
+
+    def __init__(self, path: str, legacy_json_path: Optional[str], flush_delay: float):
+        self.path = path
+        self.legacy_json_path = legacy_json_path
+        self.flush_delay = flush_delay
+        self.data: Optional[Dict[str, Any]] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._write_lock: Optional[asyncio.Lock] = None
+        self._dirty_players: Dict[int, Dict[str, Any]] = {}
+        self._pending_ranks: List[Tuple[int, str, str, int, float]] = []
+        self._pending_duos: Dict[Tuple[int, str], Tuple[str, int]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.flushes = 0
+        self.rows_written = 0
+        self.bytes_written = 0
+
+    # ---------- Database ----------
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and create the tables if needed."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def _migrate_json(self, conn: sqlite3.Connection):
+        """Import tracked_users.json into an empty database, then rename the file."""
+        if not self.legacy_json_path or not os.path.exists(self.legacy_json_path):
+            return
+        if conn.execute("SELECT 1 FROM guilds LIMIT 1").fetchone():
+            return
+
+        with open(self.legacy_json_path, "rb") as f:
+            data = json_codec.loads(f.read())
+        guilds = data.get("guilds", {}) if isinstance(data, dict) else {}
+
+        players = 0
+        with conn:
+            for guild_id_str, guild_data in guilds.items():
+                guild_id = int(guild_id_str)
+                conn.execute("INSERT OR REPLACE INTO guilds (guild_id, tracking_channel_id) VALUES (?, ?)",
+                             (guild_id, guild_data.get("tracking_channel_id")))
+                for player in guild_data.get("tracked_players", []):
+                    cursor = conn.execute(
+                        "INSERT OR IGNORE INTO tracked_players (guild_id, puuid, game_name, tag_line, riot_id_key,"
+                        " region, thread_id, tracked_at, tracked_by, last_match_id, is_in_game, last_rank,"
+                        " prev_last_rank) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (guild_id, player["puuid"], player["game_name"], player["tag_line"],
+                         riot_id_key(player["game_name"], player["tag_line"]), player["region"],
+                         player["thread_id"], player.get("tracked_at"), player.get("tracked_by"),
+                         player.get("last_match_id"), int(bool(player.get("is_in_game"))),
+                         _encode(player.get("last_rank")), _encode(player.get("prev_last_rank")))
+                    )
+                    if not cursor.rowcount:
+                        continue
+                    players += 1
+                    player_id = cursor.lastrowid
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO duo_partners (player_id, partner_puuid, name, count)"
+                        " VALUES (?, ?, ?, ?)",
+                        [(player_id, partner, info.get("name", ""), info.get("count", 0))
+                         for partner, info in player.get("duo_partners", {}).items()]
+                    )
+                    rank = player.get("last_rank")
+                    if rank:
+                        conn.execute(
+                            "INSERT INTO rank_snapshots (player_id, tier, rank, lp, recorded_at) VALUES (?, ?, ?, ?, ?)",
+                            (player_id, rank.get("tier", ""), rank.get("rank", ""), rank.get("lp", 0), time.time())
+                        )
+
+        os.replace(self.legacy_json_path, f"{self.legacy_json_path}.migrated")
+        print(f"[Tracking] Migrated {len(guilds)} guild(s) and {players} player(s) from {self.legacy_json_path}")
+
+    def load(self):
+        """Open the database, migrate the old JSON file and load every guild into memory (first call only)."""
+        if self.data is not None:
+            return
+
+        with self._lock:
+            conn = self._connect()
+            self._migrate_json(conn)
+            guilds = {
+                str(guild_id): {"tracking_channel_id": channel_id, "tracked_players": []}
+                for guild_id, channel_id in conn.execute("SELECT guild_id, tracking_channel_id FROM guilds")
+            }
+            for row in conn.execute(f"SELECT {_PLAYER_COLUMNS} FROM tracked_players ORDER BY id"):
+                guild = guilds.setdefault(str(row[1]), {"tracking_channel_id": None, "tracked_players": []})
+                guild["tracked_players"].append(_player_from_row(row))
+        self.data = {"guilds": guilds}
+
+    @property
+    def guilds(self) -> Dict[str, Dict[str, Any]]:
+        """In-memory guild data keyed by guild ID (as a string), used by the monitor loop."""
+        self.load()
+        return self.data["guilds"]
+
+    def _memory_guild(self, guild_id: int) -> Dict[str, Any]:
+        """Get (or create) a guild's in-memory entry."""
+        return self.guilds.setdefault(str(guild_id), {"tracking_channel_id": None, "tracked_players": []})
+
+    def _get_write_lock(self) -> asyncio.Lock:
+        """Lock serializing writes (created on first use, inside the event loop)."""
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        return self._write_lock
+
+    async def _write(self, function, *args):
+        """Run a database write in a worker thread, after any flush already in progress."""
+        async with self._get_write_lock():
+            return await asyncio.to_thread(function, *args)
+
+    # ---------- Indexed queries used by the commands ----------
+
+    def _query(self, sql: str, params: tuple) -> List[tuple]:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    async def get_channel(self, guild_id: int) -> Optional[int]:
+        """The guild's stalking channel ID, or None if not set."""
+        rows = await asyncio.to_thread(
+            self._query, "SELECT tracking_channel_id FROM guilds WHERE guild_id = ?", (guild_id,)
+        )
+        return rows[0][0] if rows else None
+
+    async def count_players(self, guild_id: int) -> int:
+        """Number of players stalked in a guild."""
+        rows = await asyncio.to_thread(
+            self._query, "SELECT COUNT(*) FROM tracked_players WHERE guild_id = ?", (guild_id,)
+        )
+        return rows[0][0]
+
+    async def list_players(self, guild_id: int) -> List[Dict[str, Any]]:
+        """Players stalked in a guild, in the order they were added."""
+        rows = await asyncio.to_thread(
+            self._query, f"SELECT {_PLAYER_COLUMNS} FROM tracked_players WHERE guild_id = ? ORDER BY id", (guild_id,)
+        )
+        return [_player_from_row(row) for row in rows]
+
+    async def find_player(self, guild_id: int, puuid: str) -> Optional[Dict[str, Any]]:
+        """A guild's stalked player by PUUID, or None."""
+        rows = await asyncio.to_thread(
+            self._query, f"SELECT {_PLAYER_COLUMNS} FROM tracked_players WHERE guild_id = ? AND puuid = ?",
+            (guild_id, puuid)
+        )
+        return _player_from_row(rows[0]) if rows else None
+
+    async def find_player_by_riot_id(self, guild_id: int, game_name: str, tag_line: str) -> Optional[Dict[str, Any]]:
+        """A guild's stalked player by Riot ID (case-insensitive), or None."""
+        rows = await asyncio.to_thread(
+            self._query, f"SELECT {_PLAYER_COLUMNS} FROM tracked_players WHERE guild_id = ? AND riot_id_key = ?",
+            (guild_id, riot_id_key(game_name, tag_line))
+        )
+        return _player_from_row(rows[0]) if rows else None
+
+    # ---------- Writes made by the commands (immediate) ----------
+
+    def _set_channel_sync(self, guild_id: int, channel_id: Optional[int]):
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT INTO guilds (guild_id, tracking_channel_id) VALUES (?, ?)"
+                    " ON CONFLICT (guild_id) DO UPDATE SET tracking_channel_id = excluded.tracking_channel_id",
+                    (guild_id, channel_id)
+                )
+
+    async def set_channel(self, guild_id: int, channel_id: Optional[int]):
+        """
+        Set (or with None, unset) a guild's stalking channel.
+
+        Args:
+            guild_id: Discord guild ID
+            channel_id: Channel ID, or None to unset
+        """
+        await self._write(self._set_channel_sync, guild_id, channel_id)
+        self._memory_guild(guild_id)["tracking_channel_id"] = channel_id
+
+    def _add_player_sync(self, player: Dict[str, Any]) -> int:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT OR IGNORE INTO guilds (guild_id) VALUES (?)", (player["guild_id"],))
+                cursor = conn.execute(
+                    "INSERT INTO tracked_players (guild_id, puuid, game_name, tag_line, riot_id_key, region,"
+                    " thread_id, tracked_at, tracked_by) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (player["guild_id"], player["puuid"], player["game_name"], player["tag_line"],
+                     riot_id_key(player["game_name"], player["tag_line"]), player["region"],
+                     player["thread_id"], player.get("tracked_at"), player.get("tracked_by"))
+                )
+                return cursor.lastrowid
+
+    async def add_player(self, player: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Start stalking a player.
+
+        Args:
+            player: Player fields (guild_id, puuid, game_name, tag_line, region,
+                    thread_id, tracked_at, tracked_by)
+
+        Returns:
+            The stored player, with its "id" and empty monitor state
+
+        Raises:
+            sqlite3.IntegrityError: If the player is already stalked in that guild
+        """
+        player = {**player, "last_match_id": None, "is_in_game": False}
+        player["id"] = await self._write(self._add_player_sync, player)
+        self._memory_guild(player["guild_id"])["tracked_players"].append(player)
+        return player
+
+    def _remove_player_sync(self, player_id: int):
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM tracked_players WHERE id = ?", (player_id,))
+                conn.execute("DELETE FROM duo_partners WHERE player_id = ?", (player_id,))
+                conn.execute("DELETE FROM rank_snapshots WHERE player_id = ?", (player_id,))
+
+    async def remove_player(self, guild_id: int, player_id: int):
+        """
+        Stop stalking a player (their duo counts and rank history are deleted too).
+
+        Args:
+            guild_id: Discord guild ID
+            player_id: The player's "id"
+        """
+        self._dirty_players.pop(player_id, None)
+        self._pending_ranks = [snapshot for snapshot in self._pending_ranks if snapshot[0] != player_id]
+        self._pending_duos = {key: value for key, value in self._pending_duos.items() if key[0] != player_id}
+        await self._write(self._remove_player_sync, player_id)
+        guild = self._memory_guild(guild_id)
+        guild["tracked_players"] = [p for p in guild["tracked_players"] if p.get("id") != player_id]
+
+    # ---------- Duo partners ----------
+
+    async def add_duo_games(self, player: Dict[str, Any], partners: List[Tuple[str, str]]) -> Dict[str, int]:
+        """
+        Count one more game played with each teammate (written with the next flush).
+
+        Args:
+            player: The stalked player
+            partners: (teammate PUUID, Riot ID) pairs
+
+        Returns:
+            Games played together so far, keyed by teammate PUUID
+        """
+        if not partners:
+            return {}
+        placeholders = ",".join("?" * len(partners))
+        # Under the write lock so a flush can't move pending games to disk between the read and the sum
+        async with self._get_write_lock():
+            rows = await asyncio.to_thread(
+                self._query,
+                f"SELECT partner_puuid, count FROM duo_partners WHERE player_id = ? AND partner_puuid IN ({placeholders})",
+                (player["id"], *(puuid for puuid, _ in partners))
+            )
+            stored = dict(rows)
+            counts = {}
+            for puuid, name in partners:
+                key = (player["id"], puuid)
+                pending = self._pending_duos.get(key, (name, 0))[1] + 1
+                self._pending_duos[key] = (name, pending)
+                counts[puuid] = stored.get(puuid, 0) + pending
+        self._schedule_flush()
+        return counts
+
+    # ---------- Monitor state (written behind) ----------
+
+    def mark_player_dirty(self, player: Dict[str, Any]):
+        """Queue a player's monitor state for the next flush."""
+        self._dirty_players[player["id"]] = player
+        self._schedule_flush()
+
+    def record_rank(self, player: Dict[str, Any], tier: str, rank: str, lp: int):
+        """Queue a rank snapshot for the next flush."""
+        self._pending_ranks.append((player["id"], tier, rank, lp, time.time()))
+        self._schedule_flush()
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes that haven't been written yet."""
+        return bool(self._dirty_players or self._pending_ranks or self._pending_duos)
+
+    def _schedule_flush(self):
+        """Start the delayed flush unless one is already waiting (changes in the window share one write)."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self):
+        """Wait out the debounce delay, then flush."""
+        await asyncio.sleep(self.flush_delay)
+        try:
+            # Shielded so close() cancelling this task can't interrupt a write halfway
+            await asyncio.shield(self.flush())
+        except Exception as e:
+            print(f"[Tracking] Failed to save tracking data: {e}")
+        if self.dirty:
+            # Changed while writing (or the write failed): schedule another pass
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+    def _flush_sync(self, states: List[tuple], ranks: List[tuple], duos: List[tuple]):
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "UPDATE tracked_players SET last_match_id = ?, is_in_game = ?, last_rank = ?, prev_last_rank = ?"
+                    " WHERE id = ?",
+                    states
+                )
+                conn.executemany(
+                    "INSERT INTO rank_snapshots (player_id, tier, rank, lp, recorded_at) SELECT ?, ?, ?, ?, ?"
+                    " WHERE EXISTS (SELECT 1 FROM tracked_players WHERE id = ?)",
+                    [(*snapshot, snapshot[0]) for snapshot in ranks]
+                )
+                # Rows of players removed while their match was being checked are skipped
+                conn.executemany(
+                    "INSERT INTO duo_partners (player_id, partner_puuid, name, count) SELECT ?, ?, ?, ?"
+                    " WHERE EXISTS (SELECT 1 FROM tracked_players WHERE id = ?)"
+                    " ON CONFLICT (player_id, partner_puuid) DO UPDATE SET count = count + excluded.count,"
+                    " name = excluded.name",
+                    duos
+                )
+
+    async def flush(self):
+        """Write queued monitor state, rank snapshots and duo games now, in one transaction."""
+        async with self._get_write_lock():
+            if not self.dirty:
+                return
+            dirty, self._dirty_players = self._dirty_players, {}
+            ranks, self._pending_ranks = self._pending_ranks, []
+            pending_duos, self._pending_duos = self._pending_duos, {}
+            # Encoded here so the rows can't change while the thread writes them
+            states = [
+                (player.get("last_match_id"), int(bool(player.get("is_in_game"))),
+                 _encode(player.get("last_rank")), _encode(player.get("prev_last_rank")), player_id)
+                for player_id, player in dirty.items()
+            ]
+            duos = [(player_id, puuid, name, games, player_id)
+                    for (player_id, puuid), (name, games) in pending_duos.items()]
+            try:
+                await asyncio.to_thread(self._flush_sync, states, ranks, duos)
+            except Exception:
+                # Keep the changes for the next attempt (newer ones win)
+                self._dirty_players = {**dirty, **self._dirty_players}
+                self._pending_ranks = ranks + self._pending_ranks
+                self._pending_duos = pending_duos  # Nothing can be added while the lock is held
+                raise
+            self.flushes += 1
+            self.rows_written += len(states) + len(ranks) + len(duos)
+            self.bytes_written += sum(len(str(value)) for row in states + ranks + duos for value in row)
+
+    async def close(self):
+        """Cancel the pending delayed flush, write any remaining changes and close the database."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        self._flush_task = None
+        await self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+# Process-wide store shared by the stalk commands and the monitor loop
+store = TrackingStore(config.TRACKING_DB_FILE, config.TRACKING_DATA_FILE, config.TRACKING_FLUSH_DELAY)